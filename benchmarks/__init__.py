@@ -0,0 +1 @@
+# シミュレータ・リーダ・ユースケースの性能計測スイート（python -m benchmarks --help）
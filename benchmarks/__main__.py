@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+import tempfile
+import click
+from benchmarks.datasets import all_specs, spec_by_name
+from benchmarks.suite import DEFAULT_ANGLE_COUNTS, DEFAULT_SCALAR_ROWS, build_cases, compare_reports, run_case, to_report
+
+
+def parse_int_list(ctx, param, value):
+    if not value:
+        return None
+    try:
+        return [int(v) for v in value.split(',') if v.strip()]
+    except ValueError:
+        raise click.BadParameter(f"{param.name} must be a comma-separated list of integers")
+
+
+def describe(name, dataset, parameters) -> str:
+    label = f"{name} [{dataset or '-'}]"
+    return f"{label} {parameters}" if parameters else label
+
+
+@click.group()
+def cli():
+    """Benchmarks for the simulator, readers and use cases."""
+
+
+@cli.command()
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=None, help="Write the JSON results to this file (default: stdout).")
+@click.option('--dataset', 'datasets', multiple=True, type=click.Choice([s.name for s in all_specs()]), help="Synthetic dataset(s) to run. Defaults to all (1d/1y/10y at 10min/1min).")
+@click.option('--case', 'case_filter', default=None, help="Only run benchmarks whose name contains this text.")
+@click.option('--angle-counts', callback=parse_int_list, default=None, help="Comma-separated angle counts for the multiple-scenarios benchmark (default: 1,8,72,360).")
+@click.option('--scalar-rows', type=click.IntRange(min=1), default=DEFAULT_SCALAR_ROWS, show_default=True, help="Rows timed for per-reading APIs (calculate_instantaneous_power, _solve_for_rpm).")
+@click.option('--repeat', type=click.IntRange(min=1), default=3, show_default=True, help="Timing samples per benchmark; best and mean are reported.")
+@click.option('--data-dir', type=click.Path(file_okay=False), default=None, help="Directory for the generated wind CSVs, reused across runs (default: system temp dir).")
+def run(output, datasets, case_filter, angle_counts, scalar_rows, repeat, data_dir):
+    """Run the benchmarks and emit machine-readable JSON."""
+    specs = [spec_by_name(name) for name in datasets] if datasets else all_specs()
+    data_dir = data_dir or os.path.join(tempfile.gettempdir(), "wind-compass-benchmarks")
+    cases = build_cases(specs, data_dir, scalar_rows=scalar_rows,
+                        angle_counts=angle_counts or DEFAULT_ANGLE_COUNTS)
+    if case_filter:
+        cases = [c for c in cases if case_filter in c.name]
+    results = []
+    for case in cases:
+        result = run_case(case, repeat)
+        # 進捗は stderr に出し、stdout はJSONのみとする
+        click.echo(f"{describe(case.name, case.dataset, case.parameters)} "
+                   f"best={result.best_seconds:.6f}s", err=True)
+        results.append(result)
+    report = json.dumps(to_report(results, repeat, scalar_rows), indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(report + "\n")
+    else:
+        click.echo(report)
+
+
+@cli.command()
+@click.argument('base', type=click.Path(exists=True, dir_okay=False))
+@click.argument('head', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', type=click.FloatRange(min=1.0), default=1.2, show_default=True, help="Report a regression when head/base best time exceeds this ratio.")
+def compare(base, head, threshold):
+    """Compare two result files; exits with 1 if any benchmark regressed."""
+    with open(base) as f:
+        base_report = json.load(f)
+    with open(head) as f:
+        head_report = json.load(f)
+    regressed = False
+    for c in compare_reports(base_report, head_report):
+        marker = "REGRESSION" if c.ratio > threshold else ""
+        regressed = regressed or bool(marker)
+        click.echo(f"{describe(c.name, c.dataset, c.parameters)} "
+                   f"{c.base_seconds:.6f}s -> {c.head_seconds:.6f}s x{c.ratio:.2f} {marker}".rstrip())
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
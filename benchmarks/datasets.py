@@ -0,0 +1,85 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List
+import numpy
+import pandas as pd
+
+# 計測対象のデータ期間（日数）と観測間隔（分）
+SPANS_DAYS = {"1d": 1, "1y": 365, "10y": 3650}
+RESOLUTIONS_MIN = {"10min": 10, "1min": 1}
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+START = numpy.datetime64("2020-01-01T00:00:00")
+
+# 計測用の設備特性。有効風速 0〜25m/s で回転数の解が 0〜MAX_GENERATOR_RPM に収まる
+BENCHMARK_CONFIG = {
+    "turbine_power_curve": {"coeffs": [2.0, 0.0, 0.0, 0.0]},
+    "generator_torque_curve": {"coeffs": [0.0, 0.0, 5.0, 0.0]},
+    "generator_current_curve": {"coeffs": [0.0, 0.0, 10.0, 0.0]},
+}
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """合成風況データの仕様（期間と観測間隔）"""
+    span: str
+    resolution: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.span}-{self.resolution}"
+
+    @property
+    def rows(self) -> int:
+        return SPANS_DAYS[self.span] * 24 * 60 // RESOLUTIONS_MIN[self.resolution]
+
+
+def all_specs() -> List[DatasetSpec]:
+    return [DatasetSpec(span, resolution) for span in SPANS_DAYS for resolution in RESOLUTIONS_MIN]
+
+
+def spec_by_name(name: str) -> DatasetSpec:
+    for spec in all_specs():
+        if spec.name == name:
+            return spec
+    raise ValueError(f"Unknown dataset: {name}")
+
+
+def generate_columns(spec: DatasetSpec, seed: int = 0) -> Dict[str, numpy.ndarray]:
+    """
+    風速計データに似た合成データを返す。
+    風速はワイブル分布（0.1m/s刻み）、風向は卓越風向まわりの正規分布（1度刻み）とし、
+    同じ仕様・シードからは常に同じデータを生成する。
+    """
+    rng = numpy.random.default_rng(seed)
+    observed_at = START + numpy.arange(spec.rows) * \
+        numpy.timedelta64(RESOLUTIONS_MIN[spec.resolution], "m")
+    speeds = numpy.round(numpy.minimum(
+        6.0 * rng.weibull(2.0, spec.rows), 25.0), 1)
+    directions = numpy.round(rng.normal(225.0, 60.0, spec.rows)) % 360.0
+    return {
+        "observed_at": observed_at.astype("datetime64[ns]"),
+        "max_wind_speed_mps": speeds,
+        "max_wind_direction_deg": directions,
+    }
+
+
+def write_wind_csv(spec: DatasetSpec, data_dir: str, seed: int = 0) -> str:
+    """合成データをCSVに書き出してパスを返す。同名のファイルがあれば再利用する。"""
+    path = os.path.join(data_dir, f"wind-{spec.name}-seed{seed}.csv")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        df = pd.DataFrame(generate_columns(spec, seed))
+        tmp_path = path + ".tmp"
+        df.to_csv(tmp_path, index=False, date_format=TIMESTAMP_FORMAT)
+        os.replace(tmp_path, path)
+    return path
+
+
+def write_config_json(data_dir: str) -> str:
+    path = os.path.join(data_dir, "config.json")
+    os.makedirs(data_dir, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(BENCHMARK_CONFIG, f, indent=2)
+    return path
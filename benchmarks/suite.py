@@ -0,0 +1,291 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+import numpy
+import pandas as pd
+from wind_compass.adapters.data_readers import CsvWindDataReader, JsonConfigReader
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.angle_sweep import RunAngleSweepUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, SingleScenarioInputDTO
+from wind_compass.use_cases.histogram_scenarios import RunHistogramScenariosUseCase
+from wind_compass.use_cases.input_cache import InputCache
+from wind_compass.use_cases import run_single_scenario, simulation_use_cases
+from benchmarks.datasets import DatasetSpec, generate_columns, write_config_json, write_wind_csv
+
+# 結果JSONの形式のバージョン（キーを変えた場合に上げる）
+SCHEMA_VERSION = 1
+
+# 計測時のシミュレーションパラメータ。角度は合成データの卓越風向（大半の行で回転数を解く）
+TURBINE_ANGLE_DEG = 225.0
+EFFICIENCY = 0.9
+VOLTAGE = 100.0
+CUT_IN_RPM = 100.0
+
+DEFAULT_ANGLE_COUNTS = (1, 8, 72, 360)
+# 1行ずつ評価するAPIは、データの先頭からこの行数だけを計測する
+DEFAULT_SCALAR_ROWS = 10_000
+# 設定ファイルの読み込みは短いため、1回の計測でこの回数だけ呼び出す
+CONFIG_READS_PER_SAMPLE = 100
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    計測対象1件。setup は計測しない準備を行い、計測対象の呼び出しを返す。
+
+    Args:
+        name: 計測対象の名前（クラス名.メソッド名など）
+        dataset: 合成データ名（データに依存しない場合は None）
+        rows: 1回の呼び出しで処理する行数
+        setup: 計測ごとに呼ばれ、計測対象の呼び出しを返す
+        number: 1回の計測で呼び出す回数（結果は1回あたりの時間）
+        parameters: 名前・データ以外に結果を区別する条件
+    """
+    name: str
+    dataset: Optional[str]
+    rows: int
+    setup: Callable[[], Callable[[], object]]
+    number: int = 1
+    parameters: Dict[str, object] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """計測結果1件。seconds は呼び出し1回あたりの時間（計測回数分）"""
+    name: str
+    dataset: Optional[str]
+    rows: int
+    number: int
+    parameters: Dict[str, object]
+    seconds: List[float]
+
+    @property
+    def best_seconds(self) -> float:
+        return min(self.seconds)
+
+    @property
+    def mean_seconds(self) -> float:
+        return statistics.fmean(self.seconds)
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        if not self.rows or self.best_seconds <= 0:
+            return None
+        return self.rows / self.best_seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "dataset": self.dataset,
+            "rows": self.rows,
+            "number": self.number,
+            "parameters": self.parameters,
+            "seconds": self.seconds,
+            "best_seconds": self.best_seconds,
+            "mean_seconds": self.mean_seconds,
+            "rows_per_second": self.rows_per_second,
+        }
+
+
+def result_key(name: str, dataset: Optional[str], parameters: Dict[str, object]) -> str:
+    # コミット間で同じ計測を対応付けるキー
+    return json.dumps([name, dataset, parameters], sort_keys=True)
+
+
+def run_case(case: BenchmarkCase, repeat: int) -> BenchmarkResult:
+    if repeat < 1:
+        raise ValueError(f"repeat must be positive, got {repeat}")
+    seconds = []
+    for _ in range(repeat):
+        call = case.setup()
+        started = time.perf_counter()
+        for _ in range(case.number):
+            call()
+        seconds.append((time.perf_counter() - started) / case.number)
+    return BenchmarkResult(case.name, case.dataset, case.rows, case.number, dict(case.parameters), seconds)
+
+
+def _load_model(config_path: str):
+    return JsonConfigReader().read(config_path)
+
+
+def _scalar_cases(spec: DatasetSpec, config_path: str, scalar_rows: int) -> List[BenchmarkCase]:
+    columns = generate_columns(spec)
+    rows = min(scalar_rows, spec.rows)
+    readings = list(WindDataset(
+        columns["observed_at"][:rows], columns["max_wind_speed_mps"][:rows],
+        columns["max_wind_direction_deg"][:rows]))
+    model = _load_model(config_path)
+
+    def setup_instantaneous_power():
+        simulator = PowerGenerationSimulator(model)
+
+        def call():
+            for reading in readings:
+                simulator.calculate_instantaneous_power(
+                    reading, TURBINE_ANGLE_DEG, EFFICIENCY, VOLTAGE, CUT_IN_RPM)
+        return call
+
+    def setup_solve_for_rpm():
+        simulator = PowerGenerationSimulator(model)
+        eff_ws = simulator._calculate_effective_wind_speed_series(
+            columns["max_wind_speed_mps"][:rows], columns["max_wind_direction_deg"][:rows],
+            TURBINE_ANGLE_DEG)
+        shaft_powers = (simulator.compiled_model.turbine_power(eff_ws) * EFFICIENCY).tolist()
+
+        def call():
+            for shaft_power in shaft_powers:
+                simulator._solve_for_rpm(shaft_power, model.torque_curve)
+        return call
+
+    return [
+        BenchmarkCase("PowerGenerationSimulator.calculate_instantaneous_power",
+                      spec.name, rows, setup_instantaneous_power),
+        BenchmarkCase("PowerGenerationSimulator._solve_for_rpm",
+                      spec.name, rows, setup_solve_for_rpm),
+    ]
+
+
+def _simulator_factory(model):
+    return PowerGenerationSimulator(model)
+
+
+def _single_input(wind_path: str, config_path: str) -> SingleScenarioInputDTO:
+    return SingleScenarioInputDTO(
+        wind_data_path=wind_path, config_file_path=config_path, angle=TURBINE_ANGLE_DEG,
+        efficiency=EFFICIENCY, voltage=VOLTAGE, cut_in_rpm=CUT_IN_RPM)
+
+
+def _file_cases(spec: DatasetSpec, wind_path: str, config_path: str, angle_counts: Sequence[int]) -> List[BenchmarkCase]:
+    def setup_csv_read():
+        reader = CsvWindDataReader()
+        return lambda: reader.read(wind_path)
+
+    def setup_single_fixed_interval():
+        use_case = run_single_scenario.RunSingleSimulationScenarioUseCase(
+            wind_data_reader=CsvWindDataReader(),
+            power_plant_model_reader=JsonConfigReader(),
+            power_generation_simulator_factory=_simulator_factory)
+        return lambda: use_case.execute(_single_input(wind_path, config_path))
+
+    def setup_single_timestamp_interval():
+        use_case = simulation_use_cases.RunSingleSimulationScenarioUseCase(
+            _simulator_factory, _load_model, CsvWindDataReader())
+        return lambda: use_case.execute(_single_input(wind_path, config_path))
+
+    def setup_multiple(angle_count: int):
+        angles = numpy.linspace(0.0, 360.0, angle_count, endpoint=False).tolist()
+
+        def setup():
+            # CLIと同じ構成（入力キャッシュ＋角度スイープ）を計測ごとに新しく組み立てる
+            input_cache = InputCache(CsvWindDataReader(), JsonConfigReader())
+            readers = dict(wind_data_reader=input_cache.wind_data_reader,
+                           power_plant_model_reader=input_cache.power_plant_model_reader,
+                           power_generation_simulator_factory=_simulator_factory)
+            use_case = simulation_use_cases.RunMultipleSimulationScenariosUseCase(
+                run_single_scenario.RunSingleSimulationScenarioUseCase(**readers),
+                histogram_use_case=RunHistogramScenariosUseCase(**readers),
+                angle_sweep_use_case=RunAngleSweepUseCase(**readers),
+                input_cache=input_cache)
+            input_dto = MultipleScenariosInputDTO(
+                wind_data_path=wind_path, config_file_path=config_path, angles=angles,
+                efficiency=EFFICIENCY, voltage=VOLTAGE, cut_in_rpm=CUT_IN_RPM)
+            return lambda: use_case.execute(input_dto)
+        return setup
+
+    cases = [
+        BenchmarkCase("CsvWindDataReader.read", spec.name, spec.rows, setup_csv_read),
+        BenchmarkCase("run_single_scenario.RunSingleSimulationScenarioUseCase",
+                      spec.name, spec.rows, setup_single_fixed_interval),
+        BenchmarkCase("simulation_use_cases.RunSingleSimulationScenarioUseCase",
+                      spec.name, spec.rows, setup_single_timestamp_interval),
+    ]
+    for angle_count in angle_counts:
+        cases.append(BenchmarkCase(
+            "RunMultipleSimulationScenariosUseCase", spec.name, spec.rows * angle_count,
+            setup_multiple(angle_count), parameters={"angles": angle_count}))
+    return cases
+
+
+def build_cases(specs: Iterable[DatasetSpec], data_dir: str, scalar_rows: int = DEFAULT_SCALAR_ROWS,
+                angle_counts: Sequence[int] = DEFAULT_ANGLE_COUNTS) -> List[BenchmarkCase]:
+    """
+    合成データ（data_dir に書き出して再利用する）ごとの計測対象を返す。
+    rows は処理した行数で、複数シナリオは行数×角度数とする。
+    """
+    config_path = write_config_json(data_dir)
+
+    def setup_config_read():
+        reader = JsonConfigReader()
+        return lambda: reader.read(config_path)
+
+    cases = [BenchmarkCase("JsonConfigReader.read", None, 0, setup_config_read,
+                           number=CONFIG_READS_PER_SAMPLE)]
+    for spec in specs:
+        wind_path = write_wind_csv(spec, data_dir)
+        cases.extend(_scalar_cases(spec, config_path, scalar_rows))
+        cases.extend(_file_cases(spec, wind_path, config_path, angle_counts))
+    return cases
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() if completed.returncode == 0 else None
+
+
+def environment_metadata() -> dict:
+    """コミット間の比較で参照する実行環境の情報"""
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def to_report(results: Iterable[BenchmarkResult], repeat: int, scalar_rows: int) -> dict:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "metadata": dict(environment_metadata(), repeat=repeat, scalar_rows=scalar_rows),
+        "results": [r.to_dict() for r in results],
+    }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """2つの結果の同じ計測の比較。ratio = head / base（1より大きいほど遅くなった）"""
+    key: str
+    name: str
+    dataset: Optional[str]
+    parameters: Dict[str, object]
+    base_seconds: float
+    head_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.head_seconds / self.base_seconds if self.base_seconds > 0 else float("inf")
+
+
+def compare_reports(base: dict, head: dict) -> List[Comparison]:
+    """両方の結果にある計測について best_seconds を比較する（head の順）"""
+    base_results = {result_key(r["name"], r["dataset"], r["parameters"]): r for r in base["results"]}
+    comparisons = []
+    for r in head["results"]:
+        key = result_key(r["name"], r["dataset"], r["parameters"])
+        if key in base_results:
+            comparisons.append(Comparison(
+                key, r["name"], r["dataset"], r["parameters"],
+                base_results[key]["best_seconds"], r["best_seconds"]))
+    return comparisons
@@ -1,5 +1,5 @@
 import sys
-from wind_compass.adapters.ui.cli import simulate
+from wind_compass.adapters.ui.cli import get_cli
 
 if __name__ == "__main__":
-    simulate()
+    get_cli()()
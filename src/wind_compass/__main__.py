@@ -1,10 +1,10 @@
 import sys
-from wind_compass.adapters.ui.cli import get_simulate_command
+from wind_compass.adapters.ui.cli import get_cli
 
 
 def main():
-    simulate = get_simulate_command()
-    simulate()
+    cli = get_cli()
+    cli()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+import json
+import os
+from typing import List
+from wind_compass.domain.constants import INTEGRATION_RULES, INTEGRATION_FIXED
+from wind_compass.use_cases.dtos import BatchInputDTO, BatchParameterSet, SIMULATION_ENGINES, ENGINE_EXACT, default_integration_rule
+
+_YAML_EXTENSIONS = (".yaml", ".yml")
+_TOP_KEYS = ("wind_data", "config_files", "angles", "parameter_sets", "workers")
+_PARAMETER_KEYS = ("name", "efficiency", "voltage", "cut_in_rpm", "engine", "integration_rule", "max_gap_minutes")
+
+
+def _load_yaml(file_path: str):
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError(
+            "Reading YAML batch manifests requires PyYAML. Install it with 'pip install pyyaml' "
+            "or write the manifest as JSON.") from e
+    with open(file_path, "r") as f:
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse YAML manifest {file_path}: {e}")
+
+
+class BatchManifestReader:
+    """
+    バッチのマニフェスト（JSON、拡張子が .yaml/.yml の場合は YAML）を読み込み BatchInputDTO を返す。
+
+    形式::
+
+        wind_data: [site_a.csv, site_b.parquet]
+        config_files: [model_1.json, model_2.json]
+        angles: [0, 90, 180]
+        parameter_sets:            # 省略時は "default"（全パラメータ省略）の1件
+          - name: base
+            efficiency: 0.9
+            voltage: 100
+            cut_in_rpm: 10
+            engine: exact          # exact / table / histogram
+            integration_rule: left # fixed / left / trapezoid
+            max_gap_minutes: 60
+        workers: 4                 # 省略可
+
+    相対パスはマニフェストのあるディレクトリを基準に解決する。形式が不正な場合は ValueError を送出する。
+    """
+
+    def read(self, file_path: str) -> BatchInputDTO:
+        if file_path.lower().endswith(_YAML_EXTENSIONS):
+            data = _load_yaml(file_path)
+        else:
+            with open(file_path, "r") as f:
+                try:
+                    data = json.load(f)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Failed to parse JSON manifest {file_path}: {e}")
+        if not isinstance(data, dict):
+            raise ValueError("Batch manifest must be a mapping")
+        unknown = sorted(set(data) - set(_TOP_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown keys in batch manifest: {', '.join(unknown)}")
+        base_dir = os.path.dirname(os.path.abspath(file_path))
+        workers = data.get("workers")
+        if workers is not None and (not isinstance(workers, int) or isinstance(workers, bool) or workers < 1):
+            raise ValueError(f"'workers' must be a positive integer, got {workers!r}")
+        parameter_sets = [self._parameter_set(p, i) for i, p in enumerate(data.get("parameter_sets") or [])]
+        names = [p.name for p in parameter_sets]
+        if len(set(names)) != len(names):
+            raise ValueError("Parameter set names must be unique")
+        return BatchInputDTO(
+            wind_data_paths=self._paths(data, "wind_data", base_dir),
+            config_file_paths=self._paths(data, "config_files", base_dir),
+            angles=self._angles(data),
+            parameter_sets=parameter_sets or [BatchParameterSet(name="default")],
+            workers=workers,
+        )
+
+    @staticmethod
+    def _paths(data: dict, key: str, base_dir: str) -> List[str]:
+        paths = data.get(key)
+        if isinstance(paths, str):
+            paths = [paths]
+        if not paths or not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+            raise ValueError(f"'{key}' must be a non-empty list of file paths")
+        return [os.path.normpath(os.path.join(base_dir, p)) for p in paths]
+
+    @staticmethod
+    def _angles(data: dict) -> List[float]:
+        angles = data.get("angles")
+        if not angles or not isinstance(angles, list) or not all(
+                isinstance(a, (int, float)) and not isinstance(a, bool) for a in angles):
+            raise ValueError("'angles' must be a non-empty list of numbers")
+        # CLI の --angles と同じく重複を除いて昇順にする
+        return sorted(set(float(a) for a in angles))
+
+    @staticmethod
+    def _parameter_set(entry, index: int) -> BatchParameterSet:
+        if not isinstance(entry, dict):
+            raise ValueError(f"parameter_sets[{index}] must be a mapping")
+        unknown = sorted(set(entry) - set(_PARAMETER_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown keys in parameter_sets[{index}]: {', '.join(unknown)}")
+        for key in ("efficiency", "voltage", "cut_in_rpm", "max_gap_minutes"):
+            value = entry.get(key)
+            if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool)):
+                raise ValueError(f"parameter_sets[{index}].{key} must be a number, got {value!r}")
+        engine = entry.get("engine", ENGINE_EXACT)
+        if engine not in SIMULATION_ENGINES:
+            raise ValueError(f"parameter_sets[{index}].engine must be one of {', '.join(SIMULATION_ENGINES)}")
+        integration_rule = entry.get("integration_rule")
+        if integration_rule is not None and integration_rule not in INTEGRATION_RULES:
+            raise ValueError(
+                f"parameter_sets[{index}].integration_rule must be one of {', '.join(INTEGRATION_RULES)}")
+        max_gap_minutes = entry.get("max_gap_minutes")
+        if max_gap_minutes is not None and max_gap_minutes <= 0:
+            raise ValueError(f"parameter_sets[{index}].max_gap_minutes must be positive")
+        if max_gap_minutes is not None and (integration_rule or default_integration_rule(engine)) == INTEGRATION_FIXED:
+            # fixed は時刻を使わないため打ち切りが効かない（指定を黙って無視しない）
+            raise ValueError(
+                f"parameter_sets[{index}].max_gap_minutes requires integration_rule left or trapezoid "
+                f"(the fixed rule ignores observed_at gaps)")
+        return BatchParameterSet(
+            name=str(entry.get("name", f"set{index + 1}")),
+            efficiency=entry.get("efficiency"),
+            voltage=entry.get("voltage"),
+            cut_in_rpm=entry.get("cut_in_rpm"),
+            engine=engine,
+            integration_rule=integration_rule,
+            max_gap_hours=max_gap_minutes / 60.0 if max_gap_minutes is not None else None,
+        )
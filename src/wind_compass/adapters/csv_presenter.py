@@ -27,17 +27,26 @@ class CsvPresenter:
         Raises:
             PresenterError: ファイル書き込みに失敗した場合
         """
+        rows = []
+        for r_label in row_labels:
+            row_to_write = [r_label]
+            for c_label in col_labels:
+                value = matrix_data.get(r_label, {}).get(c_label, "")
+                row_to_write.append(value)
+            rows.append(row_to_write)
+        self.present_rows([""] + col_labels, rows)
+
+    def present_rows(self, header: List[str], rows: List[List[Any]]):
+        """
+        ヘッダー行とデータ行をそのままCSVファイルに書き出す（バッチ結果などの縦持ちの表）。
+        Raises:
+            PresenterError: ファイル書き込みに失敗した場合
+        """
         try:
             with open(self.filepath, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
-                header = [""] + col_labels
                 writer.writerow(header)
-                for r_label in row_labels:
-                    row_to_write = [r_label]
-                    for c_label in col_labels:
-                        value = matrix_data.get(r_label, {}).get(c_label, "")
-                        row_to_write.append(value)
-                    writer.writerow(row_to_write)
+                writer.writerows(rows)
         except IOError as e:
             message = f"Error: Could not write CSV file to {self.filepath}. Details: {e}"
             print(message)
@@ -1,44 +1,212 @@
 import json
+import logging
+import os
+import time
+import warnings
+import numpy
 import pandas as pd
-from typing import Iterable
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Mapping, Optional
 from datetime import datetime
 from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.wind_dataset import WindDataset
 from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+from wind_compass.adapters.reader_options import (
+    CSV_ENGINE_C, WIND_FORMAT_AUTO, WIND_FORMAT_CSV, WIND_FORMAT_EXTENSIONS)
+
+
+@dataclass(frozen=True)
+class ParseStats:
+    """CSVの解析件数と所要時間(秒)"""
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+
+# numpy.datetime64 がそのまま解釈できる（タイムゾーンなしの）ISO 8601 形式
+_ISO_TIMESTAMP_FORMATS = {
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d",
+}
+
+
+def _guess_timestamp_format(values: pd.Series) -> Optional[str]:
+    # 先頭の値から strptime 形式を推定する（推定できない場合は None）
+    try:
+        from pandas.tseries.api import guess_datetime_format
+    except ImportError:
+        return None
+    sample = values.dropna()
+    if sample.empty or not isinstance(sample.iloc[0], str):
+        return None
+    return guess_datetime_format(sample.iloc[0])
 
 
 class CsvWindDataReader(WindDataReader):
-    def read(self, file_path: str) -> Iterable[WindReading]:
+    """
+    CSV形式の風況データを読み込むリーダ。
+
+    必要な3列のみを読み込み（usecols）、風速・風向は float として宣言して型推論を省く。
+    observed_at は timestamp_format（strptime 形式）で解釈し、未指定の場合は先頭の値から形式を推定する。
+    推定した形式に合わない値がある場合は従来どおり pandas の推論で解釈する。
+    解析件数と所要時間は last_parse_stats に保持し、INFO ログに rows/sec を出力する。
+    """
+    REQUIRED_COLUMNS = ["observed_at",
+                        "max_wind_speed_mps", "max_wind_direction_deg"]
+
+    def __init__(self, dtype=numpy.float64, timestamp_format: Optional[str] = None, engine: str = CSV_ENGINE_C):
+        # 風速・風向の格納型（float32 でメモリを半減できる）
+        self._dtype = dtype
+        self.timestamp_format = timestamp_format
+        self.engine = engine
+        self.last_parse_stats: Optional[ParseStats] = None
+
+    def parse_options(self, file_path: str) -> dict:
+        # engine は解析方法のみの違いで、読み込み結果は変わらない
+        return {"dtype": numpy.dtype(self._dtype).str, "timestamp_format": self.timestamp_format}
+
+    def read(self, file_path: str) -> WindDataset:
+        started = time.perf_counter()
+        self._check_header(file_path)
         try:
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(file_path, **self._read_options(self.engine))
         except FileNotFoundError:
             raise
         except pd.errors.ParserError as e:
             raise ValueError(f"Failed to parse CSV file: {e}")
-        required_cols = ["observed_at",
-                         "max_wind_speed_mps", "max_wind_direction_deg"]
-        if not all(col in df.columns for col in required_cols):
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid data type in CSV columns: {e}")
+        dataset = self._to_dataset(df)
+        self._record_stats(file_path, len(dataset), time.perf_counter() - started)
+        return dataset
+
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        # chunk_size 行ずつ読み込むため、メモリ使用量はファイルサイズによらずチャンク分に収まる
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        started = time.perf_counter()
+        rows = 0
+        self._check_header(file_path)
+        try:
+            chunks = pd.read_csv(
+                file_path, chunksize=chunk_size, **self._read_options(CSV_ENGINE_C))
+            for df in chunks:
+                dataset = self._to_dataset(df)
+                rows += len(dataset)
+                yield dataset
+        except FileNotFoundError:
+            raise
+        except pd.errors.ParserError as e:
+            raise ValueError(f"Failed to parse CSV file: {e}")
+        except (ValueError, TypeError) as e:
+            if str(e).startswith("Invalid data type in CSV columns"):
+                raise
+            raise ValueError(f"Invalid data type in CSV columns: {e}")
+        self._record_stats(file_path, rows, time.perf_counter() - started)
+
+    def _check_header(self, file_path: str) -> None:
+        try:
+            columns = pd.read_csv(file_path, nrows=0).columns
+        except FileNotFoundError:
+            raise
+        except pd.errors.ParserError as e:
+            raise ValueError(f"Failed to parse CSV file: {e}")
+        if not all(col in columns for col in self.REQUIRED_COLUMNS):
+            raise ValueError("CSV missing required columns")
+
+    def _read_options(self, engine: str) -> dict:
+        return {
+            "usecols": self.REQUIRED_COLUMNS,
+            "dtype": {"max_wind_speed_mps": numpy.float64, "max_wind_direction_deg": numpy.float64},
+            "engine": engine,
+        }
+
+    def _parse_timestamps(self, values: pd.Series) -> numpy.ndarray:
+        if pd.api.types.is_datetime64_any_dtype(values):
+            # pyarrow エンジンは ISO 形式の時刻を解析済みで返す
+            return values.to_numpy(dtype='datetime64[ns]')
+        timestamp_format = self.timestamp_format or _guess_timestamp_format(values)
+        if timestamp_format in _ISO_TIMESTAMP_FORMATS:
+            # タイムゾーンなしの ISO 8601 形式は numpy で直接解釈する（pandas より高速）。
+            # オフセット付きの値が混ざる場合（numpy は警告を出す）は pandas で解釈する
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error")
+                    return values.to_numpy(dtype=object).astype('datetime64[ns]')
+            except (ValueError, TypeError, Warning):
+                pass
+        if timestamp_format is not None:
+            try:
+                return pd.to_datetime(values, format=timestamp_format).to_numpy(dtype='datetime64[ns]')
+            except (ValueError, TypeError):
+                if self.timestamp_format is not None:
+                    raise
+        return pd.to_datetime(values).to_numpy(dtype='datetime64[ns]')
+
+    def _record_stats(self, file_path: str, rows: int, seconds: float) -> None:
+        self.last_parse_stats = ParseStats(rows=rows, seconds=seconds)
+        logging.info(
+            f"Parsed {rows} rows from {file_path} in {seconds:.3f}s "
+            f"({self.last_parse_stats.rows_per_second:,.0f} rows/s)")
+
+    def _to_dataset(self, df: pd.DataFrame) -> WindDataset:
+        if not all(col in df.columns for col in self.REQUIRED_COLUMNS):
             raise ValueError("CSV missing required columns")
         try:
-            df['observed_at'] = pd.to_datetime(df['observed_at'])
-            df['max_wind_speed_mps'] = df['max_wind_speed_mps'].astype(float)
-            df['max_wind_direction_deg'] = df['max_wind_direction_deg'].astype(
-                float)
-            readings = [
-                WindReading(
-                    observed_at=row.observed_at,
-                    wind_speed=row.max_wind_speed_mps,
-                    wind_direction=row.max_wind_direction_deg
-                ) for row in df.itertuples(index=False)
-            ]
-            return readings
+            return WindDataset(
+                observed_at=self._parse_timestamps(df['observed_at']),
+                wind_speeds=df['max_wind_speed_mps'].to_numpy(dtype=float),
+                wind_directions=df['max_wind_direction_deg'].to_numpy(dtype=float),
+                dtype=self._dtype
+            )
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid data type in CSV columns: {e}")
 
 
+class FormatSelectingWindDataReader(WindDataReader):
+    """
+    ファイル形式ごとのリーダに読み込みを振り分けるリーダ。
+    wind_format が auto の場合は拡張子で判定する。
+    """
+
+    def __init__(self, readers: Dict[str, WindDataReader], wind_format: str = WIND_FORMAT_AUTO):
+        self._readers = readers
+        self.wind_format = wind_format
+
+    @property
+    def readers(self) -> Mapping[str, WindDataReader]:
+        return self._readers
+
+    def format_for(self, file_path: str) -> str:
+        if self.wind_format != WIND_FORMAT_AUTO:
+            return self.wind_format
+        extension = os.path.splitext(file_path)[1].lower()
+        return WIND_FORMAT_EXTENSIONS.get(extension, WIND_FORMAT_CSV)
+
+    def read(self, file_path: str):
+        return self._reader_for(file_path).read(file_path)
+
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        return self._reader_for(file_path).read_chunks(file_path, chunk_size)
+
+    def parse_options(self, file_path: str) -> dict:
+        return {"format": self.format_for(file_path), **self._reader_for(file_path).parse_options(file_path)}
+
+    def _reader_for(self, file_path: str) -> WindDataReader:
+        wind_format = self.format_for(file_path)
+        if wind_format not in self._readers:
+            raise ValueError(f"Unsupported wind data format: {wind_format}")
+        return self._readers[wind_format]
+
+
 class JsonConfigReader(PowerPlantModelReader):
     TURBINE_POWER_CURVE = "turbine_power_curve"
     GENERATOR_TORQUE_CURVE = "generator_torque_curve"
     GENERATOR_CURRENT_CURVE = "generator_current_curve"
+    # 任意: 有効風速(m/s) -> 風車回転数(rpm)。増速比を指定したシミュレーションで使う
+    ROTOR_SPEED_CURVE = "rotor_speed_curve"
     COEFFS = "coeffs"
     EXPECTED_COEFFS_COUNT = 4
 
@@ -100,6 +268,15 @@ class JsonConfigReader(PowerPlantModelReader):
                 data[self.GENERATOR_CURRENT_CURVE], self.GENERATOR_CURRENT_CURVE)
             g_current = PolynomialCurve(coeffs=list(
                 data[self.GENERATOR_CURRENT_CURVE][self.COEFFS]))
+
+            rotor_speed = None
+            if self.ROTOR_SPEED_CURVE in data:
+                if not isinstance(data[self.ROTOR_SPEED_CURVE], dict):
+                    raise ValueError(f"'{self.ROTOR_SPEED_CURVE}' must be a dictionary.")
+                self._validate_curve_data(
+                    data[self.ROTOR_SPEED_CURVE], self.ROTOR_SPEED_CURVE)
+                rotor_speed = PolynomialCurve(coeffs=list(
+                    data[self.ROTOR_SPEED_CURVE][self.COEFFS]))
         
         # Catch ValueError from _validate_curve_data or PolynomialCurve init
         # KeyError should be caught by the top-level key check or _validate_curve_data
@@ -112,8 +289,9 @@ class JsonConfigReader(PowerPlantModelReader):
         return PowerPlantModel(
             power_curve=t_curve,
             torque_curve=g_torque,
-            current_curve=g_current
+            current_curve=g_current,
+            rotor_speed_curve=rotor_speed
         )
 
 
-__all__ = ["CsvWindDataReader", "JsonConfigReader"]
\ No newline at end of file
+__all__ = ["CsvWindDataReader", "FormatSelectingWindDataReader", "JsonConfigReader"]
\ No newline at end of file
@@ -0,0 +1,126 @@
+import json
+import logging
+import os
+from typing import Iterator, Optional
+import numpy
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.ports import WindDataReader
+
+# サイドカーの形式を変えた場合は上げる（古いサイドカーは作り直される）
+SIDECAR_FORMAT_VERSION = 2
+SIDECAR_SUFFIX = ".wcache"
+_META_FILE = "meta.json"
+_COLUMNS = ("observed_at", "wind_speeds", "wind_directions")
+
+
+def sidecar_dir(file_path: str) -> str:
+    """風況ファイルに対応するサイドカーディレクトリのパス（<ファイル名>.wcache）"""
+    return os.path.abspath(file_path) + SIDECAR_SUFFIX
+
+
+class NpySidecarWindDataReader(WindDataReader):
+    """
+    風況ファイルの読み込み結果を、列ごとの .npy ファイル（サイドカー）として元ファイルの隣に保存するリーダ。
+
+    初回は元のリーダ（CsvWindDataReader など）でパースしてサイドカーを書き出し、
+    2回目以降は numpy.load(mmap_mode='r') でメモリマップして開くため、パースを省略できる。
+    サイドカーは元ファイルの更新時刻とサイズ、元のリーダの parse_options（時刻の形式など）で検証し、
+    一致しなければ作り直す。
+
+    enabled=False でサイドカーを使わず元のリーダへ委譲し、refresh=True で既存のサイドカーを
+    無視して作り直す（同じファイルについて1プロセス内で1回のみ）。
+    サイドカーを書き込めない場合（読み取り専用ディレクトリなど）は警告を出してパース結果を返す。
+    """
+
+    def __init__(self, reader: WindDataReader, enabled: bool = True, refresh: bool = False):
+        self._reader = reader
+        self.enabled = enabled
+        self.refresh = refresh
+        self._refreshed = set()
+
+    @property
+    def reader(self) -> WindDataReader:
+        """サイドカーが無い場合に使う元のリーダ"""
+        return self._reader
+
+    def read(self, file_path: str) -> WindDataset:
+        if not self.enabled:
+            return WindDataset.as_dataset(self._reader.read(file_path))
+        dataset = self._load(file_path)
+        if dataset is not None:
+            return dataset
+        dataset = WindDataset.as_dataset(self._reader.read(file_path))
+        self._write(file_path, dataset)
+        return dataset
+
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        # 有効なサイドカーがあればメモリマップのスライスを返す（参照したページのみ読み込まれる）。
+        # ストリーミング読み込みではサイドカーを作らない
+        dataset = self._load(file_path) if self.enabled else None
+        if dataset is None:
+            return self._reader.read_chunks(file_path, chunk_size)
+        return super().read_chunks(file_path, chunk_size)
+
+    def parse_options(self, file_path: str) -> dict:
+        return self._reader.parse_options(file_path)
+
+    def invalidate(self, file_path: str) -> None:
+        """サイドカーを削除する。"""
+        directory = sidecar_dir(file_path)
+        for name in (_META_FILE,) + tuple(f"{c}.npy" for c in _COLUMNS):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
+
+    def _source_meta(self, file_path: str) -> dict:
+        st = os.stat(file_path)
+        return {
+            "version": SIDECAR_FORMAT_VERSION,
+            "source_mtime_ns": st.st_mtime_ns,
+            "source_size": st.st_size,
+            "parse_options": self._reader.parse_options(file_path),
+        }
+
+    def _load(self, file_path: str) -> Optional[WindDataset]:
+        if self.refresh and os.path.abspath(file_path) not in self._refreshed:
+            return None
+        directory = sidecar_dir(file_path)
+        try:
+            with open(os.path.join(directory, _META_FILE), "r") as f:
+                meta = json.load(f)
+            expected = self._source_meta(file_path)
+            if any(meta.get(k) != v for k, v in expected.items()):
+                return None
+            columns = [
+                numpy.load(os.path.join(directory, f"{c}.npy"), mmap_mode="r")
+                for c in _COLUMNS
+            ]
+            if any(len(c) != meta.get("rows") for c in columns):
+                return None
+            return WindDataset(*columns, dtype=columns[1].dtype)
+        except (OSError, ValueError):
+            # サイドカーが無い・壊れている場合は作り直す
+            return None
+
+    def _write(self, file_path: str, dataset: WindDataset) -> None:
+        directory = sidecar_dir(file_path)
+        self._refreshed.add(os.path.abspath(file_path))
+        try:
+            meta = self._source_meta(file_path)
+            meta["rows"] = len(dataset)
+            os.makedirs(directory, exist_ok=True)
+            # 先にメタ情報を消し、列を書き終えてからメタ情報を置く（途中で失敗したサイドカーは無効になる）
+            self.invalidate(file_path)
+            for name in _COLUMNS:
+                path = os.path.join(directory, f"{name}.npy")
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    numpy.save(f, numpy.ascontiguousarray(getattr(dataset, name)))
+                os.replace(tmp_path, path)
+            tmp_meta = os.path.join(directory, _META_FILE + ".tmp")
+            with open(tmp_meta, "w") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta, os.path.join(directory, _META_FILE))
+        except OSError as e:
+            logging.warning(f"Could not write wind data cache for {file_path}: {e}")
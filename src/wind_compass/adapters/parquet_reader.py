@@ -0,0 +1,152 @@
+import errno
+import os
+from typing import Iterator, List, Optional
+import numpy
+import pandas as pd
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.ports import WindDataReader
+
+OBSERVED_AT = "observed_at"
+WIND_SPEED = "max_wind_speed_mps"
+WIND_DIRECTION = "max_wind_direction_deg"
+COLUMNS = [OBSERVED_AT, WIND_SPEED, WIND_DIRECTION]
+
+
+def _import_pyarrow():
+    # pyarrow は Parquet を読む場合のみ必要な任意依存
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet wind data requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+class ParquetWindDataReader(WindDataReader):
+    """
+    Parquet 形式の風況データを読み込むリーダ。
+
+    observed_at・max_wind_speed_mps・max_wind_direction_deg の3列のみを読み込み（列の射影）、
+    start・end を指定した場合は [start, end) の範囲に掛からない行グループを
+    列統計（min/max）で読み飛ばしてから行単位で絞り込む。
+    1チャンク・欠損なしの列は Arrow のバッファをコピーせずに WindDataset の列として使う。
+    """
+
+    def __init__(self, dtype=numpy.float64, start=None, end=None):
+        # 風速・風向の格納型（float32 でメモリを半減できる）
+        self._dtype = dtype
+        self._start = None if start is None else numpy.datetime64(start, 'ns')
+        self._end = None if end is None else numpy.datetime64(end, 'ns')
+
+    def parse_options(self, file_path: str) -> dict:
+        return {
+            "dtype": numpy.dtype(self._dtype).str,
+            "start": None if self._start is None else str(self._start),
+            "end": None if self._end is None else str(self._end),
+        }
+
+    def read(self, file_path: str) -> WindDataset:
+        pa = _import_pyarrow()
+        parquet_file = self._open(file_path)
+        try:
+            table = parquet_file.read_row_groups(
+                self._row_groups(parquet_file), columns=COLUMNS, use_threads=True)
+        except (pa.ArrowInvalid, OSError) as e:
+            raise ValueError(f"Failed to read Parquet file: {e}")
+        return self._to_dataset(table)
+
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        # 行グループをまたいで chunk_size 行ずつのバッチで読む
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        pa = _import_pyarrow()
+        parquet_file = self._open(file_path)
+        try:
+            batches = parquet_file.iter_batches(
+                batch_size=chunk_size, row_groups=self._row_groups(parquet_file), columns=COLUMNS)
+            for batch in batches:
+                dataset = self._to_dataset(pa.Table.from_batches([batch]))
+                if len(dataset):
+                    yield dataset
+        except (pa.ArrowInvalid, OSError) as e:
+            raise ValueError(f"Failed to read Parquet file: {e}")
+
+    def _open(self, file_path: str):
+        pa = _import_pyarrow()
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), file_path)
+        try:
+            parquet_file = pa.parquet.ParquetFile(file_path, memory_map=True)
+        except (pa.ArrowInvalid, OSError) as e:
+            raise ValueError(f"Failed to parse Parquet file: {e}")
+        names = parquet_file.schema_arrow.names
+        if not all(col in names for col in COLUMNS):
+            raise ValueError("Parquet file missing required columns")
+        return parquet_file
+
+    def _row_groups(self, parquet_file) -> List[int]:
+        # 時刻範囲に掛からない行グループを列統計で除外する（統計が無い行グループは読む）
+        groups = list(range(parquet_file.num_row_groups))
+        if self._start is None and self._end is None:
+            return groups
+        pa = _import_pyarrow()
+        field_type = parquet_file.schema_arrow.field(OBSERVED_AT).type
+        if not pa.types.is_timestamp(field_type):
+            return groups
+        column_index = parquet_file.schema_arrow.get_field_index(OBSERVED_AT)
+        selected = []
+        for i in groups:
+            stats = parquet_file.metadata.row_group(i).column(column_index).statistics
+            if stats is None or not stats.has_min_max:
+                selected.append(i)
+                continue
+            # min_raw/max_raw は列の単位（s/ms/us/ns）の整数値
+            lower = numpy.datetime64(int(stats.min_raw), field_type.unit).astype('datetime64[ns]')
+            upper = numpy.datetime64(int(stats.max_raw), field_type.unit).astype('datetime64[ns]')
+            if self._start is not None and upper < self._start:
+                continue
+            if self._end is not None and lower >= self._end:
+                continue
+            selected.append(i)
+        return selected
+
+    def _to_dataset(self, table) -> WindDataset:
+        try:
+            observed_at = self._timestamps(table.column(OBSERVED_AT))
+            speeds = self._floats(table.column(WIND_SPEED))
+            directions = self._floats(table.column(WIND_DIRECTION))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid data type in Parquet columns: {e}")
+        mask = self._time_mask(observed_at)
+        if mask is not None:
+            observed_at, speeds, directions = observed_at[mask], speeds[mask], directions[mask]
+        return WindDataset(observed_at, speeds, directions, dtype=self._dtype)
+
+    def _time_mask(self, observed_at: numpy.ndarray) -> Optional[numpy.ndarray]:
+        if self._start is None and self._end is None:
+            return None
+        mask = numpy.ones(observed_at.shape, dtype=bool)
+        if self._start is not None:
+            mask &= observed_at >= self._start
+        if self._end is not None:
+            mask &= observed_at < self._end
+        return None if mask.all() else mask
+
+    def _timestamps(self, column) -> numpy.ndarray:
+        pa = _import_pyarrow()
+        if pa.types.is_timestamp(column.type):
+            if column.type.unit != 'ns':
+                column = column.cast(pa.timestamp('ns', tz=column.type.tz))
+            # タイムゾーン付きの列は UTC の値になる
+            return column.to_numpy()
+        # 文字列などは CSV と同じく pandas で解釈する
+        return pd.to_datetime(column.to_pandas()).to_numpy(dtype='datetime64[ns]')
+
+    def _floats(self, column) -> numpy.ndarray:
+        pa = _import_pyarrow()
+        if not pa.types.is_floating(column.type):
+            column = column.cast(pa.float64())
+        # 欠損値は NaN になる（シミュレーションでは 0W として扱われる）
+        return column.to_numpy()
@@ -0,0 +1,18 @@
+# 風況データリーダの選択肢（CLIのオプション定義から参照する）。
+# --help の表示で pandas などを読み込まないよう、依存の無いモジュールに置く
+
+# 風況データの形式（auto は拡張子で判定し、不明な拡張子は csv とする）
+WIND_FORMAT_AUTO = "auto"
+WIND_FORMAT_CSV = "csv"
+WIND_FORMAT_PARQUET = "parquet"
+WIND_FORMATS = (WIND_FORMAT_AUTO, WIND_FORMAT_CSV, WIND_FORMAT_PARQUET)
+WIND_FORMAT_EXTENSIONS = {
+    ".csv": WIND_FORMAT_CSV,
+    ".parquet": WIND_FORMAT_PARQUET,
+    ".pq": WIND_FORMAT_PARQUET,
+}
+
+# CSVの解析エンジン。pyarrow は任意依存で高速だが、チャンク読み込みには対応しないため c を使う
+CSV_ENGINE_C = "c"
+CSV_ENGINE_PYARROW = "pyarrow"
+CSV_ENGINES = (CSV_ENGINE_C, CSV_ENGINE_PYARROW)
@@ -0,0 +1,159 @@
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+from wind_compass.use_cases.dtos import ScenarioResult
+from wind_compass.use_cases.ports import ScenarioResultCache
+
+RESULT_CACHE_FILE = "results.sqlite3"
+# 保存する結果の合計サイズ（JSON のバイト数）の上限。超えた分は最後に使われた時刻が古い順に削除する
+DEFAULT_RESULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)",
+    "CREATE TABLE IF NOT EXISTS file_digests ("
+    "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL)",
+)
+
+
+def default_cache_dir() -> str:
+    """既定のキャッシュディレクトリ（$XDG_CACHE_HOME/wind_compass、未設定なら ~/.cache/wind_compass）"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "wind_compass")
+
+
+class SqliteScenarioResultCache(ScenarioResultCache):
+    """
+    シナリオの結果を SQLite（<directory>/results.sqlite3）に保存するキャッシュ。
+
+    結果は JSON で保存し、合計サイズが max_bytes を超えると最後に使われた時刻が古い結果から削除する（LRU）。
+    ファイル内容のハッシュは (実パス, 更新時刻, サイズ) ごとに保存し、ファイルが変わらない限り再計算しない。
+    データベースを開けない・書き込めない場合は警告を出し、キャッシュ無しとして続行する。
+    enabled・directory は実行ごとに変更できる（CLI の --no-cache・--cache-dir）。
+    接続はスレッド間で共有し、操作はロックで直列化する（バッチ実行のワーカから呼ばれる）。
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+                 clock: Callable[[], float] = time.time):
+        self.enabled = True
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_path: Optional[str] = None
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory or default_cache_dir(), RESULT_CACHE_FILE)
+
+    def get(self, key: str) -> Optional[ScenarioResult]:
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> Optional[ScenarioResult]:
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with connection:
+                connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (self._clock(), key))
+            return ScenarioResult(**json.loads(row[0]))
+        except (sqlite3.Error, OSError, ValueError, TypeError) as e:
+            logging.warning(f"Could not read result cache {self.path}: {e}")
+            return None
+
+    def put(self, key: str, result: ScenarioResult) -> None:
+        with self._lock:
+            self._put(key, result)
+
+    def _put(self, key: str, result: ScenarioResult) -> None:
+        value = json.dumps(dataclasses.asdict(result))
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, value, len(value), self._clock()))
+                self._evict(connection)
+        except (sqlite3.Error, OSError) as e:
+            logging.warning(f"Could not write result cache {self.path}: {e}")
+
+    def file_digest(self, file_path: str) -> str:
+        st = os.stat(file_path)
+        real_path = os.path.realpath(file_path)
+        with self._lock:
+            digest = self._cached_digest(real_path, st)
+        if digest is not None:
+            return digest
+        digest = super().file_digest(file_path)
+        with self._lock:
+            self._store_digest(real_path, st, digest)
+        return digest
+
+    def _cached_digest(self, real_path: str, st: os.stat_result) -> Optional[str]:
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT digest FROM file_digests WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (real_path, st.st_mtime_ns, st.st_size)).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logging.warning(f"Could not read result cache {self.path}: {e}")
+            return None
+        return row[0] if row is not None else None
+
+    def _store_digest(self, real_path: str, st: os.stat_result, digest: str) -> None:
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO file_digests (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                    (real_path, st.st_mtime_ns, st.st_size, digest))
+        except (sqlite3.Error, OSError) as e:
+            logging.warning(f"Could not write result cache {self.path}: {e}")
+
+    def clear(self) -> None:
+        """保存した結果とファイルのハッシュを全て削除する。"""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM results")
+                connection.execute("DELETE FROM file_digests")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return int(self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0])
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        excess = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY last_used, rowid"):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def _connect(self) -> sqlite3.Connection:
+        # directory が変わった場合は開き直す
+        path = self.path
+        if self._connection is None or self._connection_path != path:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            connection = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+            self._connection, self._connection_path = connection, path
+        return self._connection
@@ -0,0 +1,48 @@
+import dataclasses
+import json
+import logging
+import os
+from typing import Optional
+from wind_compass.use_cases.dtos import ScenarioState
+from wind_compass.use_cases.ports import ScenarioStateStore
+
+STATE_SUFFIX = ".wstate"
+
+
+def state_dir(file_path: str) -> str:
+    """風況ファイルに対応する積算状態のディレクトリのパス（<ファイル名>.wstate）"""
+    return os.path.abspath(file_path) + STATE_SUFFIX
+
+
+class JsonScenarioStateStore(ScenarioStateStore):
+    """
+    シナリオごとの積算状態を1キー1ファイルの JSON（<キー>.json）として保存するストア。
+
+    directory を省略した場合は風況ファイルの隣の <ファイル名>.wstate に保存する。
+    読めない・壊れた状態ファイルは無いものとして扱う（全件を計算し直す）。
+    書き込めない場合（読み取り専用ディレクトリなど）は警告を出して続行する。
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+
+    def load(self, wind_data_path: str, key: str) -> Optional[ScenarioState]:
+        try:
+            with open(self._path(wind_data_path, key), "r") as f:
+                return ScenarioState(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, wind_data_path: str, key: str, state: ScenarioState) -> None:
+        path = self._path(wind_data_path, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(dataclasses.asdict(state), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write incremental state for {wind_data_path}: {e}")
+
+    def _path(self, wind_data_path: str, key: str) -> str:
+        return os.path.join(self.directory or state_dir(wind_data_path), f"{key}.json")
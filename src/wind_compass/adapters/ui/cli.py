@@ -1,10 +1,12 @@
+import logging
+from dataclasses import replace
 import click
-from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
-from wind_compass.adapters.ui.presenters import ConsolePresenter
-from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
-from wind_compass.adapters.data_readers import CsvWindDataReader, JsonConfigReader
-from wind_compass.domain.services import PowerGenerationSimulator
-from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, OptimizeAngleInputDTO, SIMULATION_ENGINES, ENGINE_EXACT, default_integration_rule
+from wind_compass.adapters.reader_options import WIND_FORMATS, WIND_FORMAT_AUTO, WIND_FORMAT_CSV, WIND_FORMAT_PARQUET, CSV_ENGINES, CSV_ENGINE_C
+from wind_compass.domain.constants import DEFAULT_SPEED_BIN_WIDTH, DEFAULT_DIRECTION_BIN_WIDTH, DEFAULT_COARSE_ANGLE_STEP_DEG, DEFAULT_ANGLE_TOLERANCE_DEG, DEFAULT_INTEGRATION_RULE, INTEGRATION_RULES, INTEGRATION_FIXED
+
+# numpy・pandas・tabulate に依存するリーダ・ユースケース・プレゼンタはコマンドの実行時に組み立てる
+# （--help や引数エラーの表示で重い依存を読み込まないため、ここではインポートしない）
 
 
 def parse_float_list(ctx, param, value):
@@ -18,35 +20,313 @@ def parse_float_list(ctx, param, value):
     return sorted(set(result))
 
 
+class DefaultCommandGroup(click.Group):
+    """
+    サブコマンド名が指定されない場合に既定のコマンドを実行するグループ。
+    従来の `main.py --wind-data ... --angles ...` 形式の呼び出しを simulate として扱う。
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._default_command = default_command
+
+    def parse_args(self, ctx, args):
+        if not args or args[0] not in self.commands:
+            args = [self._default_command] + list(args)
+        return super().parse_args(ctx, args)
+
+
+def build_wind_reader():
+    """既定の風況データリーダ（CSV/Parquet の振り分け + サイドカーキャッシュ）を返す。"""
+    from wind_compass.adapters.data_readers import CsvWindDataReader, FormatSelectingWindDataReader
+    from wind_compass.adapters.parquet_reader import ParquetWindDataReader
+    from wind_compass.adapters.npy_sidecar import NpySidecarWindDataReader
+    return NpySidecarWindDataReader(FormatSelectingWindDataReader({
+        WIND_FORMAT_CSV: CsvWindDataReader(),
+        WIND_FORMAT_PARQUET: ParquetWindDataReader(),
+    }))
+
+
+def configure_wind_reader(wind_reader, wind_format: str, cache_enabled: bool, refresh_cache: bool, csv_engine: str = CSV_ENGINE_C, timestamp_format=None, verbose: bool = False):
+    # 既定のリーダ構成（サイドカー → 形式の振り分け → CSV/Parquet）の場合のみ、CLIオプションを反映する
+    from wind_compass.adapters.data_readers import CsvWindDataReader, FormatSelectingWindDataReader
+    from wind_compass.adapters.npy_sidecar import NpySidecarWindDataReader
+    if verbose:
+        # 解析速度(rows/sec)などの INFO ログを表示する
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if isinstance(wind_reader, NpySidecarWindDataReader):
+        wind_reader.enabled = cache_enabled
+        wind_reader.refresh = refresh_cache
+        wind_reader = wind_reader.reader
+    if isinstance(wind_reader, FormatSelectingWindDataReader):
+        wind_reader.wind_format = wind_format
+        wind_reader = wind_reader.readers.get(WIND_FORMAT_CSV)
+    if isinstance(wind_reader, CsvWindDataReader):
+        wind_reader.engine = csv_engine
+        wind_reader.timestamp_format = timestamp_format
+
+
+def run_profiled(run, profile=None, profile_stats=None):
+    """profile がある場合は計測を有効にして run を実行し、profile_stats があれば cProfile の結果を書き出す。"""
+    if profile is None:
+        return run()
+    with profile.activate():
+        if profile_stats is None:
+            return run()
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(run)
+        finally:
+            profiler.dump_stats(profile_stats)
+
+
 def get_simulate_command(
     wind_reader=None,
     config_reader=None,
     simulator_factory=None,
     single_uc=None,
     multi_uc=None,
-    presenter=None
+    presenter=None,
+    state_store=None,
+    result_cache=None
 ):
-    wind_reader = wind_reader or CsvWindDataReader()
-    config_reader = config_reader or JsonConfigReader()
-    simulator_factory = simulator_factory or (
-        lambda model: PowerGenerationSimulator(model))
-    single_uc = single_uc or RunSingleSimulationScenarioUseCase(
-        wind_data_reader=wind_reader,
-        power_plant_model_reader=config_reader,
-        power_generation_simulator_factory=simulator_factory
-    )
-    multi_uc = multi_uc or RunMultipleSimulationScenariosUseCase(single_uc)
-    presenter = presenter or ConsolePresenter()
-
-    @click.command()
-    @click.option('--wind-data', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to wind data CSV file.")
+    components = {}
+
+    def build_components(profile=None):
+        # 初回の実行時に一度だけ組み立てる。計測する場合は計測用のラッパを挟んで毎回組み立てる
+        if components and profile is None:
+            return components
+        from wind_compass.adapters.data_readers import JsonConfigReader
+        from wind_compass.adapters.ui.presenters import ConsolePresenter
+        from wind_compass.domain.services import PowerGenerationSimulator
+        from wind_compass.use_cases.angle_sweep import RunAngleSweepUseCase
+        from wind_compass.adapters.result_cache import SqliteScenarioResultCache
+        from wind_compass.adapters.scenario_state_store import JsonScenarioStateStore
+        from wind_compass.use_cases.histogram_scenarios import RunHistogramScenariosUseCase
+        from wind_compass.use_cases.incremental import RunIncrementalScenariosUseCase
+        from wind_compass.use_cases.input_cache import InputCache
+        from wind_compass.use_cases.parallel_scenarios import RunParallelScenariosUseCase
+        from wind_compass.use_cases.parameter_sweep import RunParameterSweepUseCase
+        from wind_compass.use_cases.gear_matrix import RunGearMatrixUseCase
+        from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+        from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+        from wind_compass.use_cases import profiling
+        base_wind_reader = wind_reader or build_wind_reader()
+        source_wind_reader = base_wind_reader
+        source_config_reader = config_reader or JsonConfigReader()
+        factory = simulator_factory or (
+            lambda model: PowerGenerationSimulator(model))
+        if profile is not None:
+            source_wind_reader = profiling.ProfilingWindDataReader(source_wind_reader, profile)
+            source_config_reader = profiling.ProfilingPowerPlantModelReader(source_config_reader, profile)
+            if simulator_factory is None:
+                factory = lambda model: profiling.ProfilingPowerGenerationSimulator(model, profile)
+        # 角度ごとのシナリオで同じファイルを再パースしないよう、リーダは入力キャッシュ経由で共有する
+        input_cache = InputCache(source_wind_reader, source_config_reader)
+        cached_wind_reader = input_cache.wind_data_reader
+        cached_config_reader = input_cache.power_plant_model_reader
+        single = single_uc or RunSingleSimulationScenarioUseCase(
+            wind_data_reader=cached_wind_reader,
+            power_plant_model_reader=cached_config_reader,
+            power_generation_simulator_factory=factory
+        )
+        histogram = RunHistogramScenariosUseCase(
+            wind_data_reader=cached_wind_reader,
+            power_plant_model_reader=cached_config_reader,
+            power_generation_simulator_factory=factory
+        )
+        angle_sweep = RunAngleSweepUseCase(
+            wind_data_reader=cached_wind_reader,
+            power_plant_model_reader=cached_config_reader,
+            power_generation_simulator_factory=factory
+        )
+        # ワーカプロセスは既定の PowerGenerationSimulator で計算するため、シミュレータを差し替える場合
+        # （計測用を含む）はプロセス並列にしない（--workers を指定しても直列の角度スイープで計算する）
+        parallel = None
+        if simulator_factory is None and profile is None:
+            parallel = RunParallelScenariosUseCase(
+                wind_data_reader=cached_wind_reader,
+                power_plant_model_reader=cached_config_reader,
+                serial_use_case=angle_sweep
+            )
+        parameter_sweep = RunParameterSweepUseCase(
+            wind_data_reader=cached_wind_reader,
+            power_plant_model_reader=cached_config_reader,
+            power_generation_simulator_factory=factory
+        )
+        gear_matrix = RunGearMatrixUseCase(
+            wind_data_reader=cached_wind_reader,
+            power_plant_model_reader=cached_config_reader,
+            power_generation_simulator_factory=factory
+        )
+        scenario_state_store = state_store or components.get("state_store") or JsonScenarioStateStore()
+        scenario_result_cache = result_cache or components.get("result_cache") or SqliteScenarioResultCache()
+        incremental = RunIncrementalScenariosUseCase(
+            wind_data_reader=cached_wind_reader,
+            power_plant_model_reader=cached_config_reader,
+            power_generation_simulator_factory=factory,
+            state_store=scenario_state_store
+        )
+        if profile is not None:
+            # シミュレーションは角度ごと（全角度を一括で計算する場合はまとめて）に計測する
+            single = profiling.ProfiledUseCase(
+                single, profile, lambda dto: f"simulate angle={dto.angle:g}")
+            histogram = profiling.ProfiledUseCase(
+                histogram, profile, lambda dto: f"simulate {len(dto.angles)} angles (histogram)")
+            angle_sweep = profiling.ProfiledUseCase(
+                angle_sweep, profile, lambda dto: f"simulate {len(dto.angles)} angles (sweep)")
+            incremental = profiling.ProfiledUseCase(
+                incremental, profile, lambda dto: f"simulate {len(dto.angles)} angles (incremental)")
+            parameter_sweep = profiling.ProfiledUseCase(
+                parameter_sweep, profile, lambda dto: f"simulate {len(dto.angles)} angles (parameter sweep)")
+            gear_matrix = profiling.ProfiledUseCase(
+                gear_matrix, profile, lambda dto: f"simulate {len(dto.angles)} angles (gear matrix)")
+        built = dict(
+            base_wind_reader=base_wind_reader,
+            state_store=scenario_state_store,
+            result_cache=scenario_result_cache,
+            multi_uc=multi_uc or RunMultipleSimulationScenariosUseCase(
+                single,
+                histogram_use_case=histogram,
+                angle_sweep_use_case=angle_sweep,
+                input_cache=input_cache,
+                incremental_use_case=incremental,
+                result_cache=scenario_result_cache,
+                parallel_use_case=parallel
+            ),
+            parameter_sweep_uc=parameter_sweep,
+            gear_matrix_uc=gear_matrix,
+            presenter=presenter or ConsolePresenter(),
+        )
+        if profile is None:
+            components.update(built)
+        return built
+
+    @click.command(epilog="Other commands: optimize-angle, batch (see '<command> --help').")
+    @click.option('--wind-data', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to wind data file (CSV or Parquet).")
     @click.option('--config-file', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to power plant model JSON config file.")
     @click.option('--angles', multiple=True, callback=parse_float_list, type=str, required=True, help="List of turbine angles (deg), e.g. --angles 0 --angles 90 or --angles 0,90")
     @click.option('--efficiency', type=float, default=None, help="Efficiency (optional)")
     @click.option('--voltage', type=float, default=None, help="Voltage (optional)")
     @click.option('--cut-in-rpm', type=float, default=None, help="Cut-in RPM (optional)")
-    def simulate(wind_data, config_file, angles, efficiency, voltage, cut_in_rpm):
+    @click.option('--efficiencies', multiple=True, callback=parse_float_list, type=str, help="Sweep these efficiencies (e.g. 0.8,0.9). Any of --efficiencies/--voltages/--cut-in-rpms reports every angle x efficiency x voltage x cut-in combination, solving the rpm once per angle and efficiency.")
+    @click.option('--voltages', multiple=True, callback=parse_float_list, type=str, help="Sweep these voltages (V). Defaults to --voltage in a parameter sweep.")
+    @click.option('--cut-in-rpms', multiple=True, callback=parse_float_list, type=str, help="Sweep these cut-in RPMs. Defaults to --cut-in-rpm in a parameter sweep.")
+    @click.option('--gear-ratios', multiple=True, callback=parse_float_list, type=str, help="Gear ratios (generator RPM / rotor RPM), e.g. 3,5. Reports the angle x gear ratio matrix computed in one pass; the config must define rotor_speed_curve.")
+    @click.option('--output-csv', type=click.Path(dir_okay=False, writable=True), default=None, help="With --gear-ratios, also write the angle x gear ratio matrix (kWh) to this CSV file.")
+    @click.option('--engine', type=click.Choice(SIMULATION_ENGINES), default=ENGINE_EXACT, show_default=True, help="Simulation engine. 'table' interpolates a precomputed effective-wind-speed -> power table; 'histogram' evaluates angles over a (speed, direction) histogram.")
+    @click.option('--speed-bin-width', type=float, default=DEFAULT_SPEED_BIN_WIDTH, show_default=True, help="Wind speed bin width (m/s) for --engine histogram.")
+    @click.option('--direction-bin-width', type=float, default=DEFAULT_DIRECTION_BIN_WIDTH, show_default=True, help="Wind direction bin width (deg) for --engine histogram.")
+    @click.option('--compare-exact', is_flag=True, default=False, help="With --engine histogram, also run the exact row-wise integration with the same integration rule and report the difference.")
+    @click.option('--chunk-size', type=click.IntRange(min=1), default=None, help="Stream the wind data CSV in chunks of this many rows to bound memory (exact/table engines).")
+    @click.option('--integration', type=click.Choice(INTEGRATION_RULES), default=None, help="Energy integration rule: 'fixed' (every reading x 10 min), 'left' (interval start power x dt) or 'trapezoid'. Defaults to 'fixed' for exact/table and 'left' for histogram; the rule used is printed with the results.")
+    @click.option('--max-gap-minutes', type=click.FloatRange(min=0, min_open=True), default=None, help="Cap each interval between readings at this many minutes so data outages don't inflate energy. Only for the left/trapezoid rules; rejected with 'fixed' (the exact/table default).")
+    @click.option('--workers', type=click.IntRange(min=1), default=1, show_default=True, help="Worker processes for the exact engine over multiple angles. Wind arrays are shared with the workers via shared memory; small inputs run serially.")
+    @click.option('--threads', type=click.IntRange(min=1), default=1, show_default=True, help="Threads integrating fixed-size row chunks of each single-angle run (exact/table engines without --chunk-size). Results do not depend on the thread count.")
+    @click.option('--incremental', is_flag=True, default=False, help="Persist per-scenario accumulators and, on later runs, simulate only readings appended since the last run (exact engine). Falls back to a full recompute when earlier data changed.")
+    @click.option('--state-dir', type=click.Path(file_okay=False, writable=True), default=None, help="Directory for --incremental accumulators. Defaults to <wind-data>.wstate next to the wind data file.")
+    @click.option('--cache/--no-cache', 'result_cache_enabled', default=True, show_default=True, help="Reuse scenario results keyed by the wind data and config contents, the parameters and the engine version; only angles that miss are simulated.")
+    @click.option('--cache-dir', type=click.Path(file_okay=False, writable=True), default=None, help="Directory of the result cache. Defaults to $XDG_CACHE_HOME/wind_compass (~/.cache/wind_compass).")
+    @click.option('--wind-format', type=click.Choice(WIND_FORMATS), default=WIND_FORMAT_AUTO, show_default=True, help="Wind data file format. 'auto' selects by extension (.parquet/.pq -> parquet, otherwise csv).")
+    @click.option('--wind-cache/--no-wind-cache', default=True, show_default=True, help="Cache parsed wind data as memory-mapped .npy columns next to the CSV (<file>.wcache) and reuse them on later runs.")
+    @click.option('--refresh-wind-cache', is_flag=True, default=False, help="Rebuild the wind data cache even if it looks up to date.")
+    @click.option('--csv-engine', type=click.Choice(CSV_ENGINES), default=CSV_ENGINE_C, show_default=True, help="CSV parser. 'pyarrow' is much faster on large files (requires pyarrow; chunked reads always use 'c').")
+    @click.option('--timestamp-format', type=str, default=None, help="strptime format of observed_at, e.g. '%Y-%m-%d %H:%M:%S'. Auto-detected from the first row if omitted.")
+    @click.option('--verbose', is_flag=True, default=False, help="Log progress details such as CSV parse throughput (rows/sec).")
+    @click.option('--profile', 'profile_enabled', is_flag=True, default=False, help="Report wall time per stage (read wind, read config, simulate per angle, present) and hot-path counters on stderr.")
+    @click.option('--profile-stats', type=click.Path(dir_okay=False, writable=True), default=None, help="Also run under cProfile and dump the stats to this file (implies --profile; inspect with python -m pstats).")
+    def simulate(wind_data, config_file, angles, efficiency, voltage, cut_in_rpm, efficiencies, voltages, cut_in_rpms, gear_ratios, output_csv, engine, speed_bin_width, direction_bin_width, compare_exact, chunk_size, integration, max_gap_minutes, workers, threads, incremental, state_dir, result_cache_enabled, cache_dir, wind_format, wind_cache, refresh_wind_cache, csv_engine, timestamp_format, verbose, profile_enabled, profile_stats):
         """Simulate wind power generation for multiple scenarios."""
+        if incremental and (engine != ENGINE_EXACT or chunk_size is not None):
+            raise click.UsageError("--incremental supports only --engine exact without --chunk-size.")
+        sweep_parameters = bool(efficiencies or voltages or cut_in_rpms)
+        if sweep_parameters and (engine != ENGINE_EXACT or chunk_size is not None or incremental):
+            raise click.UsageError(
+                "--efficiencies/--voltages/--cut-in-rpms support only --engine exact without --chunk-size or --incremental.")
+        if gear_ratios and (engine != ENGINE_EXACT or chunk_size is not None or incremental or sweep_parameters):
+            raise click.UsageError(
+                "--gear-ratios supports only --engine exact without --chunk-size, --incremental or a parameter sweep.")
+        if output_csv and not gear_ratios:
+            raise click.UsageError("--output-csv requires --gear-ratios.")
+        # 既定の積分方式はエンジンによって異なるため、実際に使う方式を結果に添えて表示する
+        integration_rule = integration or default_integration_rule(engine)
+        if max_gap_minutes is not None and integration_rule == INTEGRATION_FIXED:
+            raise click.UsageError(
+                "--max-gap-minutes has no effect with the 'fixed' integration rule; use --integration left or trapezoid.")
+        profile = None
+        if profile_enabled or profile_stats:
+            from wind_compass.use_cases.profiling import RunProfile
+            profile = RunProfile()
+        built = build_components(profile)
+        configure_wind_reader(built["base_wind_reader"], wind_format, wind_cache, refresh_wind_cache, csv_engine, timestamp_format, verbose)
+        if hasattr(built["state_store"], "directory"):
+            built["state_store"].directory = state_dir
+        built["result_cache"].enabled = result_cache_enabled
+        if hasattr(built["result_cache"], "directory"):
+            built["result_cache"].directory = cache_dir
+        if gear_ratios:
+            from wind_compass.use_cases.dtos import GearMatrixInputDTO
+            gear_dto = GearMatrixInputDTO(
+                wind_data_path=wind_data,
+                config_file_path=config_file,
+                angles=angles,
+                gear_ratios=gear_ratios,
+                efficiency=efficiency,
+                voltage=voltage,
+                cut_in_rpm=cut_in_rpm,
+                integration_rule=integration,
+                max_gap_hours=max_gap_minutes / 60.0 if max_gap_minutes is not None else None,
+            )
+            gear_results = []
+
+            def run_gear_matrix():
+                from wind_compass.use_cases.profiling import STAGE_PRESENT, profile_stage
+                try:
+                    gear_results.extend(built["gear_matrix_uc"].execute(gear_dto))
+                except Exception as e:
+                    raise click.ClickException(str(e))
+                with profile_stage(profile, STAGE_PRESENT):
+                    return built["presenter"].present_gear_matrix(gear_results, integration_rule)
+
+            click.echo(run_profiled(run_gear_matrix, profile, profile_stats))
+            if output_csv:
+                from wind_compass.adapters.csv_presenter import CsvPresenter, PresenterError
+                from wind_compass.adapters.ui.presenters import gear_matrix_table
+                try:
+                    CsvPresenter(output_csv).present(*gear_matrix_table(gear_results))
+                except PresenterError as e:
+                    click.echo(f"Failed to write CSV: {e}", err=True)
+                    raise SystemExit(1)
+            if profile is not None:
+                click.echo(built["presenter"].present_profile(profile.report()), err=True)
+            return
+        if sweep_parameters:
+            from wind_compass.use_cases.dtos import ParameterSweepInputDTO
+            sweep_dto = ParameterSweepInputDTO(
+                wind_data_path=wind_data,
+                config_file_path=config_file,
+                angles=angles,
+                efficiencies=efficiencies or ([efficiency] if efficiency is not None else []),
+                voltages=voltages or ([voltage] if voltage is not None else []),
+                cut_in_rpms=cut_in_rpms or ([cut_in_rpm] if cut_in_rpm is not None else []),
+                integration_rule=integration,
+                max_gap_hours=max_gap_minutes / 60.0 if max_gap_minutes is not None else None,
+            )
+
+            def run_sweep():
+                from wind_compass.use_cases.profiling import STAGE_PRESENT, profile_stage
+                try:
+                    results = built["parameter_sweep_uc"].execute(sweep_dto)
+                except Exception as e:
+                    raise click.ClickException(str(e))
+                with profile_stage(profile, STAGE_PRESENT):
+                    return built["presenter"].present_parameter_sweep(results, integration_rule)
+
+            click.echo(run_profiled(run_sweep, profile, profile_stats))
+            if profile is not None:
+                click.echo(built["presenter"].present_profile(profile.report()), err=True)
+            return
         input_dto = MultipleScenariosInputDTO(
             wind_data_path=wind_data,
             config_file_path=config_file,
@@ -54,12 +334,206 @@ def get_simulate_command(
             efficiency=efficiency,
             voltage=voltage,
             cut_in_rpm=cut_in_rpm,
+            engine=engine,
+            speed_bin_width=speed_bin_width,
+            direction_bin_width=direction_bin_width,
+            compare_exact=compare_exact,
+            chunk_size=chunk_size,
+            integration_rule=integration,
+            max_gap_hours=max_gap_minutes / 60.0 if max_gap_minutes is not None else None,
+            incremental=incremental,
+            workers=workers,
+            threads=threads,
         )
-        results = multi_uc.execute(input_dto)
-        click.echo(presenter.present_multiple_scenarios(
-            results, angles))
+
+        def run():
+            from wind_compass.use_cases.profiling import STAGE_PRESENT, profile_stage
+            results = built["multi_uc"].execute(input_dto)
+            with profile_stage(profile, STAGE_PRESENT):
+                return built["presenter"].present_multiple_scenarios(results, angles, integration_rule)
+
+        click.echo(run_profiled(run, profile, profile_stats))
+        if profile is not None:
+            click.echo(built["presenter"].present_profile(profile.report()), err=True)
     return simulate
 
 
+def get_optimize_angle_command(
+    wind_reader=None,
+    config_reader=None,
+    simulator_factory=None,
+    optimize_uc=None,
+    presenter=None
+):
+    components = {}
+
+    def build_components():
+        # 初回の実行時に一度だけ組み立てる
+        if components:
+            return components
+        from wind_compass.adapters.data_readers import JsonConfigReader
+        from wind_compass.adapters.ui.presenters import ConsolePresenter
+        from wind_compass.domain.services import PowerGenerationSimulator
+        from wind_compass.use_cases.optimize_angle import OptimizeTurbineAngleUseCase
+        base_wind_reader = wind_reader or build_wind_reader()
+        factory = simulator_factory or (
+            lambda model: PowerGenerationSimulator(model))
+        components.update(
+            base_wind_reader=base_wind_reader,
+            optimize_uc=optimize_uc or OptimizeTurbineAngleUseCase(
+                wind_data_reader=base_wind_reader,
+                power_plant_model_reader=config_reader or JsonConfigReader(),
+                power_generation_simulator_factory=factory
+            ),
+            presenter=presenter or ConsolePresenter(),
+        )
+        return components
+
+    @click.command(name="optimize-angle")
+    @click.option('--wind-data', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to wind data file (CSV or Parquet).")
+    @click.option('--config-file', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to power plant model JSON config file.")
+    @click.option('--efficiency', type=float, default=None, help="Efficiency (optional)")
+    @click.option('--voltage', type=float, default=None, help="Voltage (optional)")
+    @click.option('--cut-in-rpm', type=float, default=None, help="Cut-in RPM (optional)")
+    @click.option('--coarse-step', type=float, default=DEFAULT_COARSE_ANGLE_STEP_DEG, show_default=True, help="Step (deg) of the coarse sweep over 0-360 deg.")
+    @click.option('--tolerance', type=float, default=DEFAULT_ANGLE_TOLERANCE_DEG, show_default=True, help="Angle resolution (deg) of the local refinement.")
+    @click.option('--integration', type=click.Choice(INTEGRATION_RULES), default=None, help="Energy integration rule: 'fixed' (every reading x 10 min, the default), 'left' (interval start power x dt) or 'trapezoid'.")
+    @click.option('--max-gap-minutes', type=click.FloatRange(min=0, min_open=True), default=None, help="Cap each interval between readings at this many minutes. Only for the left/trapezoid rules.")
+    @click.option('--wind-format', type=click.Choice(WIND_FORMATS), default=WIND_FORMAT_AUTO, show_default=True, help="Wind data file format. 'auto' selects by extension (.parquet/.pq -> parquet, otherwise csv).")
+    @click.option('--wind-cache/--no-wind-cache', default=True, show_default=True, help="Cache parsed wind data as memory-mapped .npy columns next to the CSV (<file>.wcache) and reuse them on later runs.")
+    @click.option('--refresh-wind-cache', is_flag=True, default=False, help="Rebuild the wind data cache even if it looks up to date.")
+    @click.option('--csv-engine', type=click.Choice(CSV_ENGINES), default=CSV_ENGINE_C, show_default=True, help="CSV parser. 'pyarrow' is much faster on large files (requires pyarrow; chunked reads always use 'c').")
+    @click.option('--timestamp-format', type=str, default=None, help="strptime format of observed_at, e.g. '%Y-%m-%d %H:%M:%S'. Auto-detected from the first row if omitted.")
+    @click.option('--verbose', is_flag=True, default=False, help="Log progress details such as CSV parse throughput (rows/sec).")
+    def optimize_angle(wind_data, config_file, efficiency, voltage, cut_in_rpm, coarse_step, tolerance, integration, max_gap_minutes, wind_format, wind_cache, refresh_wind_cache, csv_engine, timestamp_format, verbose):
+        """Find the turbine angle that maximizes annual power generation."""
+        if max_gap_minutes is not None and (integration or DEFAULT_INTEGRATION_RULE) == INTEGRATION_FIXED:
+            raise click.UsageError(
+                "--max-gap-minutes has no effect with the 'fixed' integration rule; use --integration left or trapezoid.")
+        built = build_components()
+        configure_wind_reader(built["base_wind_reader"], wind_format, wind_cache, refresh_wind_cache, csv_engine, timestamp_format, verbose)
+        input_dto = OptimizeAngleInputDTO(
+            wind_data_path=wind_data,
+            config_file_path=config_file,
+            efficiency=efficiency,
+            voltage=voltage,
+            cut_in_rpm=cut_in_rpm,
+            coarse_step_deg=coarse_step,
+            tolerance_deg=tolerance,
+            integration_rule=integration,
+            max_gap_hours=max_gap_minutes / 60.0 if max_gap_minutes is not None else None,
+        )
+        output = built["optimize_uc"].execute(input_dto)
+        click.echo(built["presenter"].present_angle_optimization(output))
+        if output.error_message is not None:
+            raise SystemExit(1)
+    return optimize_angle
+
+
+def get_batch_command(
+    wind_reader=None,
+    config_reader=None,
+    simulator_factory=None,
+    presenter=None,
+    result_cache=None
+):
+    components = {}
+
+    def build_components():
+        # 初回の実行時に一度だけ組み立てる
+        if components:
+            return components
+        from wind_compass.adapters.batch_manifest import BatchManifestReader
+        from wind_compass.adapters.data_readers import JsonConfigReader
+        from wind_compass.adapters.result_cache import SqliteScenarioResultCache
+        from wind_compass.adapters.ui.presenters import ConsolePresenter
+        from wind_compass.domain.services import PowerGenerationSimulator
+        from wind_compass.use_cases.angle_sweep import RunAngleSweepUseCase
+        from wind_compass.use_cases.batch import RunBatchUseCase
+        from wind_compass.use_cases.histogram_scenarios import RunHistogramScenariosUseCase
+        from wind_compass.use_cases.input_cache import InputCache
+        from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+        from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+        base_wind_reader = wind_reader or build_wind_reader()
+        factory = simulator_factory or (
+            lambda model: PowerGenerationSimulator(model))
+        # 全タスクで入力キャッシュを共有し、各ファイルを1回だけ読み込む
+        input_cache = InputCache(base_wind_reader, config_reader or JsonConfigReader())
+        readers = dict(
+            wind_data_reader=input_cache.wind_data_reader,
+            power_plant_model_reader=input_cache.power_plant_model_reader,
+            power_generation_simulator_factory=factory,
+        )
+        scenario_result_cache = result_cache or SqliteScenarioResultCache()
+        multi = RunMultipleSimulationScenariosUseCase(
+            RunSingleSimulationScenarioUseCase(**readers),
+            histogram_use_case=RunHistogramScenariosUseCase(**readers),
+            angle_sweep_use_case=RunAngleSweepUseCase(**readers),
+            input_cache=input_cache,
+            result_cache=scenario_result_cache
+        )
+        components.update(
+            base_wind_reader=base_wind_reader,
+            result_cache=scenario_result_cache,
+            manifest_reader=BatchManifestReader(),
+            batch_uc=RunBatchUseCase(multi, input_cache),
+            presenter=presenter or ConsolePresenter(),
+        )
+        return components
+
+    @click.command(name="batch")
+    @click.argument('manifest', type=click.Path(exists=True, dir_okay=False, readable=True))
+    @click.option('--workers', type=click.IntRange(min=1), default=None, help="Number of tasks run concurrently. Overrides 'workers' in the manifest; defaults to the CPU count.")
+    @click.option('--output-csv', type=click.Path(dir_okay=False, writable=True), default=None, help="Also write the consolidated result table to this CSV file.")
+    @click.option('--cache/--no-cache', 'result_cache_enabled', default=True, show_default=True, help="Reuse scenario results keyed by the wind data and config contents, the parameters and the engine version.")
+    @click.option('--cache-dir', type=click.Path(file_okay=False, writable=True), default=None, help="Directory of the result cache. Defaults to $XDG_CACHE_HOME/wind_compass (~/.cache/wind_compass).")
+    @click.option('--wind-format', type=click.Choice(WIND_FORMATS), default=WIND_FORMAT_AUTO, show_default=True, help="Wind data file format. 'auto' selects by extension (.parquet/.pq -> parquet, otherwise csv).")
+    @click.option('--wind-cache/--no-wind-cache', default=True, show_default=True, help="Cache parsed wind data as memory-mapped .npy columns next to the CSV (<file>.wcache) and reuse them on later runs.")
+    @click.option('--csv-engine', type=click.Choice(CSV_ENGINES), default=CSV_ENGINE_C, show_default=True, help="CSV parser. 'pyarrow' is much faster on large files (requires pyarrow).")
+    @click.option('--verbose', is_flag=True, default=False, help="Log progress details such as CSV parse throughput (rows/sec).")
+    def batch(manifest, workers, output_csv, result_cache_enabled, cache_dir, wind_format, wind_cache, csv_engine, verbose):
+        """Run every wind data x config x parameter set in a JSON/YAML MANIFEST at all of its angles.
+
+        Failed tasks are reported per row; the exit status is 1 if any scenario failed."""
+        built = build_components()
+        configure_wind_reader(built["base_wind_reader"], wind_format, wind_cache, False, csv_engine, None, verbose)
+        built["result_cache"].enabled = result_cache_enabled
+        if hasattr(built["result_cache"], "directory"):
+            built["result_cache"].directory = cache_dir
+        try:
+            input_dto = built["manifest_reader"].read(manifest)
+        except (ValueError, ImportError) as e:
+            raise click.UsageError(f"Invalid batch manifest: {e}")
+        if workers is not None:
+            input_dto = replace(input_dto, workers=workers)
+        results = built["batch_uc"].execute(input_dto)
+        click.echo(built["presenter"].present_batch(results))
+        if output_csv:
+            from wind_compass.adapters.csv_presenter import CsvPresenter, PresenterError
+            try:
+                CsvPresenter(output_csv).present_rows(
+                    ["wind_data", "config_file", "parameter_set", "angle", "annual_power_kwh", "error"],
+                    [[r.wind_data_path, r.config_file_path, r.parameter_set, r.angle,
+                      r.annual_power_kwh if r.annual_power_kwh is not None else "", r.error_message or ""]
+                     for r in results])
+            except PresenterError as e:
+                click.echo(f"Failed to write CSV: {e}", err=True)
+                raise SystemExit(1)
+        if any(r.error_message is not None for r in results):
+            raise SystemExit(1)
+    return batch
+
+
+def get_cli(wind_reader=None, config_reader=None, simulator_factory=None, presenter=None):
+    """simulate（既定）・optimize-angle・batch をまとめたコマンドグループを返す。"""
+    components = dict(wind_reader=wind_reader, config_reader=config_reader,
+                      simulator_factory=simulator_factory, presenter=presenter)
+    cli = DefaultCommandGroup(default_command="simulate")
+    cli.add_command(get_simulate_command(**components), name="simulate")
+    cli.add_command(get_optimize_angle_command(**components), name="optimize-angle")
+    cli.add_command(get_batch_command(**components), name="batch")
+    return cli
+
+
 # 後方互換のため従来のsimulateも残す
 simulate = get_simulate_command()
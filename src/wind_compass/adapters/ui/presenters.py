@@ -1,17 +1,47 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from tabulate import tabulate
-from wind_compass.use_cases.dtos import ScenarioResult
+from wind_compass.use_cases.dtos import ScenarioResult, OptimizeAngleOutputDTO, BatchResult, ParameterSweepResult, GearMatrixResult
+from wind_compass.use_cases.profiling import ProfileReport
+
+
+def gear_matrix_table(results: List[GearMatrixResult]) -> Tuple[Dict[str, Dict[str, float]], List[str], List[str]]:
+    """
+    角度 × 増速比の結果を CsvPresenter.present の形式（{行ラベル: {列ラベル: kWh}}, 行ラベル, 列ラベル）に並べる。
+    行は "Angle <角度>"、列は "Gear <増速比>"（いずれも結果に現れた順）。
+    """
+    matrix_data: Dict[str, Dict[str, float]] = {}
+    row_labels: List[str] = []
+    col_labels: List[str] = []
+    for r in results:
+        row, col = f"Angle {r.angle:g}", f"Gear {r.gear_ratio:g}"
+        if row not in matrix_data:
+            matrix_data[row] = {}
+            row_labels.append(row)
+        if col not in col_labels:
+            col_labels.append(col)
+        matrix_data[row][col] = r.annual_power_kwh
+    return matrix_data, row_labels, col_labels
+
+
+def _integration_rule_line(integration_rule: Optional[str]) -> str:
+    """結果の表に添える積分方式の行（エンジンごとに既定の積分方式が異なるため明示する）"""
+    return f"\nIntegration rule: {integration_rule}" if integration_rule else ""
 
 
 class ConsolePresenter:
-    def present_multiple_scenarios(self, results: List[ScenarioResult], angles: List[float]) -> str:
+    def present_multiple_scenarios(self, results: List[ScenarioResult], angles: List[float],
+                                   integration_rule: Optional[str] = None) -> str:
         if not results:
             return "No simulation results to present."
         # angle -> annual_power_kwh or error
         results_map = {
             r.angle: r.annual_power_kwh if r.error_message is None else f"Error: {r.error_message[:20]}" for r in results}
+        differences = {
+            r.angle: r.exact_energy_difference_kwh for r in results if r.exact_energy_difference_kwh is not None}
         table_data = []
         header = ["Angle (deg)", "Annual Power (kWh)"]
+        if differences:
+            header.append("Diff vs Exact (kWh)")
         table_data.append(header)
         for angle in sorted(set(angles)):
             val = results_map.get(angle, "N/A")
@@ -19,5 +49,86 @@ class ConsolePresenter:
                 row = [f"{angle:.2f}", f"{val:.2f} kWh"]
             else:
                 row = [f"{angle:.2f}", str(val)]
+            if differences:
+                diff = differences.get(angle)
+                row.append(f"{diff:+.3g} kWh" if diff is not None else "")
             table_data.append(row)
-        return tabulate(table_data, headers="firstrow", tablefmt="grid")
+        output = tabulate(table_data, headers="firstrow", tablefmt="grid")
+        errors = [
+            r.max_interpolation_error_w for r in results if r.max_interpolation_error_w is not None]
+        if errors:
+            output += f"\nTransfer table max interpolation error: {max(errors):.3g} W"
+        if results[0].input_cache_hits is not None:
+            output += f"\nInput cache: {results[0].input_cache_hits} hits, {results[0].input_cache_misses} misses"
+        cache_hits = [r.result_cache_hit for r in results if r.result_cache_hit is not None]
+        if cache_hits:
+            output += f"\nResult cache: {sum(cache_hits)} hits, {len(cache_hits) - sum(cache_hits)} misses"
+        return output + _integration_rule_line(integration_rule)
+
+    def present_batch(self, results: List[BatchResult]) -> str:
+        if not results:
+            return "No batch results to present."
+        table_data = [["Wind data", "Config", "Parameters", "Angle (deg)", "Annual Power (kWh)"]]
+        for r in results:
+            value = f"{r.annual_power_kwh:.2f} kWh" if r.error_message is None else f"Error: {r.error_message[:40]}"
+            table_data.append([r.wind_data_path, r.config_file_path, r.parameter_set, f"{r.angle:.2f}", value])
+        output = tabulate(table_data, headers="firstrow", tablefmt="grid", disable_numparse=True)
+        failed = sum(1 for r in results if r.error_message is not None)
+        output += f"\n{len(results) - failed} of {len(results)} scenarios succeeded"
+        return output
+
+    def present_parameter_sweep(self, results: List[ParameterSweepResult], integration_rule: Optional[str] = None) -> str:
+        if not results:
+            return "No parameter sweep results to present."
+        table_data = [["Angle (deg)", "Efficiency", "Voltage (V)", "Cut-in (rpm)", "Annual Power (kWh)"]]
+        for r in results:
+            table_data.append([f"{r.angle:.2f}", f"{r.efficiency:g}", f"{r.voltage:g}", f"{r.cut_in_rpm:g}",
+                               f"{r.annual_power_kwh:.2f} kWh"])
+        output = tabulate(table_data, headers="firstrow", tablefmt="grid", disable_numparse=True)
+        best = max(results, key=lambda r: r.annual_power_kwh)
+        output += (f"\nBest: {best.annual_power_kwh:.2f} kWh at angle {best.angle:.2f} deg, "
+                   f"efficiency {best.efficiency:g}, voltage {best.voltage:g} V, cut-in {best.cut_in_rpm:g} rpm")
+        return output + _integration_rule_line(integration_rule)
+
+    def present_gear_matrix(self, results: List[GearMatrixResult], integration_rule: Optional[str] = None) -> str:
+        if not results:
+            return "No gear matrix results to present."
+        matrix_data, row_labels, col_labels = gear_matrix_table(results)
+        table_data = [["Annual Power (kWh)"] + col_labels]
+        for row in row_labels:
+            table_data.append([row] + [f"{matrix_data[row][col]:.2f}" for col in col_labels])
+        output = tabulate(table_data, headers="firstrow", tablefmt="grid", disable_numparse=True)
+        best = max(results, key=lambda r: r.annual_power_kwh)
+        output += f"\nBest: {best.annual_power_kwh:.2f} kWh at angle {best.angle:.2f} deg, gear ratio {best.gear_ratio:g}"
+        return output + _integration_rule_line(integration_rule)
+
+    def present_angle_optimization(self, output: OptimizeAngleOutputDTO) -> str:
+        if output.error_message is not None:
+            return f"Error: {output.error_message}"
+        table_data = [["Angle (deg)", "Annual Power (kWh)"]]
+        for r in output.coarse_curve:
+            table_data.append([f"{r.angle:.2f}", f"{r.annual_power_kwh:.2f} kWh"])
+        lines = [
+            f"Optimal angle: {output.optimal_angle:.2f} deg",
+            f"Annual power at optimum: {output.annual_power_kwh:.2f} kWh",
+            f"Energy evaluations: {output.evaluations}",
+            "",
+            "Coarse sweep:",
+            tabulate(table_data, headers="firstrow", tablefmt="grid"),
+        ]
+        return "\n".join(lines)
+
+    def present_profile(self, report: ProfileReport) -> str:
+        total = report.total_seconds
+        stage_rows = [["Stage", "Calls", "Time (s)", "Share"]]
+        for stage in report.stages:
+            share = stage.seconds / total if total > 0 else 0.0
+            stage_rows.append([stage.name, stage.calls, f"{stage.seconds:.4f}", f"{share:.1%}"])
+        stage_rows.append(["total", "", f"{total:.4f}", ""])
+        counter_rows = [["Counter", "Count"]]
+        counter_rows.extend([name, value] for name, value in report.counters.items())
+        return "\n".join([
+            "Profile:",
+            tabulate(stage_rows, headers="firstrow", tablefmt="grid", disable_numparse=True),
+            tabulate(counter_rows, headers="firstrow", tablefmt="grid"),
+        ])
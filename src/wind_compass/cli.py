@@ -1,27 +1,43 @@
 import click
 from wind_compass.adapters.csv_presenter import CsvPresenter, PresenterError
+from wind_compass.adapters.ui.cli import build_wind_reader, parse_float_list
 
 
-def dummy_run_simulation():
-    # ダミーデータ（本来はユースケースから取得）
-    matrix_data = {
-        'Angle 0': {'Gear 3': 100, 'Gear 5': 200},
-        'Angle 22.5': {'Gear 3': 150, 'Gear 5': 250}
-    }
-    row_labels = ['Angle 0', 'Angle 22.5']
-    col_labels = ['Gear 3', 'Gear 5']
-    return matrix_data, row_labels, col_labels
+def run_gear_matrix_simulation(wind_data, config_file, angles, gear_ratios, efficiency=None, voltage=None, cut_in_rpm=None):
+    """角度 × 増速比の年間発電量を計算し、(マトリクスデータ, 行ラベル, 列ラベル) を返す。"""
+    from wind_compass.adapters.data_readers import JsonConfigReader
+    from wind_compass.adapters.ui.presenters import gear_matrix_table
+    from wind_compass.domain.services import PowerGenerationSimulator
+    from wind_compass.use_cases.dtos import GearMatrixInputDTO
+    from wind_compass.use_cases.gear_matrix import RunGearMatrixUseCase
+    use_case = RunGearMatrixUseCase(build_wind_reader(), JsonConfigReader(), PowerGenerationSimulator)
+    results = use_case.execute(GearMatrixInputDTO(
+        wind_data_path=wind_data, config_file_path=config_file, angles=angles, gear_ratios=gear_ratios,
+        efficiency=efficiency, voltage=voltage, cut_in_rpm=cut_in_rpm))
+    return gear_matrix_table(results)
 
 
 @click.command()
+@click.option('--wind-data', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to wind data file (CSV or Parquet).")
+@click.option('--config-file', type=click.Path(exists=True, dir_okay=False, readable=True), required=True, help="Path to power plant model JSON config file (must define rotor_speed_curve).")
+@click.option('--angles', multiple=True, callback=parse_float_list, type=str, required=True, help="List of turbine angles (deg), e.g. --angles 0,90")
+@click.option('--gear-ratios', multiple=True, callback=parse_float_list, type=str, required=True, help="List of gear ratios, e.g. --gear-ratios 3,5")
+@click.option('--efficiency', type=float, default=None, help="Efficiency (optional)")
+@click.option('--voltage', type=float, default=None, help="Voltage (optional)")
+@click.option('--cut-in-rpm', type=float, default=None, help="Cut-in RPM (optional)")
 @click.option('--output-csv', type=click.Path(dir_okay=False, writable=True, resolve_path=True), default=None, help='シミュレーション結果をCSVファイルに出力します。例: --output-csv report.csv')
-def cli(output_csv):
+def cli(wind_data, config_file, angles, gear_ratios, efficiency, voltage, cut_in_rpm, output_csv):
     """
-    風力発電シミュレーションCLI（ダミー実装）
+    角度 × 増速比の年間発電量（kWh）のマトリクスを表示する風力発電シミュレーションCLI
     """
-    # 本来はユースケース呼び出し
-    matrix_data, row_labels, col_labels = dummy_run_simulation()
-    # 画面表示（省略）
+    try:
+        matrix_data, row_labels, col_labels = run_gear_matrix_simulation(
+            wind_data, config_file, angles, gear_ratios, efficiency, voltage, cut_in_rpm)
+    except Exception as e:
+        raise click.ClickException(str(e))
+    click.echo(",".join([""] + col_labels))
+    for r_label in row_labels:
+        click.echo(",".join([r_label] + [f"{matrix_data[r_label][c]:.2f}" for c in col_labels]))
     if output_csv:
         try:
             presenter = CsvPresenter(filepath=output_csv)
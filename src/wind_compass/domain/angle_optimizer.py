@@ -0,0 +1,101 @@
+import math
+from dataclasses import dataclass
+from typing import Callable
+import numpy
+from wind_compass.domain.constants import DEFAULT_COARSE_ANGLE_STEP_DEG, DEFAULT_ANGLE_TOLERANCE_DEG
+
+# 黄金分割比の逆数 (sqrt(5)-1)/2
+_INV_PHI = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+@dataclass(frozen=True)
+class AngleOptimizationResult:
+    """
+    最適角度探索の結果。
+
+    Args:
+        angle: エネルギーが最大となる角度 (deg, [0, 360))
+        energy: その角度でのエネルギー
+        coarse_angles: 粗いスイープの角度 (deg)
+        coarse_energies: 粗いスイープの各角度のエネルギー
+        evaluations: エネルギーを評価した角度の総数（粗いスイープを含む）
+    """
+    angle: float
+    energy: float
+    coarse_angles: numpy.ndarray
+    coarse_energies: numpy.ndarray
+    evaluations: int
+
+
+def _golden_section_maximize(energy_fn, lower: float, upper: float, tolerance: float):
+    # 区間 [lower, upper] 内の単峰な最大を、区間幅が tolerance 以下になるまで絞り込む。
+    # (最良の角度, エネルギー, 評価回数) を返す
+    def evaluate(angle):
+        return float(energy_fn(numpy.array([angle]))[0])
+
+    a, b = lower, upper
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc, fd = evaluate(c), evaluate(d)
+    evaluations = 2
+    while b - a > tolerance:
+        if fc >= fd:
+            b, d, fd = d, c, fc
+            c = b - _INV_PHI * (b - a)
+            fc = evaluate(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + _INV_PHI * (b - a)
+            fd = evaluate(d)
+        evaluations += 1
+    if fc >= fd:
+        return c, fc, evaluations
+    return d, fd, evaluations
+
+
+def find_optimal_angle(energy_fn: Callable[[numpy.ndarray], numpy.ndarray],
+                       coarse_step_deg: float = DEFAULT_COARSE_ANGLE_STEP_DEG,
+                       tolerance_deg: float = DEFAULT_ANGLE_TOLERANCE_DEG,
+                       candidates: int = 2) -> AngleOptimizationResult:
+    """
+    角度の配列からエネルギーの配列を返す energy_fn を最大化する角度を探す。
+
+    まず [0, 360) を coarse_step_deg 刻みで一括評価し、周期的な局所最大のうち
+    エネルギーの大きい上位 candidates 個について、前後1刻みの区間を黄金分割探索で
+    tolerance_deg まで絞り込む。エネルギーは角度について周期的かつ区分的に滑らかなため、
+    各候補は数十回以内の評価で収束する。
+    """
+    if coarse_step_deg <= 0 or tolerance_deg <= 0:
+        raise ValueError("coarse_step_deg and tolerance_deg must be positive")
+    count = max(int(math.ceil(360.0 / coarse_step_deg)), 3)
+    step = 360.0 / count
+    coarse_angles = numpy.arange(count) * step
+    coarse_energies = numpy.asarray(energy_fn(coarse_angles), dtype=float)
+    evaluations = count
+
+    # 周期境界を考慮した局所最大（平坦な区間は先頭の点のみ）
+    previous = numpy.roll(coarse_energies, 1)
+    following = numpy.roll(coarse_energies, -1)
+    peaks = numpy.flatnonzero(
+        (coarse_energies > previous) & (coarse_energies >= following))
+    if peaks.size == 0:
+        # 全角度で同じエネルギー（無風など）
+        peaks = numpy.array([int(numpy.argmax(coarse_energies))])
+    peaks = peaks[numpy.argsort(-coarse_energies[peaks], kind='stable')][:candidates]
+
+    best = int(numpy.argmax(coarse_energies))
+    best_angle, best_energy = float(coarse_angles[best]), float(coarse_energies[best])
+    for peak in peaks:
+        center = float(coarse_angles[peak])
+        angle, energy, used = _golden_section_maximize(
+            energy_fn, center - step, center + step, tolerance_deg)
+        evaluations += used
+        if energy > best_energy:
+            best_angle, best_energy = angle, energy
+    return AngleOptimizationResult(
+        angle=float(best_angle % 360.0),
+        energy=best_energy,
+        coarse_angles=coarse_angles,
+        coarse_energies=coarse_energies,
+        evaluations=evaluations,
+    )
@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+from wind_compass.domain.models import PowerPlantModel, horner
+from wind_compass.domain.rpm_solver import shaft_power_coeffs, monotone_breakpoints
+from wind_compass.domain.constants import MAX_GENERATOR_RPM
+
+
+@lru_cache(maxsize=32)
+def shaft_power_coeffs_for(torque_coeffs: Tuple[float, ...]) -> Tuple[float, ...]:
+    """トルクカーブ係数から回転数(rpm)→軸動力(W)の係数を求める（係数ごとにキャッシュ）"""
+    return tuple(float(c) for c in shaft_power_coeffs(list(torque_coeffs)))
+
+
+@lru_cache(maxsize=32)
+def rpm_breakpoints_for(power_coeffs: Tuple[float, ...]) -> Tuple[float, ...]:
+    """軸動力の係数から (0, MAX_GENERATOR_RPM] の単調区間の境界点を求める（係数ごとにキャッシュ）"""
+    return tuple(float(b) for b in monotone_breakpoints(list(power_coeffs), MAX_GENERATOR_RPM))
+
+
+@dataclass(frozen=True)
+class CompiledPowerPlantModel:
+    """
+    PowerPlantModel から、モデルのみに依存する係数を事前計算したもの。
+    コンフィグ1つにつき1回構築し、各評価関数はスカラー・配列の両方を受け付ける。
+
+    Args:
+        power_coeffs: 風車パワーカーブ係数 (m/s -> W, 降べき順)
+        torque_coeffs: 発電機トルクカーブ係数 (krpm -> Nm, 降べき順)
+        current_coeffs: 発電機電流カーブ係数 (krpm -> A, 降べき順)
+        shaft_power_coeffs: 回転数 -> 軸動力の係数 (rpm -> W, 降べき順, 2pi/60 込み)
+        rpm_breakpoints: 軸動力多項式を単調区間に分割する (0, MAX_GENERATOR_RPM] の境界点
+        rotor_speed_coeffs: 風車回転数カーブ係数 (m/s -> rpm, 降べき順)。コンフィグに無い場合は None
+    """
+    power_coeffs: Tuple[float, ...]
+    torque_coeffs: Tuple[float, ...]
+    current_coeffs: Tuple[float, ...]
+    shaft_power_coeffs: Tuple[float, ...]
+    rpm_breakpoints: Tuple[float, ...]
+    rotor_speed_coeffs: Optional[Tuple[float, ...]] = None
+
+    @classmethod
+    def from_model(cls, model: PowerPlantModel) -> 'CompiledPowerPlantModel':
+        torque_coeffs = tuple(float(c) for c in model.torque_curve.coeffs)
+        power_coeffs = shaft_power_coeffs_for(torque_coeffs)
+        return cls(
+            power_coeffs=tuple(float(c) for c in model.power_curve.coeffs),
+            torque_coeffs=torque_coeffs,
+            current_coeffs=tuple(float(c)
+                                 for c in model.current_curve.coeffs),
+            shaft_power_coeffs=power_coeffs,
+            rpm_breakpoints=rpm_breakpoints_for(power_coeffs),
+            rotor_speed_coeffs=(tuple(float(c) for c in model.rotor_speed_curve.coeffs)
+                                if model.rotor_speed_curve is not None else None),
+        )
+
+    def turbine_power(self, effective_wind_speed):
+        return horner(self.power_coeffs, effective_wind_speed)
+
+    def shaft_power(self, rpm):
+        return horner(self.shaft_power_coeffs, rpm)
+
+    def current(self, rpm):
+        return horner(self.current_coeffs, rpm / 1000)
+
+    def rotor_speed(self, effective_wind_speed):
+        if self.rotor_speed_coeffs is None:
+            raise ValueError("Gear ratio requires 'rotor_speed_curve' in the power plant config")
+        return horner(self.rotor_speed_coeffs, effective_wind_speed)
@@ -4,3 +4,48 @@ RPM_TO_RAD_PER_SEC = TWO_PI / 60.0
 
 # 年間発電量計算時のデフォルト時間間隔（10分=1/6時間）
 DEFAULT_TIME_INTERVAL_HOURS = 1.0 / 6.0  # プロジェクト定義より10分間隔データ前提
+
+# 年間発電量の積分方式: fixed=全データ点に固定のΔt, left=区間の始点の電力×Δt（左矩形）,
+# trapezoid=区間の両端の電力の平均×Δt（台形）
+INTEGRATION_FIXED = "fixed"
+INTEGRATION_LEFT = "left"
+INTEGRATION_TRAPEZOID = "trapezoid"
+INTEGRATION_RULES = (INTEGRATION_FIXED, INTEGRATION_LEFT, INTEGRATION_TRAPEZOID)
+# 積分方式の既定値: データ点ごとに積算するエンジン（exact/table）は従来どおり固定の10分間隔、
+# observed_at の差分を時間重みとするもの（histogram エンジン・時刻ベースの単一シナリオ）は左矩形
+DEFAULT_INTEGRATION_RULE = INTEGRATION_FIXED
+DEFAULT_TIMESTAMP_INTEGRATION_RULE = INTEGRATION_LEFT
+
+# 発電機回転数の上限（これを超える解は非現実的として0rpm扱い）
+MAX_GENERATOR_RPM = 1e4
+
+# シミュレーションパラメータ未指定時の既定値（伝達効率・出力電圧(V)・カットイン回転数(rpm)）
+DEFAULT_EFFICIENCY = 1.0
+DEFAULT_VOLTAGE = 100.0
+DEFAULT_CUT_IN_RPM = 0.0
+
+# ヒストグラム集約時の既定のビン幅（風速 m/s, 風向 deg）。
+# 風速0.1m/s・風向1度刻みの観測値ではビン内の値が一意になる
+DEFAULT_SPEED_BIN_WIDTH = 0.1
+DEFAULT_DIRECTION_BIN_WIDTH = 1.0
+
+# 角度スイープで1度に計算する (角度 × データ点) 行列の最大要素数（float64で約8MB）
+DEFAULT_MAX_BLOCK_ELEMENTS = 1 << 20
+
+# 風速・風向の組の重複除去：組の数がデータ点数のこの割合以下の場合のみ組ごとに電力を計算する。
+# 角度スイープで組ごとに保持する (角度 × 組) の電力行列の最大要素数（float64で約64MB、超える場合はデータ点ごとに計算する）
+UNIQUE_PAIRS_MAX_FRACTION = 0.5
+DEFAULT_MAX_PAIR_POWER_ELEMENTS = 1 << 23
+
+# プロセス並列の角度スイープ：1タスクの角度数・データ点数（結果がワーカ数に依らないよう固定の分割にする）と、
+# 並列化する最小の (角度 × データ点) 要素数（これ未満はプロセス起動の方が高くつくため直列で計算する）
+PARALLEL_ANGLES_PER_TASK = 8
+PARALLEL_ROWS_PER_TASK = 1 << 20
+DEFAULT_PARALLEL_MIN_ELEMENTS = 1 << 23
+
+# スレッド並列の単一シナリオ：1タスクのデータ点数（結果がスレッド数に依らないよう固定の分割にする）
+THREADED_ROWS_PER_TASK = 1 << 16
+
+# 最適角度探索の既定値：粗い全周スイープの刻み幅(deg)と、局所探索の収束幅(deg)
+DEFAULT_COARSE_ANGLE_STEP_DEG = 5.0
+DEFAULT_ANGLE_TOLERANCE_DEG = 0.01
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+import numpy
+from wind_compass.domain.constants import (
+    DEFAULT_TIME_INTERVAL_HOURS, INTEGRATION_FIXED, INTEGRATION_LEFT, INTEGRATION_RULES, DEFAULT_TIMESTAMP_INTEGRATION_RULE)
+from wind_compass.domain.wind_dataset import WindDataset
+
+_TIMESTAMP_DTYPE = numpy.dtype('datetime64[ns]')
+_NS_PER_HOUR = 3600.0 * 1e9
+
+
+def pairwise_sum(values: Sequence[float]) -> float:
+    """
+    部分和を、並びを半分ずつに分けて足し合わせる（ペアワイズ総和）。
+    足し合わせる順序は要素数だけで決まるため、部分和を計算した順序やスレッド数によらず結果は同じになる。
+    """
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return float(values[0])
+    middle = len(values) // 2
+    return pairwise_sum(values[:middle]) + pairwise_sum(values[middle:])
+
+
+@dataclass(frozen=True)
+class EnergyIntegrator:
+    """
+    瞬時電力(W)の時系列から発電量(Wh)を求める積分方式。
+
+    どの方式も各データ点の時間重み(h)に変換し、発電量 = 瞬時電力・時間重み とする
+    （Δt は observed_at の numpy.diff で一括計算する）。
+    left は区間の始点の電力×Δt、trapezoid は区間の両端の平均×Δt（重みは前後の区間の半分ずつ）、
+    fixed は時刻によらず全データ点に fixed_interval_hours を掛ける。
+    時刻が逆行・重複する区間は0h、max_gap_hours を超える区間（欠測）はその時間で打ち切る
+    （fixed では時刻を使わないため max_gap_hours は影響しない）。
+
+    Args:
+        rule: 積分方式（"fixed", "left", "trapezoid"）
+        max_gap_hours: 1区間の最大時間(h)。None の場合は打ち切らない
+        fixed_interval_hours: fixed で各データ点に掛ける時間(h)
+    """
+    rule: str = DEFAULT_TIMESTAMP_INTEGRATION_RULE
+    max_gap_hours: Optional[float] = None
+    fixed_interval_hours: float = DEFAULT_TIME_INTERVAL_HOURS
+
+    def __post_init__(self):
+        if self.rule not in INTEGRATION_RULES:
+            raise ValueError(
+                f"Unknown integration rule: {self.rule} (expected one of {', '.join(INTEGRATION_RULES)})")
+        if self.max_gap_hours is not None and not self.max_gap_hours > 0:
+            raise ValueError(f"max_gap_hours must be positive, got {self.max_gap_hours}")
+        if not self.fixed_interval_hours > 0:
+            raise ValueError(f"fixed_interval_hours must be positive, got {self.fixed_interval_hours}")
+
+    @property
+    def uses_timestamps(self) -> bool:
+        return self.rule != INTEGRATION_FIXED
+
+    def interval_hours(self, timestamps) -> numpy.ndarray:
+        """隣り合うデータ点の間隔(h)を返す（要素数はデータ点数-1）。逆行は0h、欠測は max_gap_hours で打ち切る。"""
+        timestamps = numpy.asarray(timestamps, dtype=_TIMESTAMP_DTYPE)
+        if timestamps.size < 2:
+            return numpy.zeros(0)
+        hours = numpy.diff(timestamps).astype(numpy.int64) / _NS_PER_HOUR
+        numpy.maximum(hours, 0.0, out=hours)
+        if self.max_gap_hours is not None:
+            numpy.minimum(hours, self.max_gap_hours, out=hours)
+        return hours
+
+    def weights(self, timestamps, previous=None, following=None) -> numpy.ndarray:
+        """
+        各データ点の時間重み(h)を返す。
+        previous・following には前後に続くデータ点の時刻（チャンクの継ぎ目）を渡す。
+        省略した場合は系列の端として扱う（left の最終点、trapezoid の両端の外側は0h）。
+        """
+        timestamps = numpy.asarray(timestamps, dtype=_TIMESTAMP_DTYPE)
+        if not self.uses_timestamps:
+            return numpy.full(timestamps.shape, self.fixed_interval_hours)
+        if timestamps.size == 0:
+            return numpy.zeros(0)
+        before = self.interval_hours([previous, timestamps[0]]) if previous is not None else numpy.zeros(1)
+        after = self.interval_hours([timestamps[-1], following]) if following is not None else numpy.zeros(1)
+        intervals = numpy.concatenate([before, self.interval_hours(timestamps), after])
+        if self.rule == INTEGRATION_LEFT:
+            return intervals[1:]
+        return 0.5 * (intervals[:-1] + intervals[1:])
+
+    def integrate(self, timestamps, power) -> float:
+        """1つの連続した系列の発電量(Wh)を返す。"""
+        power = numpy.asarray(power, dtype=float)
+        return float(numpy.dot(power, self.weights(timestamps)))
+
+    def weighted_chunks(self, chunks: Iterable[WindDataset]) -> Iterator[Tuple[WindDataset, numpy.ndarray]]:
+        """
+        チャンクごとに (チャンク, 時間重み) を返す。継ぎ目の区間を正しく積算するため、
+        各チャンクは次のチャンクの先頭時刻が分かってから返す（保持するのは最大2チャンク）。
+        空のチャンクは読み飛ばす。チャンクごとの重みの合計は全体を一括で計算した重みと一致する。
+        """
+        previous = None
+        pending = None
+        for chunk in chunks:
+            chunk = WindDataset.as_dataset(chunk)
+            if not len(chunk):
+                continue
+            if pending is not None:
+                yield pending, self.weights(pending.observed_at, previous, chunk.observed_at[0])
+                previous = pending.observed_at[-1]
+            pending = chunk
+        if pending is not None:
+            yield pending, self.weights(pending.observed_at, previous)
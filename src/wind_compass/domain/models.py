@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -71,6 +71,14 @@ class WindReading:
     wind_direction: float
 
 
+def horner(coeffs, x):
+    """降べき順の係数 coeffs の多項式をHorner法で評価する。x はスカラー・配列のどちらでもよい。"""
+    result = coeffs[0]
+    for c in coeffs[1:]:
+        result = result * x + c
+    return result
+
+
 @dataclass(frozen=True)
 class PolynomialCurve:
     """多項式カーブを表す。coeffs: [cN, ..., c0] 降べき順"""
@@ -89,7 +97,7 @@ class PolynomialCurve:
             raise ValueError("coeffs must have exactly 4 elements")
 
     def calculate(self, x: float) -> float:
-        return sum(c * (x ** i) for i, c in enumerate(reversed(self.coeffs)))
+        return horner(self.coeffs, x)
 
 
 @dataclass(frozen=True)
@@ -98,7 +106,11 @@ class PowerPlantModel:
     power_curve: PolynomialCurve      # 風速(m/s) -> 電力(W)
     torque_curve: PolynomialCurve     # 回転数(krpm) -> トルク(Nm)
     current_curve: PolynomialCurve    # 回転数(krpm) -> 電流(A)
+    # 有効風速(m/s) -> 風車（ロータ）回転数(rpm)。増速比を指定したシミュレーションでのみ使う（省略可）
+    rotor_speed_curve: Optional[PolynomialCurve] = None
 
     def __post_init__(self):
         if not all(isinstance(c, PolynomialCurve) for c in [self.power_curve, self.torque_curve, self.current_curve]):
             raise TypeError("All curves must be PolynomialCurve")
+        if self.rotor_speed_curve is not None and not isinstance(self.rotor_speed_curve, PolynomialCurve):
+            raise TypeError("All curves must be PolynomialCurve")
@@ -0,0 +1,137 @@
+import numpy
+from wind_compass.domain.constants import RPM_TO_RAD_PER_SEC, MAX_GENERATOR_RPM
+from wind_compass.domain.models import horner
+
+# Newton法の最大反復回数（区間縮小を併用するため実際は数回で収束する）
+_MAX_ITERATIONS = 100
+# 収束判定の相対許容誤差（numpy.roots の丸め誤差と同程度）
+_RELATIVE_TOLERANCE = 1e-12
+# 初期値推定用に各単調区間へ置く標本点の数
+_SAMPLES_PER_SEGMENT = 256
+
+
+def shaft_power_coeffs(torque_coeffs):
+    """
+    トルクカーブ係数（krpm基準・降べき順）から、回転数(rpm)→軸動力(W)の
+    多項式係数 P(rpm) = T(rpm/1000) * rpm * 2pi/60 を降べき順で返す。
+    """
+    degree = len(torque_coeffs) - 1
+    scaled = [c / (1000 ** (degree - i)) for i, c in enumerate(torque_coeffs)]
+    return numpy.array(scaled + [0.0], dtype=float) * RPM_TO_RAD_PER_SEC
+
+
+def _sign_near_zero(power_coeffs):
+    # rpm→+0 における P(rpm) の符号（最低次の非ゼロ係数の符号）
+    for c in reversed(power_coeffs):
+        if c != 0.0:
+            return numpy.sign(c)
+    return 0.0
+
+
+def monotone_breakpoints(power_coeffs, max_rpm: float = MAX_GENERATOR_RPM) -> numpy.ndarray:
+    """(0, max_rpm] を軸動力多項式 P(rpm) の単調区間に分割する境界点（両端を含む）を返す。"""
+    derivative = numpy.polyder(power_coeffs)
+    critical = []
+    if numpy.any(derivative != 0.0):
+        critical = [r.real for r in numpy.roots(derivative)
+                    if r.imag == 0.0 and 0.0 < r.real < max_rpm]
+    return numpy.array([0.0] + sorted(critical) + [max_rpm])
+
+
+def solve_rpm_batch(shaft_powers, torque_coeffs, max_rpm: float = MAX_GENERATOR_RPM) -> numpy.ndarray:
+    """
+    軸動力の配列から発電機回転数(rpm)の配列を一括で求める。
+
+    各行で P(rpm) = shaft_power の最小の正の実数解を返す。解が無い場合、
+    および最小解が max_rpm を超える場合は0とする（_solve_for_rpm と同じ規則）。
+    NaN/無限大の入力はNaNを返す。
+
+    行ごとに numpy.roots を解く代わりに、P(rpm) の臨界点（モデルのみに依存）で
+    (0, max_rpm] を単調区間に分割し、符号変化で最初の解を含む区間を特定してから、
+    区間縮小付きNewton法で全行を同時に解く。
+    """
+    power_coeffs = shaft_power_coeffs(list(torque_coeffs))
+    return solve_rpm_with_coeffs(
+        shaft_powers, power_coeffs, monotone_breakpoints(power_coeffs, max_rpm))
+
+
+def solve_rpm_with_coeffs(shaft_powers, power_coeffs, breakpoints) -> numpy.ndarray:
+    """
+    事前計算済みの軸動力多項式係数と単調区間の境界点を用いて solve_rpm_batch と同じ解を求める。
+    （CompiledPowerPlantModel から呼び出し、行ごとの係数計算を省く）
+    """
+    shaft_powers = numpy.asarray(shaft_powers, dtype=float)
+    power_coeffs = numpy.asarray(power_coeffs, dtype=float)
+    bounds = numpy.asarray(breakpoints, dtype=float)
+    rpms = numpy.zeros(shaft_powers.shape)
+    finite = numpy.isfinite(shaft_powers)
+    rpms[~finite] = numpy.nan
+    targets = shaft_powers[finite]
+    if targets.size == 0:
+        return rpms
+
+    residuals = horner(power_coeffs, bounds)[None, :] - targets[:, None]
+    signs = numpy.sign(residuals)
+    # rpm=0 は解に含めないため、境界0での符号は rpm→+0 の極限で評価する
+    signs[:, 0] = numpy.where(
+        targets != 0.0, -numpy.sign(targets), _sign_near_zero(power_coeffs))
+    crossing = (signs[:, 1:] == 0.0) | (signs[:, 1:] != signs[:, :-1])
+    crossing &= signs[:, :1] != 0.0
+    has_root = numpy.any(crossing, axis=1)
+    segment = numpy.argmax(crossing, axis=1)
+
+    solved = numpy.zeros(targets.shape)
+    exact = has_root & (signs[numpy.arange(targets.size), segment + 1] == 0.0)
+    solved[exact] = bounds[segment[exact] + 1]
+    for j in range(bounds.size - 1):
+        rows = numpy.flatnonzero(has_root & ~exact & (segment == j))
+        if rows.size:
+            solved[rows] = _solve_in_segment(
+                power_coeffs, targets[rows], bounds[j], bounds[j + 1])
+    rpms[finite] = solved
+    return rpms
+
+
+def _solve_in_segment(power_coeffs, targets, lo, hi):
+    # 単調区間 [lo, hi] を標本化し、各行の解を含む小区間と線形補間の初期値を得る
+    grid = numpy.linspace(lo, hi, _SAMPLES_PER_SEGMENT)
+    values = horner(power_coeffs, grid)
+    if values[-1] < values[0]:
+        grid, values = grid[::-1], values[::-1]
+    idx = numpy.clip(numpy.searchsorted(values, targets), 1, grid.size - 1)
+    a, b = grid[idx - 1], grid[idx]
+    guess = numpy.clip(numpy.interp(targets, values, grid),
+                       numpy.minimum(a, b), numpy.maximum(a, b))
+    return _newton_in_brackets(
+        power_coeffs, targets, numpy.minimum(a, b), numpy.maximum(a, b), guess)
+
+
+def _newton_in_brackets(power_coeffs, targets, lo, hi, x):
+    # 符号変化を持つ区間 [lo, hi] 内の解を区間縮小付きNewton法で求める
+    derivative = numpy.polyder(power_coeffs)
+    f_lo = horner(power_coeffs, lo) - targets
+    result = x.copy()
+    active = numpy.arange(targets.size)
+    for _ in range(_MAX_ITERATIONS):
+        f = horner(power_coeffs, x) - targets
+        same_side = numpy.sign(f) == numpy.sign(f_lo)
+        lo = numpy.where(same_side, x, lo)
+        f_lo = numpy.where(same_side, f, f_lo)
+        hi = numpy.where(same_side, hi, x)
+        df = horner(derivative, x)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            step = x - f / df
+        finite = numpy.isfinite(step)
+        done = (f == 0.0) | (finite & (numpy.abs(step - x) <=
+                                       _RELATIVE_TOLERANCE * numpy.maximum(numpy.abs(x), 1.0)))
+        result[active[done]] = numpy.where(f[done] == 0.0, x[done], step[done])
+        inside = finite & (step > lo) & (step < hi)
+        x_next = numpy.where(inside, step, 0.5 * (lo + hi))
+        keep = ~done
+        if not numpy.any(keep):
+            break
+        active, x, lo, hi, f_lo, targets = (
+            active[keep], x_next[keep], lo[keep], hi[keep], f_lo[keep], targets[keep])
+    else:
+        result[active] = x
+    return result
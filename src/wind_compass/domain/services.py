@@ -1,12 +1,45 @@
 import math
 import numpy
+from functools import lru_cache
+from typing import Optional
 from wind_compass.domain.models import PowerPlantModel, PolynomialCurve, Power, Torque, EffectiveWindSpeed, WindReading
-from wind_compass.domain.constants import RPM_TO_RAD_PER_SEC
+from wind_compass.domain.constants import DEFAULT_MAX_BLOCK_ELEMENTS, DEFAULT_MAX_PAIR_POWER_ELEMENTS
+from wind_compass.domain.rpm_solver import solve_rpm_with_coeffs
+from wind_compass.domain.compiled_model import CompiledPowerPlantModel, shaft_power_coeffs_for, rpm_breakpoints_for
+from wind_compass.domain.transfer_table import PowerTransferTable
+from wind_compass.domain.wind_pairs import collapse_wind_pairs
+
+
+@lru_cache(maxsize=16)
+def _cached_transfer_table(compiled_model: CompiledPowerPlantModel, efficiency: float, voltage: float, cut_in_rpm: float, max_wind_speed: float) -> PowerTransferTable:
+    simulator = PowerGenerationSimulator(None, compiled_model)
+    return PowerTransferTable.build(
+        lambda v: simulator._calculate_power_chain(
+            v, efficiency, voltage, cut_in_rpm),
+        max_wind_speed)
 
 
 class PowerGenerationSimulator:
-    def __init__(self, model: PowerPlantModel):
+    def __init__(self, model: PowerPlantModel, compiled_model: Optional[CompiledPowerPlantModel] = None):
         self._model = model
+        self._compiled = compiled_model
+
+    @property
+    def compiled_model(self) -> CompiledPowerPlantModel:
+        # モデルのみに依存する係数は初回利用時に1度だけ事前計算する
+        if self._compiled is None:
+            self._compiled = CompiledPowerPlantModel.from_model(self._model)
+        return self._compiled
+
+    def _shaft_power_coeffs(self, torque_curve: PolynomialCurve):
+        if self._model is not None and torque_curve is self._model.torque_curve:
+            return self.compiled_model.shaft_power_coeffs
+        return shaft_power_coeffs_for(tuple(torque_curve.coeffs))
+
+    def _rpm_breakpoints(self, torque_curve: PolynomialCurve, shaft_power_coeffs):
+        if self._model is not None and torque_curve is self._model.torque_curve:
+            return self.compiled_model.rpm_breakpoints
+        return rpm_breakpoints_for(tuple(shaft_power_coeffs))
 
     def _calculate_effective_wind_speed(self, wind_speed, wind_direction_deg, turbine_angle_deg):
         # 有効風速 = 風速 * cos(風向-タービン角)
@@ -18,7 +51,7 @@ class PowerGenerationSimulator:
         return wind_speed * cos_theta
 
     def _calculate_turbine_power(self, effective_wind_speed):
-        return self._model.power_curve.calculate(effective_wind_speed)
+        return self.compiled_model.turbine_power(effective_wind_speed)
 
     def _calculate_transmitted_power(self, turbine_power, efficiency):
         # 伝達効率を適用
@@ -30,30 +63,19 @@ class PowerGenerationSimulator:
         # T_gen(x_krpm) = c3 x_krpm^3 + ... + c0
         # x_krpm = rpm_gen / 1000
         # T_gen(rpm_gen) = c3 (rpm_gen/1000)^3 + ...
-        # 多項式係数をrpm基準にスケーリング
-        orig_coeffs = list(torque_curve.coeffs)
-        degree = len(orig_coeffs) - 1
-        scaled_coeffs = []
-        for i, c in enumerate(orig_coeffs):
-            scaled_coeffs.append(c / (1000 ** (degree - i)))
-        # T(rpm) * rpm
-        coeffs = list(scaled_coeffs)
-        coeffs.append(0)  # T(rpm) * rpm → 次数+1
-        coeffs = [c * RPM_TO_RAD_PER_SEC for c in coeffs]
-        coeffs[-1] -= shaft_power
-        roots = [r for r in numpy.roots(coeffs) if numpy.isreal(r)]
-        roots = [float(r.real) for r in roots if r.real > 0]
-        if not roots:
-            return 0.0
-        rpm = min(roots)
-        if rpm > 1e4:
-            return 0.0
+        # 多項式係数をrpm基準にスケーリングし T(rpm) * rpm * 2pi/60 としたもの（事前計算済み）
+        # 配列版と同じ解法（単調区間ごとの区間縮小付きNewton法）で1点を解く（行ごとに numpy.roots を解かない）
+        coeffs = self._shaft_power_coeffs(torque_curve)
+        rpm = float(solve_rpm_with_coeffs(
+            numpy.array([shaft_power], dtype=float), coeffs, self._rpm_breakpoints(torque_curve, coeffs))[0])
+        if math.isnan(rpm):
+            raise ValueError(f"Cannot solve generator rpm for shaft power {shaft_power}")
         return rpm
 
     def _calculate_current(self, rpm):
         # 回転数から電流を計算
         # current_curveもkrpm基準
-        return self._model.current_curve.calculate(rpm / 1000)
+        return self.compiled_model.current(rpm)
 
     def _calculate_final_power(self, current, voltage):
         # 電流と電圧から最終電力を計算
@@ -63,7 +85,231 @@ class PowerGenerationSimulator:
         # カットイン回転数判定
         return rpm >= cut_in_rpm
 
-    def calculate_instantaneous_power(self, wind_reading: WindReading, turbine_angle_deg: float, efficiency: float, voltage: float, cut_in_rpm: float):
+    def _calculate_effective_wind_speed_series(self, speeds, directions, turbine_angle_deg):
+        # 有効風速の配列版。追い風（cos_theta<0）は0とする
+        theta = numpy.radians(directions - turbine_angle_deg)
+        cos_theta = numpy.cos(theta)
+        return numpy.where(cos_theta < 0, 0.0, speeds * cos_theta)
+
+    def _solve_for_rpm_series(self, shaft_powers):
+        # 回転数の配列版（_solve_for_rpm と同じ規則）。解けない行（NaN入力など）はNaNとする
+        compiled = self.compiled_model
+        return solve_rpm_with_coeffs(
+            shaft_powers, compiled.shaft_power_coeffs, compiled.rpm_breakpoints)
+
+    def _limit_by_rotor_speed(self, rpm_gen, effective_wind_speed, gear_ratio):
+        # 発電機回転数 = 増速比 × 風車回転数（rotor_speed_curve）。ただし軸動力の釣り合いの回転数 rpm_gen は超えない
+        # （それより速く回すには、風車から伝わる軸動力より大きな動力が発電機に必要になるため）
+        rotor_rpm = numpy.maximum(self.compiled_model.rotor_speed(effective_wind_speed), 0.0)
+        return numpy.minimum(gear_ratio * rotor_rpm, rpm_gen)
+
+    @staticmethod
+    def _check_gear_ratio(gear_ratio):
+        if gear_ratio is not None and not numpy.all(numpy.asarray(gear_ratio, dtype=float) > 0):
+            raise ValueError(f"gear_ratio must be positive, got {gear_ratio}")
+
+    def _calculate_power_chain(self, effective_wind_speeds, efficiency, voltage, cut_in_rpm, gear_ratio=None):
+        # cos 計算以降（パワーカーブ→伝達効率→回転数→カットイン→電流×電圧）の配列版。
+        # (瞬時電力, 動作状態) を返す。動作状態 = 2*カットイン以上 + 回転数の解あり
+        compiled = self.compiled_model
+        turbine_power = compiled.turbine_power(effective_wind_speeds)
+        shaft_power = self._calculate_transmitted_power(
+            turbine_power, efficiency)
+        rpm_gen = self._solve_for_rpm_series(shaft_power)
+        if gear_ratio is not None:
+            rpm_gen = self._limit_by_rotor_speed(rpm_gen, effective_wind_speeds, gear_ratio)
+        current = compiled.current(rpm_gen)
+        final_power = self._calculate_final_power(current, voltage)
+        produced = numpy.isfinite(rpm_gen) & self._is_cut_in(rpm_gen, cut_in_rpm)
+        state = 2 * produced.astype(int) + (rpm_gen > 0).astype(int)
+        return numpy.where(produced, final_power, 0.0), state
+
+    def calculate_power_from_effective_wind_speed(self, effective_wind_speeds, efficiency: float, voltage: float, cut_in_rpm: float, gear_ratio: Optional[float] = None) -> numpy.ndarray:
+        """有効風速(m/s)の配列から瞬時発電電力(W)の配列を計算する。有効風速0の行は0W。"""
+        self._check_gear_ratio(gear_ratio)
+        effective_wind_speeds = numpy.asarray(effective_wind_speeds, dtype=float)
+        power = numpy.zeros_like(effective_wind_speeds)
+        active = effective_wind_speeds != 0.0
+        if numpy.any(active):
+            power[active], _ = self._calculate_power_chain(
+                effective_wind_speeds[active], efficiency, voltage, cut_in_rpm, gear_ratio)
+        return power
+
+    def transfer_table(self, efficiency: float, voltage: float, cut_in_rpm: float, max_wind_speed: float) -> PowerTransferTable:
+        """
+        有効風速 [0, max_wind_speed] に対する伝達関数表を返す。
+        表はモデル・パラメータごとにキャッシュされ、角度シナリオ間で共有される。
+        上限は整数m/sに切り上げ、近い最大風速のデータでも同じ表を使う。
+        """
+        return _cached_transfer_table(
+            self.compiled_model, efficiency, voltage, cut_in_rpm,
+            float(max(math.ceil(max_wind_speed), 1)))
+
+    def _calculate_pair_power(self, pairs, index, turbine_angle_deg, efficiency, voltage, cut_in_rpm, gear_ratio=None):
+        # (風速, 風向) の組 pairs の index の位置の瞬時電力。角度が (角度数, 1) の場合は (角度 × 組) の行列を返す
+        eff_ws = self._calculate_effective_wind_speed_series(
+            pairs.speeds[index], pairs.directions[index], turbine_angle_deg)
+        return self.calculate_power_from_effective_wind_speed(
+            eff_ws, efficiency, voltage, cut_in_rpm, gear_ratio)
+
+    def calculate_power_series(self, speeds, directions, turbine_angle_deg: float, efficiency: float, voltage: float, cut_in_rpm: float, transfer_table: Optional[PowerTransferTable] = None, gear_ratio: Optional[float] = None) -> numpy.ndarray:
+        """
+        風速・風向の配列から瞬時発電電力(W)の配列を一括で計算する。
+
+        calculate_instantaneous_power を各行に適用した結果と、相対誤差1e-9以内で一致する
+        （numpy.cos と math.cos、Newton法と numpy.roots の丸め差のみ）。
+        スカラー版で例外となる行（NaN入力など）は0Wとする。
+        transfer_table を渡すと cos 計算以降を表の補間で評価する（誤差は表の max_abs_error 以内）。
+        表の範囲外の行は厳密に計算する。
+        厳密計算では (風速, 風向) の組の重複を除いて組ごとに1度だけ計算し、各行に戻す（結果は行ごとの計算とビット単位で一致する）。
+        gear_ratio を渡すと発電機回転数を 増速比 × 風車回転数 で制限する（伝達関数表とは併用できない）。
+        """
+        speeds = numpy.asarray(speeds, dtype=float)
+        directions = numpy.asarray(directions, dtype=float)
+        if speeds.shape != directions.shape:
+            raise ValueError("speeds and directions must have the same shape")
+        if transfer_table is not None and gear_ratio is not None:
+            raise ValueError("transfer_table cannot be combined with gear_ratio")
+        if transfer_table is None:
+            pairs = collapse_wind_pairs(speeds, directions)
+            if pairs is not None:
+                return self._calculate_pair_power(
+                    pairs, slice(None), turbine_angle_deg, efficiency, voltage, cut_in_rpm, gear_ratio)[pairs.inverse]
+        eff_ws = self._calculate_effective_wind_speed_series(
+            speeds, directions, turbine_angle_deg)
+        if transfer_table is None:
+            return self.calculate_power_from_effective_wind_speed(
+                eff_ws, efficiency, voltage, cut_in_rpm, gear_ratio)
+        power, covered = transfer_table.lookup(eff_ws)
+        if not numpy.all(covered):
+            power[~covered] = self.calculate_power_from_effective_wind_speed(
+                eff_ws[~covered], efficiency, voltage, cut_in_rpm)
+        return power
+
+    def calculate_energy_by_angle(self, speeds, directions, hours, turbine_angles_deg, efficiency: float, voltage: float, cut_in_rpm: float, max_block_elements: int = DEFAULT_MAX_BLOCK_ELEMENTS, max_pair_elements: int = DEFAULT_MAX_PAIR_POWER_ELEMENTS) -> numpy.ndarray:
+        """
+        複数の風車角度について、各データ点の瞬時電力(W)×時間(h)の合計(Wh)を一括で計算する。
+
+        (角度 × データ点) の有効風速行列をブロードキャストで作り、電力計算を行列全体に適用する。
+        メモリを抑えるため、データ点は1ブロックの要素数が max_block_elements 以下になるよう分割し、
+        ブロックごとに角度別のエネルギーへ積算する（データは1回だけ走査する）。
+        (風速, 風向) の組の重複が多く (角度 × 組) が max_pair_elements 以下の場合は、組ごとの電力を先に計算し、
+        各ブロックの電力行列は組の電力から取り出す（ブロックの行列と積算順は同じため、結果はビット単位で一致する）。
+        """
+        speeds = numpy.asarray(speeds, dtype=float)
+        directions = numpy.asarray(directions, dtype=float)
+        hours = numpy.asarray(hours, dtype=float)
+        angles = numpy.asarray(turbine_angles_deg, dtype=float).reshape(-1)
+        if not (speeds.shape == directions.shape == hours.shape):
+            raise ValueError(
+                "speeds, directions and hours must have the same shape")
+        energy_wh = numpy.zeros(angles.shape)
+        rows_per_block = max(1, max_block_elements // max(angles.size, 1))
+        pairs = collapse_wind_pairs(speeds, directions)
+        if pairs is not None and angles.size * pairs.pair_count <= max_pair_elements:
+            power_by_pair = numpy.empty((angles.size, pairs.pair_count))
+            for start in range(0, pairs.pair_count, rows_per_block):
+                block = slice(start, start + rows_per_block)
+                power_by_pair[:, block] = self._calculate_pair_power(
+                    pairs, block, angles[:, None], efficiency, voltage, cut_in_rpm)
+            for start in range(0, speeds.size, rows_per_block):
+                block = slice(start, start + rows_per_block)
+                # take は (角度 × データ点) の C 連続の行列を返すため、データ点ごとの計算と同じ行列積になる
+                energy_wh += numpy.take(power_by_pair, pairs.inverse[block], axis=1) @ hours[block]
+            return energy_wh
+        for start in range(0, speeds.size, rows_per_block):
+            block = slice(start, start + rows_per_block)
+            eff_ws = self._calculate_effective_wind_speed_series(
+                speeds[None, block], directions[None, block], angles[:, None])
+            power = self.calculate_power_from_effective_wind_speed(
+                eff_ws, efficiency, voltage, cut_in_rpm)
+            energy_wh += power @ hours[block]
+        return energy_wh
+
+    def calculate_energy_by_angle_and_gear(self, speeds, directions, hours, turbine_angles_deg, gear_ratios, efficiency: float, voltage: float, cut_in_rpm: float, max_block_elements: int = DEFAULT_MAX_BLOCK_ELEMENTS) -> numpy.ndarray:
+        """
+        (角度 × 増速比) の全組み合わせの発電量(Wh)を1回のデータ走査で計算する（形状は 角度数 × 増速比数）。
+
+        軸動力の釣り合いの回転数は増速比によらないため (角度 × データ点) で1度だけ解き、
+        増速比の軸は (増速比 × 角度 × データ点) のブロードキャストで一括に評価する。
+        メモリを抑えるため、データ点は1ブロックの要素数が max_block_elements 以下になるよう分割する。
+        各組み合わせの値は calculate_power_series(gear_ratio=...) による行ごとの積算と丸め誤差の範囲で一致する。
+        """
+        speeds = numpy.asarray(speeds, dtype=float)
+        directions = numpy.asarray(directions, dtype=float)
+        hours = numpy.asarray(hours, dtype=float)
+        angles = numpy.asarray(turbine_angles_deg, dtype=float).reshape(-1)
+        gear_ratios = numpy.asarray(gear_ratios, dtype=float).reshape(-1)
+        if not (speeds.shape == directions.shape == hours.shape):
+            raise ValueError(
+                "speeds, directions and hours must have the same shape")
+        self._check_gear_ratio(gear_ratios)
+        compiled = self.compiled_model
+        energy_wh = numpy.zeros((gear_ratios.size, angles.size))
+        rows_per_block = max(1, max_block_elements // max(angles.size * gear_ratios.size, 1))
+        for start in range(0, speeds.size, rows_per_block):
+            block = slice(start, start + rows_per_block)
+            eff_ws = self._calculate_effective_wind_speed_series(
+                speeds[None, block], directions[None, block], angles[:, None])
+            active = eff_ws != 0.0
+            balance_rpm = numpy.full(eff_ws.shape, numpy.nan)
+            balance_rpm[active] = self._solve_for_rpm_series(self._calculate_transmitted_power(
+                compiled.turbine_power(eff_ws[active]), efficiency))
+            rpm_gen = self._limit_by_rotor_speed(
+                balance_rpm[None], eff_ws[None], gear_ratios[:, None, None])
+            produced = active[None] & numpy.isfinite(rpm_gen) & self._is_cut_in(rpm_gen, cut_in_rpm)
+            power = numpy.where(
+                produced, self._calculate_final_power(compiled.current(rpm_gen), voltage), 0.0)
+            energy_wh += power @ hours[block]
+        return energy_wh.T
+
+    def calculate_energy_grid(self, speeds, directions, hours, turbine_angles_deg, efficiencies, voltages, cut_in_rpms) -> numpy.ndarray:
+        """
+        (角度, 伝達効率, 出力電圧, カットイン回転数) の全組み合わせの発電量(Wh)を返す（形状は 角度数 × 効率数 × 電圧数 × カットイン数）。
+
+        電圧は最終電力に線形に掛かるだけ、カットインは回転数による行の選別だけのため、
+        回転数の解は (角度, 効率) ごとに1度だけ求める。回転数の昇順に並べた 電流×時間 の累積和から
+        各カットイン回転数以上の合計を二分探索で読み、電圧を掛けて全組み合わせを求める。
+        (風速, 風向) の組の重複が多い場合は組ごとに時間をまとめてから計算する。
+        各組み合わせの値は calculate_power_series による行ごとの積算と丸め誤差の範囲で一致する。
+        """
+        speeds = numpy.asarray(speeds, dtype=float)
+        directions = numpy.asarray(directions, dtype=float)
+        hours = numpy.asarray(hours, dtype=float)
+        if not (speeds.shape == directions.shape == hours.shape):
+            raise ValueError(
+                "speeds, directions and hours must have the same shape")
+        angles = numpy.asarray(turbine_angles_deg, dtype=float).reshape(-1)
+        efficiencies = numpy.asarray(efficiencies, dtype=float).reshape(-1)
+        voltages = numpy.asarray(voltages, dtype=float).reshape(-1)
+        cut_in_rpms = numpy.asarray(cut_in_rpms, dtype=float).reshape(-1)
+        pairs = collapse_wind_pairs(speeds, directions)
+        if pairs is not None:
+            hours = numpy.bincount(pairs.inverse, weights=hours, minlength=pairs.pair_count)
+            speeds, directions = pairs.speeds, pairs.directions
+        compiled = self.compiled_model
+        energy_wh = numpy.zeros((angles.size, efficiencies.size, voltages.size, cut_in_rpms.size))
+        for i, angle in enumerate(angles):
+            eff_ws = self._calculate_effective_wind_speed_series(speeds, directions, angle)
+            # 有効風速0の行は発電しない（calculate_power_from_effective_wind_speed と同じ）
+            active = eff_ws != 0.0
+            turbine_power = compiled.turbine_power(eff_ws[active])
+            active_hours = hours[active]
+            for j, efficiency in enumerate(efficiencies):
+                rpm_gen = self._solve_for_rpm_series(
+                    self._calculate_transmitted_power(turbine_power, efficiency))
+                solved = numpy.isfinite(rpm_gen)
+                order = numpy.argsort(rpm_gen[solved], kind="stable")
+                sorted_rpm = rpm_gen[solved][order]
+                charge = (compiled.current(sorted_rpm) * active_hours[solved][order])
+                # tail[k] = 回転数が k 番目以降の行の 電流×時間 の合計（末尾は0）
+                tail = numpy.concatenate([numpy.cumsum(charge[::-1])[::-1], [0.0]])
+                above = tail[numpy.searchsorted(sorted_rpm, cut_in_rpms, side="left")]
+                energy_wh[i, j] = self._calculate_final_power(above[None, :], voltages[:, None])
+        return energy_wh
+
+    def calculate_instantaneous_power(self, wind_reading: WindReading, turbine_angle_deg: float, efficiency: float, voltage: float, cut_in_rpm: float, gear_ratio: Optional[float] = None):
+        self._check_gear_ratio(gear_ratio)
         eff_ws = self._calculate_effective_wind_speed(
             wind_reading.wind_speed, wind_reading.wind_direction, turbine_angle_deg)
         if eff_ws == 0.0:
@@ -72,6 +318,8 @@ class PowerGenerationSimulator:
         shaft_power = self._calculate_transmitted_power(
             turbine_power, efficiency)
         rpm_gen = self._solve_for_rpm(shaft_power, self._model.torque_curve)
+        if gear_ratio is not None:
+            rpm_gen = float(self._limit_by_rotor_speed(rpm_gen, eff_ws, gear_ratio))
         if not self._is_cut_in(rpm_gen, cut_in_rpm):
             return Power(0.0)
         current = self._calculate_current(rpm_gen)
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from typing import Callable, Tuple
+import numpy
+
+# 一様な初期グリッドの点数
+DEFAULT_GRID_SIZE = 1025
+# 補間誤差の目標値（最大出力に対する相対値）
+DEFAULT_RELATIVE_TOLERANCE = 1e-6
+# 適応的な細分化の最大回数
+_MAX_REFINEMENTS = 16
+# 不連続点の位置を二分法で絞り込む回数（区間幅 v_max / 2^60 程度まで）
+_DISCONTINUITY_BISECTIONS = 60
+
+# 有効風速(m/s)の配列 -> (瞬時電力(W), 動作状態) を返す厳密計算。
+# 動作状態は回転数の解の有無・カットイン判定の組を整数で表したもの
+
+ExactPowerFunction = Callable[[numpy.ndarray],
+                              Tuple[numpy.ndarray, numpy.ndarray]]
+
+
+@dataclass(frozen=True)
+class PowerTransferTable:
+    """
+    有効風速 -> 瞬時発電電力 の伝達関数を表にしたもの。
+    モデル・効率・電圧・カットイン回転数を固定すると、cos 計算以降の処理は有効風速のみに
+    依存するため、事前に表を作れば各データ点は線形補間1回で評価できる。
+
+    Args:
+        speeds: 表の有効風速 (m/s, 狭義単調増加)
+        power: 各有効風速での瞬時電力 (W)
+        max_abs_error: 各区間中点で測った厳密計算との最大絶対誤差 (W)
+        discontinuities: カットイン・回転数上限などで動作状態が切り替わる有効風速 (m/s)
+    """
+    speeds: numpy.ndarray
+    power: numpy.ndarray
+    max_abs_error: float
+    discontinuities: Tuple[float, ...]
+
+    @property
+    def max_speed(self) -> float:
+        return float(self.speeds[-1])
+
+    @classmethod
+    def build(cls, exact_power: ExactPowerFunction, max_speed: float,
+              grid_size: int = DEFAULT_GRID_SIZE,
+              relative_tolerance: float = DEFAULT_RELATIVE_TOLERANCE) -> 'PowerTransferTable':
+        """
+        [0, max_speed] の表を作る。動作状態が切り替わる区間は二分法で不連続点を挟み込み、
+        それ以外は中点の補間誤差が許容値を超える区間を繰り返し2分割する。
+        """
+        if not max_speed > 0.0:
+            raise ValueError("max_speed must be positive")
+        speeds = numpy.linspace(0.0, max_speed, grid_size)
+        power, state = exact_power(speeds)
+        speeds, power, state, discontinuities = _bracket_discontinuities(
+            exact_power, speeds, power, state)
+        tolerance = relative_tolerance * max(float(numpy.max(numpy.abs(power))), 1.0)
+        for _ in range(_MAX_REFINEMENTS):
+            mid, mid_power, errors, smooth = _midpoint_errors(
+                exact_power, speeds, power, state)
+            refine = smooth & (errors > tolerance)
+            if not numpy.any(refine):
+                break
+            speeds, power, state = _insert_points(
+                speeds, power, state, mid[refine], mid_power[refine],
+                exact_power(mid[refine])[1])
+        _, _, errors, smooth = _midpoint_errors(
+            exact_power, speeds, power, state)
+        max_abs_error = float(numpy.max(errors[smooth], initial=0.0))
+        return cls(speeds=speeds, power=power, max_abs_error=max_abs_error,
+                   discontinuities=tuple(discontinuities))
+
+    def lookup(self, effective_wind_speeds) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        有効風速の配列を補間で評価し、(瞬時電力, 表の範囲内か) を返す。
+        有効風速0（追い風・無風）は0Wとし、範囲外・NaNの行は呼び出し側で厳密計算する。
+        """
+        v = numpy.asarray(effective_wind_speeds, dtype=float)
+        covered = (v >= 0.0) & (v <= self.max_speed)
+        power = numpy.interp(v, self.speeds, self.power)
+        power = numpy.where(covered & (v != 0.0), power, 0.0)
+        return power, covered
+
+
+def _bracket_discontinuities(exact_power, speeds, power, state):
+    # 動作状態が切り替わる区間 [a, b] を二分法で縮め、両端を表の点として加える
+    switching = numpy.flatnonzero(state[1:] != state[:-1])
+    if switching.size == 0:
+        return speeds, power, state, []
+    lo, hi = speeds[switching].copy(), speeds[switching + 1].copy()
+    lo_state = state[switching]
+    for _ in range(_DISCONTINUITY_BISECTIONS):
+        mid = 0.5 * (lo + hi)
+        _, mid_state = exact_power(mid)
+        same = mid_state == lo_state
+        lo = numpy.where(same, mid, lo)
+        hi = numpy.where(same, hi, mid)
+    points = numpy.concatenate([lo, hi])
+    point_power, point_state = exact_power(points)
+    speeds, power, state = _insert_points(
+        speeds, power, state, points, point_power, point_state)
+    return speeds, power, state, [float(x) for x in 0.5 * (lo + hi)]
+
+
+def _midpoint_errors(exact_power, speeds, power, state):
+    # 各区間中点での補間誤差。動作状態の切替区間（不連続点を挟む区間）は対象外
+    mid = 0.5 * (speeds[1:] + speeds[:-1])
+    mid_power, _ = exact_power(mid)
+    errors = numpy.abs(0.5 * (power[1:] + power[:-1]) - mid_power)
+    smooth = (state[1:] == state[:-1]) & (mid > speeds[:-1]) & (mid < speeds[1:])
+    return mid, mid_power, errors, smooth
+
+
+def _insert_points(speeds, power, state, new_speeds, new_power, new_state):
+    speeds = numpy.concatenate([speeds, new_speeds])
+    order = numpy.argsort(speeds, kind='stable')
+    speeds = speeds[order]
+    power = numpy.concatenate([power, new_power])[order]
+    state = numpy.concatenate([state, new_state])[order]
+    unique = numpy.concatenate([[True], speeds[1:] > speeds[:-1]])
+    return speeds[unique], power[unique], state[unique]
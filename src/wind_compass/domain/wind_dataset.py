@@ -0,0 +1,107 @@
+from typing import Iterable, Iterator, Sequence, Union, overload
+import numpy
+from wind_compass.domain.models import WindReading
+
+_TIMESTAMP_DTYPE = numpy.dtype('datetime64[ns]')
+# 風速・風向に使える浮動小数点型（float32 はメモリを半分にする代わりに精度が約7桁になる）
+VALUE_DTYPES = (numpy.dtype(numpy.float64), numpy.dtype(numpy.float32))
+
+
+def _readonly(array: numpy.ndarray) -> numpy.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class WindDataset(Sequence[WindReading]):
+    """
+    風況データを列指向の連続配列で保持するコレクション。
+
+    observed_at は datetime64[ns]、wind_speeds・wind_directions は float64（または float32）の
+    1次元配列で、読み取り専用のビューとして公開する。スライスは配列をコピーしない。
+    WindReading の Sequence としても振る舞い、要素アクセス・反復時にその都度 WindReading を生成する
+    （従来の Iterable[WindReading] を受け取る処理はそのまま使える）。
+    """
+
+    def __init__(self, observed_at, wind_speeds, wind_directions, dtype=numpy.float64):
+        dtype = numpy.dtype(dtype)
+        if dtype not in VALUE_DTYPES:
+            raise ValueError(f"dtype must be float64 or float32, got {dtype}")
+        observed_at = numpy.asarray(observed_at, dtype=_TIMESTAMP_DTYPE)
+        wind_speeds = numpy.asarray(wind_speeds, dtype=dtype)
+        wind_directions = numpy.asarray(wind_directions, dtype=dtype)
+        if not (observed_at.ndim == wind_speeds.ndim == wind_directions.ndim == 1):
+            raise ValueError("WindDataset columns must be one-dimensional")
+        if not (observed_at.shape == wind_speeds.shape == wind_directions.shape):
+            raise ValueError("WindDataset columns must have the same length")
+        self._observed_at = _readonly(observed_at)
+        self._wind_speeds = _readonly(wind_speeds)
+        self._wind_directions = _readonly(wind_directions)
+
+    @classmethod
+    def from_readings(cls, readings: Iterable[WindReading], dtype=numpy.float64) -> 'WindDataset':
+        readings = list(readings)
+        return cls(
+            numpy.array([r.observed_at for r in readings], dtype=_TIMESTAMP_DTYPE),
+            numpy.array([r.wind_speed for r in readings], dtype=float),
+            numpy.array([r.wind_direction for r in readings], dtype=float),
+            dtype=dtype,
+        )
+
+    @classmethod
+    def as_dataset(cls, data: Union['WindDataset', Iterable[WindReading]]) -> 'WindDataset':
+        """WindDataset はそのまま返し、WindReading の Iterable は列指向に変換する。"""
+        if isinstance(data, WindDataset):
+            return data
+        return cls.from_readings(data)
+
+    @property
+    def observed_at(self) -> numpy.ndarray:
+        return self._observed_at
+
+    @property
+    def wind_speeds(self) -> numpy.ndarray:
+        return self._wind_speeds
+
+    @property
+    def wind_directions(self) -> numpy.ndarray:
+        return self._wind_directions
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._wind_speeds.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._observed_at.nbytes + self._wind_speeds.nbytes + self._wind_directions.nbytes
+
+    def __len__(self) -> int:
+        return int(self._wind_speeds.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> WindReading: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'WindDataset': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return WindDataset(
+                self._observed_at[index], self._wind_speeds[index], self._wind_directions[index],
+                dtype=self.dtype)
+        return self._reading(index)
+
+    def __iter__(self) -> Iterator[WindReading]:
+        for i in range(len(self)):
+            yield self._reading(i)
+
+    def __repr__(self) -> str:
+        return f"WindDataset(rows={len(self)}, dtype={self.dtype})"
+
+    def _reading(self, index: int) -> WindReading:
+        # datetime64[us] への変換で datetime.datetime を得る（ns 以下は切り捨て）
+        return WindReading(
+            observed_at=self._observed_at[index].astype('datetime64[us]').item(),
+            wind_speed=float(self._wind_speeds[index]),
+            wind_direction=float(self._wind_directions[index]),
+        )
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+import numpy
+from wind_compass.domain.constants import DEFAULT_SPEED_BIN_WIDTH, DEFAULT_DIRECTION_BIN_WIDTH, INTEGRATION_LEFT
+from wind_compass.domain.energy_integration import EnergyIntegrator
+
+
+def interval_hours(timestamps) -> numpy.ndarray:
+    """
+    各データ点から次のデータ点までの時間(h)を返す（区間の始点で積算する方式）。
+    最終点と、時刻が逆行・重複する区間は0hとする。
+    """
+    return EnergyIntegrator(INTEGRATION_LEFT).weights(timestamps)
+
+
+@dataclass(frozen=True)
+class WindHistogram:
+    """
+    (風速, 風向) の時間重み付き同時ヒストグラム。空でないビンのみを保持する。
+    角度シナリオごとの計算をデータ点数 N ではなくビン数に比例させるために使う。
+
+    Args:
+        speeds: 各ビンの代表風速 (m/s, ビン内の時間重み付き平均)
+        directions: 各ビンの代表風向 (deg, ビン内の時間重み付き平均)
+        hours: 各ビンの合計時間 (h)
+        speed_bin_width: 風速のビン幅 (m/s)
+        direction_bin_width: 風向のビン幅 (deg)
+    """
+    speeds: numpy.ndarray
+    directions: numpy.ndarray
+    hours: numpy.ndarray
+    speed_bin_width: float
+    direction_bin_width: float
+
+    @property
+    def bin_count(self) -> int:
+        return int(self.hours.size)
+
+    @classmethod
+    def from_series(cls, speeds, directions, hours,
+                    speed_bin_width: float = DEFAULT_SPEED_BIN_WIDTH,
+                    direction_bin_width: float = DEFAULT_DIRECTION_BIN_WIDTH) -> 'WindHistogram':
+        """
+        データ点を1度だけビンに振り分ける。風向は [0, 360) に正規化する。
+        時間0hの点と NaN を含む点（行単位の計算でも0Wになる）は除外する。
+        """
+        if speed_bin_width <= 0 or direction_bin_width <= 0:
+            raise ValueError("Bin widths must be positive")
+        speeds = numpy.asarray(speeds, dtype=float)
+        directions = numpy.mod(numpy.asarray(directions, dtype=float), 360.0)
+        hours = numpy.asarray(hours, dtype=float)
+        keep = (hours > 0) & numpy.isfinite(speeds) & numpy.isfinite(directions)
+        speeds, directions, hours = speeds[keep], directions[keep], hours[keep]
+        # ビンはビン幅の整数倍を中心とする（量子化された観測値が境界に乗らないように）
+        speed_bins = numpy.rint(speeds / speed_bin_width).astype(numpy.int64)
+        direction_bins = numpy.rint(
+            directions / direction_bin_width).astype(numpy.int64)
+        keys = numpy.stack([speed_bins, direction_bins], axis=1)
+        _, inverse = numpy.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        bin_hours = numpy.bincount(inverse, weights=hours)
+        return cls(
+            speeds=numpy.bincount(inverse, weights=speeds * hours) / bin_hours,
+            directions=numpy.bincount(
+                inverse, weights=directions * hours) / bin_hours,
+            hours=bin_hours,
+            speed_bin_width=float(speed_bin_width),
+            direction_bin_width=float(direction_bin_width),
+        )
+
+    def integrate(self, power) -> float:
+        """各ビンの瞬時電力(W)から合計エネルギー(Wh)を返す。"""
+        return float(numpy.dot(numpy.asarray(power, dtype=float), self.hours))
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional
+import numpy
+from wind_compass.domain.constants import UNIQUE_PAIRS_MAX_FRACTION
+
+
+@dataclass(frozen=True)
+class UniqueWindPairs:
+    """
+    風速・風向の組の重複を除いた配列と、各データ点がどの組かを表す inverse。
+    観測値は量子化されている（風速0.1m/s刻み、風向16方位・1度刻み）ため、組の種類はデータ点数よりずっと少ない。
+
+    組ごとに計算した値を values[inverse] でデータ点に戻すと、データ点ごとに計算した値とビット単位で一致する。
+    組は浮動小数点数の == で比較する（±0 は同じ組として扱い、NaN を含む点はまとめない）。
+    ヒストグラム（WindHistogram）と異なり、ビンへの丸めは行わない。
+
+    Args:
+        speeds: 各組の風速 (m/s)
+        directions: 各組の風向 (deg)
+        inverse: 各データ点の組の位置（speeds[inverse] が元の風速に一致する）
+    """
+    speeds: numpy.ndarray
+    directions: numpy.ndarray
+    inverse: numpy.ndarray
+
+    @property
+    def pair_count(self) -> int:
+        return int(self.speeds.size)
+
+    @cached_property
+    def row_counts(self) -> numpy.ndarray:
+        """各組に含まれるデータ点の数"""
+        return numpy.bincount(self.inverse, minlength=self.pair_count)
+
+    @classmethod
+    def from_series(cls, speeds, directions) -> 'UniqueWindPairs':
+        speeds = numpy.asarray(speeds, dtype=float).reshape(-1)
+        directions = numpy.asarray(directions, dtype=float).reshape(-1)
+        if speeds.shape != directions.shape:
+            raise ValueError("speeds and directions must have the same shape")
+        # (風速, 風向) を複素数の (実部, 虚部) にまとめ、1次元の numpy.unique で辞書順に重複を除く
+        keys = numpy.empty(speeds.shape, dtype=numpy.complex128)
+        keys.real = speeds
+        keys.imag = directions
+        pairs, inverse = numpy.unique(keys, return_inverse=True, equal_nan=False)
+        return cls(pairs.real.copy(), pairs.imag.copy(), inverse.reshape(-1))
+
+
+def collapse_wind_pairs(speeds, directions,
+                        max_fraction: float = UNIQUE_PAIRS_MAX_FRACTION) -> Optional[UniqueWindPairs]:
+    """
+    組の数がデータ点数の max_fraction 以下の場合のみ UniqueWindPairs を返し、それ以外は None を返す
+    （重複が少ないデータでは重複除去の並べ替えの方が高くつくため、データ点ごとに計算する）。
+    """
+    speeds = numpy.asarray(speeds, dtype=float)
+    if speeds.ndim != 1 or speeds.size < 2:
+        return None
+    pairs = UniqueWindPairs.from_series(speeds, directions)
+    if pairs.pair_count > max_fraction * speeds.size:
+        return None
+    return pairs
@@ -0,0 +1,59 @@
+from typing import Callable, List
+import numpy
+from wind_compass.domain.constants import (
+    DEFAULT_INTEGRATION_RULE, DEFAULT_MAX_BLOCK_ELEMENTS, DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM)
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, ScenarioResult
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+
+class RunAngleSweepUseCase:
+    """
+    複数の風車角度を1回のデータ走査でまとめて計算するユースケース。
+    run_single_scenario.RunSingleSimulationScenarioUseCase と同じく、
+    積分方式（既定は fixed: 全データ点に固定のΔt=10分=1/6h）の時間重みを掛けて年間発電量を求める。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator],
+                 max_block_elements: int = DEFAULT_MAX_BLOCK_ELEMENTS):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._power_generation_simulator_factory = power_generation_simulator_factory
+        self._max_block_elements = max_block_elements
+
+    def execute(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        """
+        入力の読み込みや計算に失敗した場合は例外を送出する
+        （呼び出し側は角度ごとの実行に切り替えてエラーを角度単位で扱う）。
+        """
+        if input_dto.chunk_size is not None:
+            # チャンクごとに全角度のエネルギーを積算する（保持するのは1チャンク分のみ）
+            chunks = self._wind_data_reader.read_chunks(
+                input_dto.wind_data_path, input_dto.chunk_size)
+        else:
+            chunks = [self._wind_data_reader.read(input_dto.wind_data_path)]
+        integrator = EnergyIntegrator(
+            input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours)
+        model = self._power_plant_model_reader.read(input_dto.config_file_path)
+        simulator = self._power_generation_simulator_factory(model)
+        efficiency = input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY
+        voltage = input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE
+        cut_in_rpm = input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM
+        energy_wh = numpy.zeros(len(input_dto.angles))
+        row_count = 0
+        for dataset, hours in integrator.weighted_chunks(chunks):
+            energy_wh += simulator.calculate_energy_by_angle(
+                dataset.wind_speeds, dataset.wind_directions, hours, input_dto.angles,
+                efficiency, voltage, cut_in_rpm,
+                max_block_elements=self._max_block_elements)
+            row_count += len(dataset)
+        if not row_count:
+            raise ValueError("No wind data found or file is empty.")
+        return [
+            ScenarioResult(angle=angle, annual_power_kwh=float(e) / 1000.0)
+            for angle, e in zip(input_dto.angles, energy_wh)
+        ]
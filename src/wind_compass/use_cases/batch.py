@@ -0,0 +1,82 @@
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from wind_compass.use_cases.dtos import BatchInputDTO, BatchParameterSet, BatchResult, MultipleScenariosInputDTO
+from wind_compass.use_cases.input_cache import InputCache
+
+
+def default_batch_workers() -> int:
+    return os.cpu_count() or 1
+
+
+class RunBatchUseCase:
+    """
+    (風況データ, 設備特性コンフィグ, パラメータセット) の全組み合わせをタスクとし、
+    各タスクで全角度を RunMultipleSimulationScenariosUseCase で評価するユースケース。
+
+    重複を除いた各ファイルは最初に入力キャッシュへ1回だけ読み込み、タスクはスレッドプールで並行に実行する
+    （numpy の配列演算は GIL を解放するため、タスク間で計算が重なる）。
+    読み込めないファイルや失敗したタスクはバッチを中断せず、該当タスクの全角度の行にエラーを記録する。
+    結果はタスクの順（風況データ → コンフィグ → パラメータセット）、タスク内は角度の順に並べる。
+    """
+
+    def __init__(self, multiple_scenarios_use_case, input_cache: InputCache):
+        # multiple_scenarios_use_case のリーダは input_cache を経由している必要がある
+        self._multiple_scenarios_use_case = multiple_scenarios_use_case
+        self._input_cache = input_cache
+
+    def execute(self, input_dto: BatchInputDTO) -> List[BatchResult]:
+        load_errors = self._preload(input_dto)
+        tasks = list(itertools.product(
+            input_dto.wind_data_paths, input_dto.config_file_paths, input_dto.parameter_sets))
+        workers = max(1, min(input_dto.workers or default_batch_workers(), len(tasks) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_task, wind_data_path, config_file_path, parameter_set,
+                                input_dto.angles, load_errors)
+                for wind_data_path, config_file_path, parameter_set in tasks
+            ]
+            return [result for future in futures for result in future.result()]
+
+    def _preload(self, input_dto: BatchInputDTO) -> Dict[str, str]:
+        """重複を除いた入力ファイルを読み込み、読み込めなかったファイル -> エラーメッセージを返す。"""
+        load_errors = {}
+        for path in dict.fromkeys(input_dto.wind_data_paths):
+            try:
+                self._input_cache.read_wind_data(path)
+            except Exception as e:
+                load_errors[path] = f"{path}: {e}"
+        for path in dict.fromkeys(input_dto.config_file_paths):
+            try:
+                self._input_cache.read_power_plant_model(path)
+            except Exception as e:
+                load_errors[path] = f"{path}: {e}"
+        return load_errors
+
+    def _run_task(self, wind_data_path: str, config_file_path: str, parameter_set: BatchParameterSet,
+                  angles: List[float], load_errors: Dict[str, str]) -> List[BatchResult]:
+        def row(angle: float, annual_power_kwh: Optional[float] = None, error_message: Optional[str] = None):
+            return BatchResult(
+                wind_data_path=wind_data_path, config_file_path=config_file_path,
+                parameter_set=parameter_set.name, angle=angle,
+                annual_power_kwh=annual_power_kwh, error_message=error_message)
+
+        error = load_errors.get(wind_data_path) or load_errors.get(config_file_path)
+        if error is not None:
+            return [row(angle, error_message=error) for angle in angles]
+        try:
+            results = self._multiple_scenarios_use_case.execute(MultipleScenariosInputDTO(
+                wind_data_path=wind_data_path,
+                config_file_path=config_file_path,
+                angles=list(angles),
+                efficiency=parameter_set.efficiency,
+                voltage=parameter_set.voltage,
+                cut_in_rpm=parameter_set.cut_in_rpm,
+                engine=parameter_set.engine,
+                integration_rule=parameter_set.integration_rule,
+                max_gap_hours=parameter_set.max_gap_hours,
+            ))
+        except Exception as e:
+            return [row(angle, error_message=str(e)) for angle in angles]
+        return [row(r.angle, r.annual_power_kwh, r.error_message) for r in results]
@@ -1,5 +1,23 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
+from wind_compass.domain.constants import (
+    DEFAULT_SPEED_BIN_WIDTH, DEFAULT_DIRECTION_BIN_WIDTH, DEFAULT_COARSE_ANGLE_STEP_DEG, DEFAULT_ANGLE_TOLERANCE_DEG,
+    DEFAULT_INTEGRATION_RULE, DEFAULT_TIMESTAMP_INTEGRATION_RULE)
+
+# シミュレーションエンジン: exact=全データ点を厳密計算, table=有効風速→電力の伝達関数表で補間,
+# histogram=(風速, 風向)の時間重み付きヒストグラム上で評価（複数シナリオのみ）
+ENGINE_EXACT = "exact"
+ENGINE_TABLE = "table"
+ENGINE_HISTOGRAM = "histogram"
+SIMULATION_ENGINES = (ENGINE_EXACT, ENGINE_TABLE, ENGINE_HISTOGRAM)
+
+
+def default_integration_rule(engine: str) -> str:
+    """
+    Integration rule used when none is given: the histogram engine weights readings by their observed_at gaps ("left"),
+    the row-wise exact/table engines by a fixed 10-minute step ("fixed").
+    """
+    return DEFAULT_TIMESTAMP_INTEGRATION_RULE if engine == ENGINE_HISTOGRAM else DEFAULT_INTEGRATION_RULE
 
 
 @dataclass(frozen=True)
@@ -14,6 +32,11 @@ class SingleScenarioInputDTO:
         efficiency: Overall efficiency (e.g., 0.85 for 85%). Defaults to None.
         voltage: Generator terminal voltage (V). Defaults to None.
         cut_in_rpm: Generator cut-in RPM. Defaults to None.
+        engine: Simulation engine ("exact" or "table"). Defaults to "exact".
+        chunk_size: If set, stream the wind data in chunks of this many rows so memory stays bounded. Defaults to None (load the whole file).
+        integration_rule: Energy integration rule ("fixed", "left" or "trapezoid"). Defaults to None ("fixed" in run_single_scenario, "left" in the timestamp-based simulation_use_cases variant).
+        max_gap_hours: Cap (h) on a single interval between readings so data outages don't inflate energy. Defaults to None (no cap).
+        threads: Number of threads integrating fixed-size row chunks of an in-memory series. Defaults to None (single-threaded).
     """
     wind_data_path: str
     config_file_path: str
@@ -21,6 +44,11 @@ class SingleScenarioInputDTO:
     efficiency: Optional[float] = None
     voltage: Optional[float] = None
     cut_in_rpm: Optional[float] = None
+    engine: str = ENGINE_EXACT
+    chunk_size: Optional[int] = None
+    integration_rule: Optional[str] = None
+    max_gap_hours: Optional[float] = None
+    threads: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -31,9 +59,11 @@ class SingleScenarioOutputDTO:
     Args:
         annual_power_kwh: Calculated annual power generation in kWh. Optional if an error occurred.
         error_message: Error message if the simulation for this scenario failed. Optional.
+        max_interpolation_error_w: Max interpolation error (W) of the transfer table against the exact path. Only set for the "table" engine.
     """
     annual_power_kwh: Optional[float] = None
     error_message: Optional[str] = None
+    max_interpolation_error_w: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -48,6 +78,16 @@ class MultipleScenariosInputDTO:
         efficiency: Overall efficiency (e.g., 0.85 for 85%). Applied to all scenarios if provided. Defaults to None.
         voltage: Generator terminal voltage (V). Applied to all scenarios if provided. Defaults to None.
         cut_in_rpm: Generator cut-in RPM. Applied to all scenarios if provided. Defaults to None.
+        engine: Simulation engine ("exact", "table" or "histogram"). Applied to all scenarios. Defaults to "exact".
+        speed_bin_width: Wind speed bin width (m/s) for the "histogram" engine.
+        direction_bin_width: Wind direction bin width (deg) for the "histogram" engine.
+        compare_exact: For the "histogram" engine, also integrate every reading and report the energy difference. Defaults to False.
+        chunk_size: If set, stream the wind data in chunks of this many rows ("exact" and "table" engines). Defaults to None.
+        integration_rule: Energy integration rule ("fixed", "left" or "trapezoid"). Applied to all scenarios. Defaults to None (default_integration_rule(engine)).
+        max_gap_hours: Cap (h) on a single interval between readings. Applied to all scenarios. Defaults to None (no cap).
+        incremental: Resume each scenario from its persisted accumulator and simulate only readings appended since the last run ("exact" engine). Defaults to False.
+        workers: Number of worker processes for the "exact" engine. Defaults to None (serial).
+        threads: Number of threads for each single-scenario run. Passed to every per-angle scenario. Defaults to None (single-threaded).
     """
     wind_data_path: str
     config_file_path: str
@@ -55,6 +95,16 @@ class MultipleScenariosInputDTO:
     efficiency: Optional[float] = None
     voltage: Optional[float] = None
     cut_in_rpm: Optional[float] = None
+    engine: str = ENGINE_EXACT
+    speed_bin_width: float = DEFAULT_SPEED_BIN_WIDTH
+    direction_bin_width: float = DEFAULT_DIRECTION_BIN_WIDTH
+    compare_exact: bool = False
+    chunk_size: Optional[int] = None
+    integration_rule: Optional[str] = None
+    max_gap_hours: Optional[float] = None
+    incremental: bool = False
+    workers: Optional[int] = None
+    threads: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -66,8 +116,236 @@ class ScenarioResult:
         angle: The turbine angle for this scenario.
         annual_power_kwh: Calculated annual power generation in kWh for this scenario. Optional if an error occurred.
         error_message: Error message if the simulation for this scenario failed. Optional.
+        max_interpolation_error_w: Max interpolation error (W) of the transfer table against the exact path. Only set for the "table" engine.
+        exact_energy_difference_kwh: Histogram result minus the exact row-wise integration (kWh). Only set for the "histogram" engine with compare_exact.
+        input_cache_hits: Input cache hits during the whole run this scenario belongs to. Only set when an input cache is used.
+        input_cache_misses: Input cache misses during the whole run this scenario belongs to. Only set when an input cache is used.
+        rows_simulated: Number of readings simulated in this run. Only set in incremental mode (0 when nothing was appended).
+        result_cache_hit: Whether this result was served from the result cache. Only set when a result cache is used.
     """
     angle: float
     # Renamed from annual_power for consistency
     annual_power_kwh: Optional[float] = None
     error_message: Optional[str] = None
+    max_interpolation_error_w: Optional[float] = None
+    exact_energy_difference_kwh: Optional[float] = None
+    input_cache_hits: Optional[int] = None
+    input_cache_misses: Optional[int] = None
+    rows_simulated: Optional[int] = None
+    result_cache_hit: Optional[bool] = None
+
+
+@dataclass(frozen=True)
+class ScenarioState:
+    """
+    Persisted accumulator of one scenario for incremental runs.
+
+    Args:
+        rows: Number of leading readings already integrated.
+        prefix_hash: Hash of those readings, used to detect changes to earlier data.
+        energy_wh: Energy (Wh) integrated over those readings, treating the last one as the end of the series.
+        last_observed_at_ns: Timestamp (ns since epoch) of the last integrated reading.
+        last_wind_speed: Wind speed (m/s) of the last integrated reading.
+        last_wind_direction: Wind direction (deg) of the last integrated reading.
+    """
+    rows: int
+    prefix_hash: str
+    energy_wh: float
+    last_observed_at_ns: int
+    last_wind_speed: float
+    last_wind_direction: float
+
+
+@dataclass(frozen=True)
+class BatchParameterSet:
+    """
+    Named set of scenario parameters in a batch manifest.
+
+    Args:
+        name: Label of the parameter set in the result table.
+        efficiency: Overall efficiency (e.g., 0.85 for 85%). Defaults to None.
+        voltage: Generator terminal voltage (V). Defaults to None.
+        cut_in_rpm: Generator cut-in RPM. Defaults to None.
+        engine: Simulation engine ("exact", "table" or "histogram"). Defaults to "exact".
+        integration_rule: Energy integration rule ("fixed", "left" or "trapezoid"). Defaults to None (default_integration_rule(engine)).
+        max_gap_hours: Cap (h) on a single interval between readings. Defaults to None (no cap).
+    """
+    name: str
+    efficiency: Optional[float] = None
+    voltage: Optional[float] = None
+    cut_in_rpm: Optional[float] = None
+    engine: str = ENGINE_EXACT
+    integration_rule: Optional[str] = None
+    max_gap_hours: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BatchInputDTO:
+    """
+    Input DTO for a batch of sites x configs x parameter sets, each evaluated at every angle.
+
+    Args:
+        wind_data_paths: Paths to the wind data files (sites).
+        config_file_paths: Paths to the power plant model JSON config files.
+        angles: Turbine angles in degrees, evaluated for every task.
+        parameter_sets: Parameter sets; every (site, config) pair is run once per set.
+        workers: Number of tasks run concurrently. Defaults to None (the use case's default).
+    """
+    wind_data_paths: List[str]
+    config_file_paths: List[str]
+    angles: List[float]
+    parameter_sets: List[BatchParameterSet] = field(default_factory=lambda: [BatchParameterSet(name="default")])
+    workers: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    One row of the consolidated batch result table (one task at one angle).
+
+    Args:
+        wind_data_path: Wind data file of the task.
+        config_file_path: Config file of the task.
+        parameter_set: Name of the parameter set of the task.
+        angle: Turbine angle in degrees.
+        annual_power_kwh: Annual power generation in kWh. Optional if the task failed.
+        error_message: Error message if the task (or this angle) failed. Optional.
+    """
+    wind_data_path: str
+    config_file_path: str
+    parameter_set: str
+    angle: float
+    annual_power_kwh: Optional[float] = None
+    error_message: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ParameterSweepInputDTO:
+    """
+    Input DTO for sweeping the full grid of angles x efficiencies x voltages x cut-in RPMs.
+
+    Args:
+        wind_data_path: Path to the wind data file.
+        config_file_path: Path to the power plant model JSON config file.
+        angles: Turbine angles in degrees.
+        efficiencies: Overall efficiencies to sweep. Defaults to an empty list (the default efficiency only).
+        voltages: Generator terminal voltages (V) to sweep. Defaults to an empty list (the default voltage only).
+        cut_in_rpms: Generator cut-in RPMs to sweep. Defaults to an empty list (the default cut-in RPM only).
+        integration_rule: Energy integration rule ("fixed", "left" or "trapezoid"). Defaults to None (DEFAULT_INTEGRATION_RULE, "fixed").
+        max_gap_hours: Cap (h) on a single interval between readings. Defaults to None (no cap).
+    """
+    wind_data_path: str
+    config_file_path: str
+    angles: List[float]
+    efficiencies: List[float] = field(default_factory=list)
+    voltages: List[float] = field(default_factory=list)
+    cut_in_rpms: List[float] = field(default_factory=list)
+    integration_rule: Optional[str] = None
+    max_gap_hours: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ParameterSweepResult:
+    """
+    One cell of the parameter sweep grid.
+
+    Args:
+        angle: Turbine angle in degrees.
+        efficiency: Overall efficiency.
+        voltage: Generator terminal voltage (V).
+        cut_in_rpm: Generator cut-in RPM.
+        annual_power_kwh: Annual power generation in kWh.
+    """
+    angle: float
+    efficiency: float
+    voltage: float
+    cut_in_rpm: float
+    annual_power_kwh: float
+
+
+@dataclass(frozen=True)
+class GearMatrixInputDTO:
+    """
+    Input DTO for computing annual power over every angle x gear ratio combination.
+
+    Args:
+        wind_data_path: Path to the wind data file.
+        config_file_path: Path to the power plant model JSON config file (must define rotor_speed_curve).
+        angles: Turbine angles in degrees.
+        gear_ratios: Gear ratios (generator RPM / rotor RPM).
+        efficiency: Overall efficiency (e.g., 0.85 for 85%). Defaults to None.
+        voltage: Generator terminal voltage (V). Defaults to None.
+        cut_in_rpm: Generator cut-in RPM. Defaults to None.
+        integration_rule: Energy integration rule ("fixed", "left" or "trapezoid"). Defaults to None (DEFAULT_INTEGRATION_RULE, "fixed").
+        max_gap_hours: Cap (h) on a single interval between readings. Defaults to None (no cap).
+    """
+    wind_data_path: str
+    config_file_path: str
+    angles: List[float]
+    gear_ratios: List[float]
+    efficiency: Optional[float] = None
+    voltage: Optional[float] = None
+    cut_in_rpm: Optional[float] = None
+    integration_rule: Optional[str] = None
+    max_gap_hours: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class GearMatrixResult:
+    """
+    One cell of the angle x gear ratio matrix.
+
+    Args:
+        angle: Turbine angle in degrees.
+        gear_ratio: Gear ratio (generator RPM / rotor RPM).
+        annual_power_kwh: Annual power generation in kWh.
+    """
+    angle: float
+    gear_ratio: float
+    annual_power_kwh: float
+
+
+@dataclass(frozen=True)
+class OptimizeAngleInputDTO:
+    """
+    Input DTO for searching the turbine angle that maximizes annual power generation.
+
+    Args:
+        wind_data_path: Path to the wind data CSV file.
+        config_file_path: Path to the power plant model JSON config file.
+        efficiency: Overall efficiency (e.g., 0.85 for 85%). Defaults to None.
+        voltage: Generator terminal voltage (V). Defaults to None.
+        cut_in_rpm: Generator cut-in RPM. Defaults to None.
+        coarse_step_deg: Step (deg) of the coarse sweep over 0-360 deg.
+        tolerance_deg: Resolution (deg) of the local refinement around the best coarse angles.
+        integration_rule: Energy integration rule ("fixed", "left" or "trapezoid"). Defaults to None (DEFAULT_INTEGRATION_RULE, "fixed").
+        max_gap_hours: Cap (h) on a single interval between readings. Defaults to None (no cap).
+    """
+    wind_data_path: str
+    config_file_path: str
+    efficiency: Optional[float] = None
+    voltage: Optional[float] = None
+    cut_in_rpm: Optional[float] = None
+    coarse_step_deg: float = DEFAULT_COARSE_ANGLE_STEP_DEG
+    tolerance_deg: float = DEFAULT_ANGLE_TOLERANCE_DEG
+    integration_rule: Optional[str] = None
+    max_gap_hours: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class OptimizeAngleOutputDTO:
+    """
+    Output DTO for the turbine angle optimization.
+
+    Args:
+        optimal_angle: Angle (deg, 0-360) with the maximum annual power generation. Optional if an error occurred.
+        annual_power_kwh: Annual power generation at the optimal angle in kWh. Optional if an error occurred.
+        coarse_curve: Annual power generation for every angle of the coarse sweep.
+        evaluations: Number of angles evaluated, including the coarse sweep.
+        error_message: Error message if the optimization failed. Optional.
+    """
+    optimal_angle: Optional[float] = None
+    annual_power_kwh: Optional[float] = None
+    coarse_curve: List[ScenarioResult] = field(default_factory=list)
+    evaluations: int = 0
+    error_message: Optional[str] = None
@@ -0,0 +1,49 @@
+import itertools
+from typing import Callable, List
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM, DEFAULT_INTEGRATION_RULE
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import GearMatrixInputDTO, GearMatrixResult
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+
+class RunGearMatrixUseCase:
+    """
+    (角度, 増速比) の全組み合わせの年間発電量を求めるユースケース。
+
+    PowerGenerationSimulator.calculate_energy_by_angle_and_gear で全組み合わせを1回のデータ走査で計算する
+    （軸動力の釣り合いの回転数は (角度, データ点) ごとに1度だけ解く）。
+    設備特性コンフィグには rotor_speed_curve（有効風速 → 風車回転数）が必要。
+    積分方式の既定は fixed（RunAngleSweepUseCase と同じ）。入力の読み込みに失敗した場合は例外を送出する。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator]):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._power_generation_simulator_factory = power_generation_simulator_factory
+
+    def execute(self, input_dto: GearMatrixInputDTO) -> List[GearMatrixResult]:
+        """結果は角度 → 増速比の順に並べる。"""
+        dataset = WindDataset.as_dataset(self._wind_data_reader.read(input_dto.wind_data_path))
+        if not len(dataset):
+            raise ValueError("No wind data found or file is empty.")
+        integrator = EnergyIntegrator(
+            input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours)
+        model = self._power_plant_model_reader.read(input_dto.config_file_path)
+        simulator = self._power_generation_simulator_factory(model)
+        energy_wh = simulator.calculate_energy_by_angle_and_gear(
+            dataset.wind_speeds, dataset.wind_directions, integrator.weights(dataset.observed_at),
+            input_dto.angles, input_dto.gear_ratios,
+            input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY,
+            input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE,
+            input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM)
+        return [
+            GearMatrixResult(angle=angle, gear_ratio=gear_ratio,
+                             annual_power_kwh=float(energy_wh[i, j]) / 1000.0)
+            for (i, angle), (j, gear_ratio) in itertools.product(
+                enumerate(input_dto.angles), enumerate(input_dto.gear_ratios))
+        ]
@@ -0,0 +1,73 @@
+from typing import Callable, List
+import numpy
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM, DEFAULT_TIMESTAMP_INTEGRATION_RULE
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_histogram import WindHistogram
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, ScenarioResult
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+
+class RunHistogramScenariosUseCase:
+    """
+    風況データを1度だけ (風速, 風向) の時間重み付き同時ヒストグラムに集約し、
+    各角度シナリオをデータ点ではなくビン上で評価するユースケース。
+    時間重みは observed_at の差分から積分方式（既定は left: 区間の始点で積算）で求める。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator]):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._power_generation_simulator_factory = power_generation_simulator_factory
+
+    def execute(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        """
+        compare_exact=True の場合、各角度で全データ点を厳密に積算した結果との差
+        (ヒストグラム - 厳密, kWh) を exact_energy_difference_kwh に設定する。
+        """
+        try:
+            dataset = WindDataset.as_dataset(
+                self._wind_data_reader.read(input_dto.wind_data_path))
+            model = self._power_plant_model_reader.read(
+                input_dto.config_file_path)
+            speeds = dataset.wind_speeds
+            directions = dataset.wind_directions
+            integrator = EnergyIntegrator(
+                input_dto.integration_rule or DEFAULT_TIMESTAMP_INTEGRATION_RULE, input_dto.max_gap_hours)
+            hours = integrator.weights(dataset.observed_at)
+            histogram = WindHistogram.from_series(
+                speeds, directions, hours,
+                speed_bin_width=input_dto.speed_bin_width,
+                direction_bin_width=input_dto.direction_bin_width)
+            simulator = self._power_generation_simulator_factory(model)
+        except Exception as e:
+            return [ScenarioResult(angle=angle, error_message=str(e)) for angle in input_dto.angles]
+
+        efficiency = input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY
+        voltage = input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE
+        cut_in_rpm = input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM
+        results = []
+        for angle in input_dto.angles:
+            try:
+                power = simulator.calculate_power_series(
+                    histogram.speeds, histogram.directions, angle, efficiency, voltage, cut_in_rpm)
+                annual_power_kwh = histogram.integrate(power) / 1000.0
+                difference_kwh = None
+                if input_dto.compare_exact:
+                    exact_power = simulator.calculate_power_series(
+                        speeds, directions, angle, efficiency, voltage, cut_in_rpm)
+                    exact_kwh = float(numpy.dot(exact_power, hours)) / 1000.0
+                    difference_kwh = annual_power_kwh - exact_kwh
+                results.append(ScenarioResult(
+                    angle=angle,
+                    annual_power_kwh=annual_power_kwh,
+                    exact_energy_difference_kwh=difference_kwh
+                ))
+            except Exception as e:
+                results.append(ScenarioResult(
+                    angle=angle, annual_power_kwh=None, error_message=str(e)))
+        return results
@@ -0,0 +1,160 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from typing import Callable, Dict, List, Optional
+import numpy
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM, DEFAULT_INTEGRATION_RULE
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, ScenarioResult, ScenarioState
+from wind_compass.use_cases.input_cache import reader_parse_options
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader, ScenarioStateStore
+
+# 積算状態の意味（キー・ハッシュの作り方や積算方法）を変えた場合は上げる（古い状態は使われず全件を計算し直す）
+STATE_FORMAT_VERSION = 2
+
+
+def prefix_hash(dataset: WindDataset, rows: int) -> str:
+    """先頭 rows 行の時刻・風速・風向のハッシュ（風速・風向は float64 に揃える）。"""
+    digest = hashlib.sha256()
+    digest.update(numpy.ascontiguousarray(dataset.observed_at[:rows]).view(numpy.int64))
+    digest.update(numpy.ascontiguousarray(dataset.wind_speeds[:rows], dtype=numpy.float64))
+    digest.update(numpy.ascontiguousarray(dataset.wind_directions[:rows], dtype=numpy.float64))
+    return digest.hexdigest()
+
+
+class RunIncrementalScenariosUseCase:
+    """
+    追記されていく風況データに対し、前回までの積算結果を引き継いで追記分の行だけを計算するユースケース。
+
+    (風況データ・その読み込みオプション, 設備特性, 角度, パラメータ) ごとに、積算した発電量・行数・先頭からその行までのハッシュ・
+    最後に積算した行を ScenarioStateStore に保存する。次回は保存した行数までのハッシュが一致すれば
+    最後に積算した行から先だけを計算し、継ぎ目の区間（最後の行の時間重み）を積分方式に従って補正する。
+    既存の行が変わった・減った場合や状態が無い場合は全件を計算し直す。
+    積分方式の既定は fixed（run_single_scenario と同じ）。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator],
+                 state_store: ScenarioStateStore):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._power_generation_simulator_factory = power_generation_simulator_factory
+        self._state_store = state_store
+
+    def execute(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        try:
+            dataset = WindDataset.as_dataset(
+                self._wind_data_reader.read(input_dto.wind_data_path))
+            if not len(dataset):
+                raise ValueError("No wind data found or file is empty.")
+            model = self._power_plant_model_reader.read(input_dto.config_file_path)
+            integrator = EnergyIntegrator(
+                input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours)
+            simulator = self._power_generation_simulator_factory(model)
+            # 読み込みオプション（時刻の形式など）が変わった場合は、保存した状態を引き継がない
+            parse_options = reader_parse_options(self._wind_data_reader, input_dto.wind_data_path)
+        except Exception as e:
+            return [ScenarioResult(angle=angle, error_message=str(e)) for angle in input_dto.angles]
+
+        efficiency = input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY
+        voltage = input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE
+        cut_in_rpm = input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM
+        # 行数ごとのハッシュは角度間で共有する（通常は保存済みの行数と全行数の2回のみ計算する）
+        hashes: Dict[int, str] = {}
+
+        def hash_of(rows: int) -> str:
+            if rows not in hashes:
+                hashes[rows] = prefix_hash(dataset, rows)
+            return hashes[rows]
+
+        results = []
+        for angle in input_dto.angles:
+            try:
+                key = self._scenario_key(
+                    input_dto, parse_options, model, integrator, angle, efficiency, voltage, cut_in_rpm)
+                state = self._state_store.load(input_dto.wind_data_path, key)
+                start = self._resume_rows(state, dataset, hash_of)
+                energy_wh = state.energy_wh if start else 0.0
+                if start < len(dataset):
+                    energy_wh += self._integrate_from(
+                        simulator, integrator, dataset, start, angle, efficiency, voltage, cut_in_rpm)
+                logging.info(
+                    f"Incremental angle={angle:g}: "
+                    + (f"resumed after {start} rows" if start else "full recompute")
+                    + f", simulated {len(dataset) - start} rows")
+                last = dataset[len(dataset) - 1]
+                self._state_store.save(input_dto.wind_data_path, key, ScenarioState(
+                    rows=len(dataset),
+                    prefix_hash=hash_of(len(dataset)),
+                    energy_wh=energy_wh,
+                    last_observed_at_ns=int(dataset.observed_at[-1].astype(numpy.int64)),
+                    last_wind_speed=last.wind_speed,
+                    last_wind_direction=last.wind_direction,
+                ))
+                results.append(ScenarioResult(
+                    angle=angle,
+                    annual_power_kwh=energy_wh / 1000.0,
+                    rows_simulated=len(dataset) - start,
+                ))
+            except Exception as e:
+                results.append(ScenarioResult(
+                    angle=angle, annual_power_kwh=None, error_message=str(e)))
+        return results
+
+    def _integrate_from(self, simulator, integrator: EnergyIntegrator, dataset: WindDataset, start: int,
+                        angle: float, efficiency: float, voltage: float, cut_in_rpm: float) -> float:
+        """
+        start 行目以降を積算した発電量(Wh)を返す。start > 0 の場合は、前回は系列の終端として積算した
+        start-1 行目も含めて計算し、終端としての重みとの差分だけを加える（継ぎ目の区間の補正）。
+        """
+        seam = max(start - 1, 0)
+        tail = dataset[seam:]
+        previous = dataset.observed_at[seam - 1] if seam > 0 else None
+        power = numpy.asarray(simulator.calculate_power_series(
+            tail.wind_speeds, tail.wind_directions, angle, efficiency, voltage, cut_in_rpm), dtype=float)
+        weights = integrator.weights(tail.observed_at, previous)
+        if start > 0:
+            # 前回は最後の行を終端（後続の区間なし）として積算している
+            weights[0] -= integrator.weights(tail.observed_at[:1], previous)[0]
+        return float(numpy.dot(power, weights))
+
+    @staticmethod
+    def _resume_rows(state: Optional[ScenarioState], dataset: WindDataset,
+                     hash_of: Callable[[int], str]) -> int:
+        """前回の積算を引き継げる場合はその行数を、引き継げない場合は0を返す。"""
+        if state is None or not 0 < state.rows <= len(dataset):
+            return 0
+        last = state.rows - 1
+        # ハッシュを計算する前に、最後に積算した行が一致するかを確認する
+        if (int(dataset.observed_at[last].astype(numpy.int64)) != state.last_observed_at_ns
+                or float(dataset.wind_speeds[last]) != state.last_wind_speed
+                or float(dataset.wind_directions[last]) != state.last_wind_direction):
+            logging.info("Earlier wind data changed (last integrated reading differs); recomputing")
+            return 0
+        if hash_of(state.rows) != state.prefix_hash:
+            logging.info("Earlier wind data changed (prefix hash differs); recomputing")
+            return 0
+        return state.rows
+
+    @staticmethod
+    def _scenario_key(input_dto: MultipleScenariosInputDTO, parse_options: dict, model, integrator: EnergyIntegrator,
+                      angle: float, efficiency: float, voltage: float, cut_in_rpm: float) -> str:
+        scenario = {
+            "version": STATE_FORMAT_VERSION,
+            "wind_data": os.path.realpath(input_dto.wind_data_path),
+            "wind_parse_options": parse_options,
+            "model": dataclasses.asdict(model),
+            "angle": angle,
+            "efficiency": efficiency,
+            "voltage": voltage,
+            "cut_in_rpm": cut_in_rpm,
+            "integration_rule": integrator.rule,
+            "max_gap_hours": integrator.max_gap_hours,
+        }
+        return hashlib.sha256(json.dumps(scenario, sort_keys=True).encode("utf-8")).hexdigest()
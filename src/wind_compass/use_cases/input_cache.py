@@ -0,0 +1,127 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from wind_compass.domain.models import PowerPlantModel
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+
+@dataclass(frozen=True)
+class InputCacheStats:
+    """
+    Hit/miss counters of the input cache.
+
+    Args:
+        hits: Number of reads served from the cache.
+        misses: Number of reads that went to the underlying reader.
+    """
+    hits: int = 0
+    misses: int = 0
+
+
+def _file_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+    # (実パス, 更新時刻ns, サイズ)。stat できないパスはキャッシュしない
+    try:
+        st = os.stat(file_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return os.path.realpath(file_path), st.st_mtime_ns, st.st_size
+
+
+def reader_parse_options(wind_data_reader, file_path: str) -> dict:
+    """風況データリーダの parse_options（読み込み結果を変えるオプション）を返す。"""
+    # WindDataReader を継承しないリーダ（parse_options が無い・dict を返さない）はオプション無しとして扱う
+    parse_options = getattr(wind_data_reader, "parse_options", None)
+    options = parse_options(file_path) if callable(parse_options) else None
+    return options if isinstance(options, dict) else {}
+
+
+class InputCache:
+    """
+    風況データと設備特性コンフィグの読み込み結果を、(パス, 更新時刻, サイズ) をキーに保持するキャッシュ。
+    1回の実行内の複数シナリオで共有し、同じファイルの再パースを避ける。
+    ファイルが更新されると(更新時刻またはサイズが変わると)自動的に読み直す。
+    明示的に破棄する場合は invalidate を呼ぶ。
+    """
+
+    def __init__(self, wind_data_reader: WindDataReader, power_plant_model_reader: PowerPlantModelReader):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._entries: Dict[Tuple[str, str], Tuple[Tuple[str, int, int], object]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def wind_data_reader(self) -> WindDataReader:
+        """キャッシュを経由する WindDataReader（ユースケースへ注入する）"""
+        return _CachedWindDataReader(self)
+
+    @property
+    def power_plant_model_reader(self) -> PowerPlantModelReader:
+        """キャッシュを経由する PowerPlantModelReader（ユースケースへ注入する）"""
+        return _CachedPowerPlantModelReader(self)
+
+    def read_wind_data(self, file_path: str) -> WindDataset:
+        """風況データを読み込む。列は読み取り専用のため、シナリオ間で共有しても変更されない。"""
+        # リーダの parse_options が変わった場合（時刻の形式の指定など）は読み直す
+        kind = "wind " + json.dumps(self.wind_parse_options(file_path), sort_keys=True)
+        return self._read(kind, file_path, lambda: WindDataset.as_dataset(self._wind_data_reader.read(file_path)))
+
+    def read_wind_data_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        """風況データをチャンクごとに読み込む。メモリを抑えるための経路なのでキャッシュせず元のリーダへ委譲する。"""
+        return self._wind_data_reader.read_chunks(file_path, chunk_size)
+
+    def wind_parse_options(self, file_path: str) -> dict:
+        """元の風況データリーダの parse_options（読み込み結果を変えるオプション）"""
+        return reader_parse_options(self._wind_data_reader, file_path)
+
+    def read_power_plant_model(self, file_path: str) -> PowerPlantModel:
+        return self._read("model", file_path, lambda: self._power_plant_model_reader.read(file_path))
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        """指定したファイル（省略時は全て）のキャッシュを破棄する。"""
+        if file_path is None:
+            self._entries.clear()
+            return
+        real_path = os.path.realpath(file_path)
+        for entry in [e for e in self._entries if e[1] == real_path]:
+            del self._entries[entry]
+
+    def stats(self) -> InputCacheStats:
+        return InputCacheStats(hits=self._hits, misses=self._misses)
+
+    def _read(self, kind: str, file_path: str, load: Callable[[], object]):
+        key = _file_key(file_path)
+        if key is not None:
+            cached = self._entries.get((kind, key[0]))
+            if cached is not None and cached[0] == key:
+                self._hits += 1
+                return cached[1]
+        self._misses += 1
+        value = load()
+        if key is not None:
+            self._entries[(kind, key[0])] = (key, value)
+        return value
+
+
+class _CachedWindDataReader(WindDataReader):
+    def __init__(self, cache: InputCache):
+        self._cache = cache
+
+    def read(self, file_path: str) -> WindDataset:
+        return self._cache.read_wind_data(file_path)
+
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        return self._cache.read_wind_data_chunks(file_path, chunk_size)
+
+    def parse_options(self, file_path: str) -> dict:
+        return self._cache.wind_parse_options(file_path)
+
+
+class _CachedPowerPlantModelReader(PowerPlantModelReader):
+    def __init__(self, cache: InputCache):
+        self._cache = cache
+
+    def read(self, file_path: str) -> PowerPlantModel:
+        return self._cache.read_power_plant_model(file_path)
@@ -0,0 +1,60 @@
+from typing import Callable
+from wind_compass.domain.angle_optimizer import find_optimal_angle
+from wind_compass.domain.constants import DEFAULT_INTEGRATION_RULE, DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import OptimizeAngleInputDTO, OptimizeAngleOutputDTO, ScenarioResult
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+
+class OptimizeTurbineAngleUseCase:
+    """
+    年間発電量が最大となる風車角度を 0〜360度 の範囲で探索するユースケース。
+    粗い角度スイープを一括計算した後、上位の局所最大の周辺を黄金分割探索で絞り込む。
+    年間発電量は angle_sweep と同じく積分方式（既定は fixed: 全データ点に固定のΔt=10分=1/6h）の時間重みを掛けて求める。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator]):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._power_generation_simulator_factory = power_generation_simulator_factory
+
+    def execute(self, input_dto: OptimizeAngleInputDTO) -> OptimizeAngleOutputDTO:
+        try:
+            dataset = WindDataset.as_dataset(
+                self._wind_data_reader.read(input_dto.wind_data_path))
+            if not len(dataset):
+                return OptimizeAngleOutputDTO(error_message="No wind data found or file is empty.")
+            model = self._power_plant_model_reader.read(
+                input_dto.config_file_path)
+            speeds = dataset.wind_speeds
+            directions = dataset.wind_directions
+            hours = EnergyIntegrator(
+                input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours).weights(dataset.observed_at)
+            simulator = self._power_generation_simulator_factory(model)
+
+            efficiency = input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY
+            voltage = input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE
+            cut_in_rpm = input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM
+
+            def energy_kwh(angles):
+                return simulator.calculate_energy_by_angle(
+                    speeds, directions, hours, angles, efficiency, voltage, cut_in_rpm) / 1000.0
+
+            result = find_optimal_angle(
+                energy_kwh, coarse_step_deg=input_dto.coarse_step_deg, tolerance_deg=input_dto.tolerance_deg)
+        except Exception as e:
+            return OptimizeAngleOutputDTO(error_message=str(e))
+        return OptimizeAngleOutputDTO(
+            optimal_angle=result.angle,
+            annual_power_kwh=result.energy,
+            coarse_curve=[
+                ScenarioResult(angle=float(a), annual_power_kwh=float(e))
+                for a, e in zip(result.coarse_angles, result.coarse_energies)
+            ],
+            evaluations=result.evaluations,
+        )
@@ -0,0 +1,170 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import numpy
+from wind_compass.domain.constants import (
+    DEFAULT_INTEGRATION_RULE, DEFAULT_MAX_BLOCK_ELEMENTS, DEFAULT_PARALLEL_MIN_ELEMENTS,
+    PARALLEL_ANGLES_PER_TASK, PARALLEL_ROWS_PER_TASK, DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM)
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.models import PowerPlantModel
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, ScenarioResult
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+# 共有メモリに置く列（風速・風向・時間重み、いずれも float64）
+_COLUMNS = 3
+
+# ワーカプロセスごとの状態（initializer で共有メモリに接続して設定する）
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_columns: Optional[numpy.ndarray] = None
+_worker_simulator: Optional[PowerGenerationSimulator] = None
+
+
+class SharedWindColumns:
+    """
+    風速・風向・時間重みを1つの共有メモリ（3 × データ点数 の float64 配列）に書き込み、
+    ワーカがデータをピクルせずに名前で接続できるようにする。with を抜けると共有メモリを解放する。
+    """
+
+    def __init__(self, speeds, directions, hours):
+        rows = len(speeds)
+        self.rows = rows
+        self._shm = shared_memory.SharedMemory(create=True, size=max(_COLUMNS * rows * 8, 1))
+        self.name = self._shm.name
+        try:
+            columns = numpy.ndarray((_COLUMNS, rows), dtype=numpy.float64, buffer=self._shm.buf)
+            columns[0] = speeds
+            columns[1] = directions
+            columns[2] = hours
+            del columns
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'SharedWindColumns':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _init_worker(shm_name: str, rows: int, model: PowerPlantModel) -> None:
+    global _worker_shm, _worker_columns, _worker_simulator
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    columns = numpy.ndarray((_COLUMNS, rows), dtype=numpy.float64, buffer=_worker_shm.buf)
+    columns.flags.writeable = False
+    _worker_columns = columns
+    _worker_simulator = PowerGenerationSimulator(model)
+
+
+def _energy_task(rows: Tuple[int, int], angles: List[float], efficiency, voltage, cut_in_rpm,
+                 max_block_elements: int) -> List[Tuple[float, Optional[str]]]:
+    """
+    ワーカで (データ点の範囲, 角度のグループ) の発電量(Wh)を計算する。
+    グループでの一括計算に失敗した場合は角度ごとに計算し直し、失敗した角度のみエラーとする。
+    """
+    block = slice(*rows)
+    args = (_worker_columns[0, block], _worker_columns[1, block], _worker_columns[2, block])
+    try:
+        energy = _worker_simulator.calculate_energy_by_angle(
+            *args, angles, efficiency, voltage, cut_in_rpm, max_block_elements=max_block_elements)
+        return [(float(e), None) for e in energy]
+    except Exception:
+        pass
+    results = []
+    for angle in angles:
+        try:
+            energy = _worker_simulator.calculate_energy_by_angle(
+                *args, [angle], efficiency, voltage, cut_in_rpm, max_block_elements=max_block_elements)
+            results.append((float(energy[0]), None))
+        except Exception as e:
+            results.append((0.0, str(e) or type(e).__name__))
+    return results
+
+
+def _mp_context():
+    # スレッドを使う呼び出し元（バッチ実行など）から fork しないよう、forkserver（無ければ spawn）で起動する
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class RunParallelScenariosUseCase:
+    """
+    複数の風車角度を ProcessPoolExecutor のワーカで分担して計算するユースケース（exact エンジン）。
+
+    風速・風向・時間重みは親プロセスで1度だけ共有メモリに書き込み、ワーカは名前で接続する
+    （データセットをピクルしない）。計算は (角度のグループ, データ点の範囲) の固定サイズのタスクに分け、
+    範囲ごとの結果を親で決まった順に足し合わせるため、結果はワーカ数や完了順に依らず同じになり、入力の角度順で返す。
+    角度ごとに失敗を切り分け、失敗した角度のみ error_message を設定する。
+    ワーカ数が1以下、または (角度数 × データ点数) が min_elements 未満の場合は serial_use_case で直列に計算する。
+    積分方式の既定は fixed（RunAngleSweepUseCase と同じ）。入力の読み込みに失敗した場合は例外を送出する。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 serial_use_case,
+                 min_elements: int = DEFAULT_PARALLEL_MIN_ELEMENTS,
+                 max_block_elements: int = DEFAULT_MAX_BLOCK_ELEMENTS):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._serial_use_case = serial_use_case
+        self._min_elements = min_elements
+        self._max_block_elements = max_block_elements
+
+    def execute(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        workers = input_dto.workers or 1
+        if workers <= 1 or input_dto.chunk_size is not None:
+            return self._serial_use_case.execute(input_dto)
+        dataset = WindDataset.as_dataset(self._wind_data_reader.read(input_dto.wind_data_path))
+        if not len(dataset):
+            raise ValueError("No wind data found or file is empty.")
+        if len(dataset) * len(input_dto.angles) < self._min_elements:
+            logging.info(
+                f"{len(dataset)} rows x {len(input_dto.angles)} angles is below the parallel threshold; running serially")
+            return self._serial_use_case.execute(input_dto)
+        model = self._power_plant_model_reader.read(input_dto.config_file_path)
+        integrator = EnergyIntegrator(
+            input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours)
+        hours = integrator.weights(dataset.observed_at)
+        efficiency = input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY
+        voltage = input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE
+        cut_in_rpm = input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM
+        angles = list(input_dto.angles)
+        # タスクは角度の位置（重複した角度も別々に扱う）のグループとデータ点の範囲の組
+        angle_groups = [list(range(i, min(i + PARALLEL_ANGLES_PER_TASK, len(angles))))
+                        for i in range(0, len(angles), PARALLEL_ANGLES_PER_TASK)]
+        row_ranges = [(start, min(start + PARALLEL_ROWS_PER_TASK, len(dataset)))
+                      for start in range(0, len(dataset), PARALLEL_ROWS_PER_TASK)]
+        tasks = [(rows, group) for group in angle_groups for rows in row_ranges]
+        with SharedWindColumns(dataset.wind_speeds, dataset.wind_directions, hours) as shared:
+            with ProcessPoolExecutor(
+                    max_workers=min(workers, len(tasks)), mp_context=_mp_context(),
+                    initializer=_init_worker, initargs=(shared.name, shared.rows, model)) as executor:
+                futures = [
+                    executor.submit(_energy_task, rows, [angles[i] for i in group], efficiency,
+                                    voltage, cut_in_rpm, self._max_block_elements)
+                    for rows, group in tasks
+                ]
+                partials = [future.result() for future in futures]
+        energy_wh = [0.0] * len(angles)
+        errors: List[Optional[str]] = [None] * len(angles)
+        for (rows, group), partial in zip(tasks, partials):
+            for i, (energy, error) in zip(group, partial):
+                energy_wh[i] += energy
+                if error is not None and errors[i] is None:
+                    errors[i] = error
+        return [
+            ScenarioResult(angle=angle, error_message=error) if error is not None
+            else ScenarioResult(angle=angle, annual_power_kwh=energy / 1000.0)
+            for angle, energy, error in zip(angles, energy_wh, errors)
+        ]
@@ -0,0 +1,50 @@
+import itertools
+from typing import Callable, List
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM, DEFAULT_INTEGRATION_RULE
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import ParameterSweepInputDTO, ParameterSweepResult
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+
+class RunParameterSweepUseCase:
+    """
+    (角度, 伝達効率, 出力電圧, カットイン回転数) の全組み合わせの年間発電量を求めるユースケース。
+
+    組み合わせごとにシナリオを実行し直さず、PowerGenerationSimulator.calculate_energy_grid で
+    回転数の解を (角度, 効率) ごとに1度だけ求め、電圧・カットイン回転数の軸はその結果から導く。
+    空のリストは既定値（DEFAULT_EFFICIENCY など）の1件として扱う。
+    積分方式の既定は fixed（RunAngleSweepUseCase と同じ）。入力の読み込みに失敗した場合は例外を送出する。
+    """
+
+    def __init__(self,
+                 wind_data_reader: WindDataReader,
+                 power_plant_model_reader: PowerPlantModelReader,
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator]):
+        self._wind_data_reader = wind_data_reader
+        self._power_plant_model_reader = power_plant_model_reader
+        self._power_generation_simulator_factory = power_generation_simulator_factory
+
+    def execute(self, input_dto: ParameterSweepInputDTO) -> List[ParameterSweepResult]:
+        """結果は角度 → 効率 → 電圧 → カットイン回転数の順に並べる。"""
+        dataset = WindDataset.as_dataset(self._wind_data_reader.read(input_dto.wind_data_path))
+        if not len(dataset):
+            raise ValueError("No wind data found or file is empty.")
+        integrator = EnergyIntegrator(
+            input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours)
+        model = self._power_plant_model_reader.read(input_dto.config_file_path)
+        simulator = self._power_generation_simulator_factory(model)
+        efficiencies = list(input_dto.efficiencies) or [DEFAULT_EFFICIENCY]
+        voltages = list(input_dto.voltages) or [DEFAULT_VOLTAGE]
+        cut_in_rpms = list(input_dto.cut_in_rpms) or [DEFAULT_CUT_IN_RPM]
+        energy_wh = simulator.calculate_energy_grid(
+            dataset.wind_speeds, dataset.wind_directions, integrator.weights(dataset.observed_at),
+            input_dto.angles, efficiencies, voltages, cut_in_rpms)
+        return [
+            ParameterSweepResult(
+                angle=angle, efficiency=efficiency, voltage=voltage, cut_in_rpm=cut_in_rpm,
+                annual_power_kwh=float(energy_wh[i, j, k, m]) / 1000.0)
+            for (i, angle), (j, efficiency), (k, voltage), (m, cut_in_rpm) in itertools.product(
+                enumerate(input_dto.angles), enumerate(efficiencies), enumerate(voltages), enumerate(cut_in_rpms))
+        ]
@@ -1,6 +1,9 @@
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Iterator, Optional, Union
 from wind_compass.domain.models import WindReading, PowerPlantModel
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.dtos import ScenarioResult, ScenarioState
 
 
 class WindDataReader(ABC):
@@ -8,18 +11,48 @@ class WindDataReader(ABC):
     風況データを読み込むリポジトリのインターフェース（ポート）
     """
     @abstractmethod
-    def read(self, file_path: str) -> Iterable[WindReading]:
+    def read(self, file_path: str) -> Union[WindDataset, Iterable[WindReading]]:
         """
         指定されたパスから風況データを読み込み、
-        WindReadingオブジェクトのイテレータを返す。
+        列指向の WindDataset（または WindReadingオブジェクトのイテレータ）を返す。
+        利用側は WindDataset.as_dataset で列指向に揃えて扱う。
 
         :param file_path: 風況データファイルのパス
-        :return: WindReadingオブジェクトのイテレータ
+        :return: WindDataset または WindReadingオブジェクトのイテレータ
         :raises FileNotFoundError: ファイルが見つからない場合
         :raises ValueError: ファイル形式が不正な場合
         """
         raise NotImplementedError
 
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        """
+        指定されたパスから風況データを chunk_size 行ずつの WindDataset として順に返す。
+        既定の実装は read の結果を分割するだけなので、メモリ使用量を抑えるには
+        アダプタ側でファイルを分割して読むよう上書きする。
+
+        :param file_path: 風況データファイルのパス
+        :param chunk_size: 1チャンクの最大行数（1以上）
+        :return: WindDataset のイテレータ（時刻順）
+        :raises FileNotFoundError: ファイルが見つからない場合
+        :raises ValueError: ファイル形式が不正な場合、chunk_size が1未満の場合
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        dataset = WindDataset.as_dataset(self.read(file_path))
+        for start in range(0, len(dataset), chunk_size):
+            yield dataset[start:start + chunk_size]
+
+    def parse_options(self, file_path: str) -> dict:
+        """
+        読み込み結果を変えるオプション（時刻の形式・格納型など）を返す。
+        読み込み結果を保存するキャッシュは、ファイルの内容に加えてこの値が一致する場合のみ再利用する。
+        既定の実装はオプション無し（空の dict）。
+
+        :param file_path: 風況データファイルのパス
+        :return: JSON に変換できる値の dict
+        """
+        return {}
+
 
 class PowerPlantModelReader(ABC):
     """
@@ -37,3 +70,73 @@ class PowerPlantModelReader(ABC):
         :raises ValueError: ファイル形式が不正な場合
         """
         raise NotImplementedError
+
+
+class ScenarioStateStore(ABC):
+    """
+    増分実行でシナリオごとの積算状態を保存するリポジトリのインターフェース（ポート）
+    """
+    @abstractmethod
+    def load(self, wind_data_path: str, key: str) -> Optional[ScenarioState]:
+        """
+        保存済みの積算状態を返す。
+
+        :param wind_data_path: 風況データファイルのパス
+        :param key: シナリオ（データ・設備特性・角度・パラメータ）を識別するキー
+        :return: ScenarioState。無い場合・読めない場合は None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, wind_data_path: str, key: str, state: ScenarioState) -> None:
+        """
+        積算状態を保存する（同じキーの状態は置き換える）。
+
+        :param wind_data_path: 風況データファイルのパス
+        :param key: シナリオを識別するキー
+        :param state: 保存する ScenarioState
+        """
+        raise NotImplementedError
+
+
+class ScenarioResultCache(ABC):
+    """
+    シナリオの計算結果を内容から求めたキーで保存するキャッシュのインターフェース（ポート）
+    enabled が False の場合、利用側はキャッシュを参照しない。
+    """
+    enabled: bool = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ScenarioResult]:
+        """
+        キーに対応する結果を返す。
+
+        :param key: 入力ファイルの内容とパラメータから求めたキー
+        :return: ScenarioResult。無い場合・読めない場合は None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, result: ScenarioResult) -> None:
+        """
+        結果を保存する（同じキーの結果は置き換える）。
+
+        :param key: 入力ファイルの内容とパラメータから求めたキー
+        :param result: 保存する ScenarioResult
+        """
+        raise NotImplementedError
+
+    def file_digest(self, file_path: str) -> str:
+        """
+        ファイル内容のハッシュ（SHA-256）を返す。
+        既定の実装は毎回ファイル全体を読むので、アダプタ側で更新時刻などを使って省略できるよう上書きする。
+
+        :param file_path: 入力ファイルのパス
+        :return: 16進のハッシュ文字列
+        :raises FileNotFoundError: ファイルが見つからない場合
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
@@ -0,0 +1,278 @@
+import contextvars
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+import numpy
+from wind_compass.domain.constants import MAX_GENERATOR_RPM
+from wind_compass.domain.models import PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
+
+# 計測する処理段階
+STAGE_READ_WIND = "read wind"
+STAGE_READ_CONFIG = "read config"
+STAGE_PRESENT = "present"
+
+# ホットパスのカウンタ
+COUNTER_ROWS_READ = "rows read"
+COUNTER_ROWS_SIMULATED = "rows simulated"
+COUNTER_TAILWIND_ZEROED = "tailwind zeroed"
+COUNTER_CUT_IN_REJECTED = "cut-in rejected"
+COUNTER_RPM_CUTOFF = "rpm > max cutoff"
+COUNTER_NO_ROOT = "no root in range"
+COUNTER_SOLVER_FAILURES = "solver failures"
+COUNTER_SWALLOWED_EXCEPTIONS = "swallowed exceptions"
+COUNTERS = (COUNTER_ROWS_READ, COUNTER_ROWS_SIMULATED, COUNTER_TAILWIND_ZEROED, COUNTER_CUT_IN_REJECTED,
+            COUNTER_RPM_CUTOFF, COUNTER_NO_ROOT, COUNTER_SOLVER_FAILURES, COUNTER_SWALLOWED_EXCEPTIONS)
+
+# ProfilingPowerGenerationSimulator のカウンタに掛ける重み。(風速, 風向) の組ごとに計算する間は組のデータ点数にする
+_count_weight: contextvars.ContextVar[int] = contextvars.ContextVar("wind_compass_count_weight", default=1)
+
+# 実行中の RunProfile（activate した範囲のみ）。ユースケース内で握りつぶした例外の計数に使う
+_active_profile: contextvars.ContextVar[Optional['RunProfile']] = contextvars.ContextVar(
+    "wind_compass_active_profile", default=None)
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """
+    処理段階ごとの所要時間。
+
+    Args:
+        name: 段階名（シミュレーションは角度ごと）
+        seconds: 壁時計時間(秒)。内側で計測した段階の時間は含まない
+        calls: 段階に入った回数
+    """
+    name: str
+    seconds: float
+    calls: int
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """
+    1回の実行の段階別時間とカウンタ。
+
+    Args:
+        stages: 段階別の時間（初めて計測した順）
+        counters: カウンタ名 -> 件数（COUNTERS の全項目を含む）
+    """
+    stages: List[StageTiming] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(s.seconds for s in self.stages)
+
+
+class RunProfile:
+    """
+    段階別の壁時計時間とカウンタを集計する。段階は入れ子にでき、
+    各段階の時間からは内側の段階の時間を除く（段階の時間の合計が実行時間になる）。
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._seconds: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        # 計測中の段階ごとの、内側の段階に費やした時間
+        self._nested: List[float] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        self._seconds.setdefault(name, 0.0)
+        self._calls[name] = self._calls.get(name, 0) + 1
+        started = self._clock()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - started
+            nested = self._nested.pop()
+            self._seconds[name] += elapsed - nested
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def count(self, name: str, n: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + int(n)
+
+    @contextmanager
+    def activate(self):
+        """この範囲で握りつぶされた例外を count_swallowed_exception で計数する。"""
+        token = _active_profile.set(self)
+        try:
+            yield self
+        finally:
+            _active_profile.reset(token)
+
+    def report(self) -> ProfileReport:
+        return ProfileReport(
+            stages=[StageTiming(name, seconds, self._calls[name]) for name, seconds in self._seconds.items()],
+            counters=dict(self._counters))
+
+
+def profile_stage(profile: Optional[RunProfile], name: str):
+    """profile が None の場合は何もしないコンテキストを返す。"""
+    return profile.stage(name) if profile is not None else nullcontext()
+
+
+def count_swallowed_exception() -> None:
+    """ユースケースが例外を握りつぶして処理を続ける箇所で呼ぶ。計測中でなければ何もしない。"""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.count(COUNTER_SWALLOWED_EXCEPTIONS)
+
+
+class ProfilingWindDataReader(WindDataReader):
+    """読み込みを STAGE_READ_WIND として計測し、行数を数えるリーダ。"""
+
+    def __init__(self, reader: WindDataReader, profile: RunProfile):
+        self._reader = reader
+        self._profile = profile
+
+    def read(self, file_path: str) -> WindDataset:
+        with self._profile.stage(STAGE_READ_WIND):
+            dataset = WindDataset.as_dataset(self._reader.read(file_path))
+        self._profile.count(COUNTER_ROWS_READ, len(dataset))
+        return dataset
+
+    def parse_options(self, file_path: str) -> dict:
+        return self._reader.parse_options(file_path)
+
+    def read_chunks(self, file_path: str, chunk_size: int) -> Iterator[WindDataset]:
+        # 各チャンクの読み込み（次のチャンクを取り出すまで）を計測する
+        chunks = iter(self._reader.read_chunks(file_path, chunk_size))
+        while True:
+            with self._profile.stage(STAGE_READ_WIND):
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    chunk = WindDataset.as_dataset(chunk)
+            if chunk is None:
+                return
+            self._profile.count(COUNTER_ROWS_READ, len(chunk))
+            yield chunk
+
+
+class ProfilingPowerPlantModelReader(PowerPlantModelReader):
+    """読み込みを STAGE_READ_CONFIG として計測するリーダ。"""
+
+    def __init__(self, reader: PowerPlantModelReader, profile: RunProfile):
+        self._reader = reader
+        self._profile = profile
+
+    def read(self, file_path: str) -> PowerPlantModel:
+        with self._profile.stage(STAGE_READ_CONFIG):
+            return self._reader.read(file_path)
+
+
+class ProfiledUseCase:
+    """
+    ユースケースの execute を1つの段階として計測するラッパ。
+    段階名は入力DTOから決める（角度ごとのシミュレーションなど）。
+    """
+
+    def __init__(self, use_case, profile: RunProfile, stage_name: Callable[[object], str]):
+        self._use_case = use_case
+        self._profile = profile
+        self._stage_name = stage_name
+
+    @property
+    def input_dto_class(self):
+        return self._use_case.input_dto_class
+
+    def execute(self, input_dto):
+        with self._profile.stage(self._stage_name(input_dto)):
+            return self._use_case.execute(input_dto)
+
+
+class ProfilingPowerGenerationSimulator(PowerGenerationSimulator):
+    """
+    計算結果を変えずに、ホットパスの件数を RunProfile に数える PowerGenerationSimulator。
+    有効風速の計算（スカラー・配列）で評価した行数と追い風で0とした行数を、回転数の計算で
+    上限超えの打ち切り・解なし（NaN入力を含む）を、カットイン判定で回転数はあるがカットイン未満の行を数える。
+    伝達関数表で補間した行は回転数を解かないため、回転数・カットインのカウンタには含まれない。
+    (風速, 風向) の組の重複を除いて計算する場合も、件数は組ではなくデータ点の数で数える。
+    """
+
+    def __init__(self, model: PowerPlantModel, profile: RunProfile, compiled_model=None):
+        super().__init__(model, compiled_model)
+        self._profile = profile
+
+    def _count(self, name: str, n=1) -> None:
+        self._profile.count(name, int(n) * _count_weight.get())
+
+    def _calculate_pair_power(self, pairs, index, turbine_angle_deg, efficiency, voltage, cut_in_rpm, gear_ratio=None):
+        # データ点数が同じ組ごとに計算し、その間はカウンタにデータ点数を掛ける
+        # （計算は要素ごとのため、結果は組全体をまとめて計算した場合と同じ）
+        positions = numpy.arange(pairs.pair_count)[index]
+        counts = pairs.row_counts[positions]
+        power = None
+        for n in numpy.unique(counts):
+            selected = numpy.flatnonzero(counts == n)
+            token = _count_weight.set(int(n))
+            try:
+                part = super()._calculate_pair_power(
+                    pairs, positions[selected], turbine_angle_deg, efficiency, voltage, cut_in_rpm, gear_ratio)
+            finally:
+                _count_weight.reset(token)
+            if power is None:
+                power = numpy.empty(part.shape[:-1] + counts.shape)
+            power[..., selected] = part
+        return power if power is not None else super()._calculate_pair_power(
+            pairs, positions, turbine_angle_deg, efficiency, voltage, cut_in_rpm, gear_ratio)
+
+    def _calculate_effective_wind_speed(self, wind_speed, wind_direction_deg, turbine_angle_deg):
+        self._count(COUNTER_ROWS_SIMULATED)
+        if math.cos(math.radians(wind_direction_deg - turbine_angle_deg)) < 0:
+            self._count(COUNTER_TAILWIND_ZEROED)
+        return super()._calculate_effective_wind_speed(wind_speed, wind_direction_deg, turbine_angle_deg)
+
+    def _calculate_effective_wind_speed_series(self, speeds, directions, turbine_angle_deg):
+        eff_ws = super()._calculate_effective_wind_speed_series(
+            speeds, directions, turbine_angle_deg)
+        self._count(COUNTER_ROWS_SIMULATED, eff_ws.size)
+        self._count(COUNTER_TAILWIND_ZEROED, numpy.count_nonzero(
+            numpy.cos(numpy.radians(directions - turbine_angle_deg)) < 0))
+        return eff_ws
+
+    def _solve_for_rpm(self, shaft_power, torque_curve: PolynomialCurve):
+        try:
+            rpm = super()._solve_for_rpm(shaft_power, torque_curve)
+        except Exception:
+            self._count(COUNTER_SOLVER_FAILURES)
+            raise
+        if rpm == 0.0 and shaft_power != 0.0:
+            self._count_zero_rpm(
+                numpy.array([shaft_power]), self._shaft_power_coeffs(torque_curve))
+        return rpm
+
+    def _solve_for_rpm_series(self, shaft_powers):
+        rpm = super()._solve_for_rpm_series(shaft_powers)
+        shaft_powers = numpy.asarray(shaft_powers, dtype=float)
+        self._count(COUNTER_SOLVER_FAILURES, numpy.count_nonzero(numpy.isnan(rpm)))
+        zero = (rpm == 0.0) & (shaft_powers != 0.0)
+        if numpy.any(zero):
+            self._count_zero_rpm(shaft_powers[zero], self.compiled_model.shaft_power_coeffs)
+        return rpm
+
+    def _is_cut_in(self, rpm, cut_in_rpm):
+        cut_in = super()._is_cut_in(rpm, cut_in_rpm)
+        self._count(COUNTER_CUT_IN_REJECTED, numpy.count_nonzero(
+            ~numpy.asarray(cut_in) & (numpy.asarray(rpm) > 0)))
+        return cut_in
+
+    def _count_zero_rpm(self, shaft_powers, power_coeffs):
+        # 回転数0の行を、上限より先に解がある（打ち切り）か、(0, 上限] に解が無い（低風速など）かに分ける。
+        # 行ごとに numpy.roots を解かず、上限での残差と rpm→∞ での多項式の符号（最高次の係数の符号）が
+        # 異なる行を、上限を超える解がある行とする
+        power_coeffs = numpy.asarray(power_coeffs, dtype=float)
+        leading = power_coeffs[power_coeffs != 0.0]
+        sign_at_infinity = numpy.sign(leading[0]) if leading.size else 0.0
+        residuals = numpy.polyval(power_coeffs, MAX_GENERATOR_RPM) - shaft_powers
+        cutoff = numpy.count_nonzero(residuals * sign_at_infinity < 0)
+        self._count(COUNTER_RPM_CUTOFF, cutoff)
+        self._count(COUNTER_NO_ROOT, shaft_powers.size - cutoff)
@@ -0,0 +1,36 @@
+import dataclasses
+import hashlib
+import json
+from typing import Optional
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
+
+# シミュレーションの計算結果が変わる変更（シミュレータ・積分方式・ユースケースの既定値など）をした場合は上げる
+# （古い結果はキーが一致しなくなり、LRU で追い出される）
+RESULT_CACHE_VERSION = 5
+# 結果に影響しない入力（キーに含めない）。ファイルはパスではなく内容のハッシュをキーに含める
+_NON_KEY_FIELDS = ("wind_data_path", "config_file_path", "angles", "incremental", "workers", "threads")
+
+
+def scenario_result_key(input_dto: MultipleScenariosInputDTO, angle: float,
+                        wind_data_digest: str, config_digest: str,
+                        wind_parse_options: Optional[dict] = None) -> str:
+    """
+    1角度のシナリオ結果のキャッシュキーを返す。
+    風況データ・設備特性コンフィグの内容のハッシュ、角度、その他のパラメータ（エンジン・積分方式など）と
+    RESULT_CACHE_VERSION から求めるため、ファイルの場所や更新時刻が変わっても内容が同じなら一致する。
+    同じファイルでも解釈が変わると結果が変わるため、風況データリーダーの読み込みオプション
+    （タイムスタンプ形式・dtype など）もキーに含める。
+    """
+    parameters = {
+        name: value for name, value in dataclasses.asdict(input_dto).items()
+        if name not in _NON_KEY_FIELDS
+    }
+    scenario = {
+        "version": RESULT_CACHE_VERSION,
+        "wind_data": wind_data_digest,
+        "config": config_digest,
+        "wind_parse_options": wind_parse_options or {},
+        "angle": float(angle),
+        "parameters": parameters,
+    }
+    return hashlib.sha256(json.dumps(scenario, sort_keys=True).encode("utf-8")).hexdigest()
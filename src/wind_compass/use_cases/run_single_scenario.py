@@ -1,8 +1,15 @@
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, Optional, Tuple
+import numpy
+from wind_compass.domain.wind_dataset import WindDataset
 from wind_compass.use_cases.ports import WindDataReader, PowerPlantModelReader
 from wind_compass.domain.services import PowerGenerationSimulator
-from wind_compass.use_cases.dtos import SingleScenarioInputDTO, SingleScenarioOutputDTO
-from wind_compass.domain.constants import DEFAULT_TIME_INTERVAL_HOURS
+from wind_compass.use_cases.dtos import SingleScenarioInputDTO, SingleScenarioOutputDTO, ENGINE_TABLE
+from wind_compass.domain.constants import (
+    DEFAULT_INTEGRATION_RULE, THREADED_ROWS_PER_TASK, DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM)
+from wind_compass.domain.energy_integration import EnergyIntegrator, pairwise_sum
+from wind_compass.use_cases.profiling import count_swallowed_exception
 
 
 class ApplicationError(Exception):
@@ -10,39 +17,178 @@ class ApplicationError(Exception):
     pass
 
 
+def _to_application_error(e: Exception) -> ApplicationError:
+    # 入力読み込み時の例外をアプリケーション層の例外に変換する
+    if isinstance(e, FileNotFoundError):
+        return ApplicationError(
+            f"Input file not found: {e.filename if hasattr(e, 'filename') else str(e)}")
+    if isinstance(e, ValueError):
+        return ApplicationError(f"Invalid data format: {e}")
+    return ApplicationError(f"Unexpected error: {e}")
+
+
 class RunSingleSimulationScenarioUseCase:
     """
     単一のシミュレーションシナリオを実行し、年間発電量を計算するユースケース。
     依存性注入によりリーダ・ファクトリを受け取る。
+    threads が2以上でデータ点数が rows_per_task を超える場合は、rows_per_task 行ずつのタスクをスレッドプールで積算する。
     """
+    input_dto_class = SingleScenarioInputDTO
+    output_dto_class = SingleScenarioOutputDTO
 
     def __init__(self,
                  wind_data_reader: WindDataReader,
                  power_plant_model_reader: PowerPlantModelReader,
-                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator]):
+                 power_generation_simulator_factory: Callable[[object], PowerGenerationSimulator],
+                 rows_per_task: int = THREADED_ROWS_PER_TASK):
         self._wind_data_reader = wind_data_reader
         self._power_plant_model_reader = power_plant_model_reader
         self._power_generation_simulator_factory = power_generation_simulator_factory
+        self._rows_per_task = rows_per_task
 
     def execute(self, input_dto: SingleScenarioInputDTO) -> SingleScenarioOutputDTO:
+        """
+        各データ点の瞬時電力に積分方式の時間重みを掛けて年間発電量を求める。
+        積分方式の既定は fixed（プロジェクト定義の固定Δt=10分=1/6h）。
+        効率・電圧・カットイン回転数を省略した場合は既定値（DEFAULT_EFFICIENCY など）を使う。
+        """
+        input_dto = self._with_defaults(input_dto)
+        if input_dto.chunk_size is not None:
+            return self._execute_streaming(input_dto)
         try:
-            wind_readings = list(
+            integrator = self._integrator(input_dto)
+            wind_readings = WindDataset.as_dataset(
                 self._wind_data_reader.read(input_dto.wind_data_path))
-            if not wind_readings:
+            if not len(wind_readings):
                 raise ValueError("No wind data found or file is empty.")
             power_plant_model = self._power_plant_model_reader.read(
                 input_dto.config_file_path)
-        except FileNotFoundError as e:
-            raise ApplicationError(
-                f"Input file not found: {e.filename if hasattr(e, 'filename') else str(e)}") from e
-        except ValueError as e:
-            raise ApplicationError(f"Invalid data format: {e}") from e
         except Exception as e:
-            raise ApplicationError(f"Unexpected error: {e}") from e
+            raise _to_application_error(e) from e
 
         simulator = self._power_generation_simulator_factory(power_plant_model)
-        total_power = 0.0
-        for reading in wind_readings:
+        if (input_dto.threads or 1) > 1 and len(wind_readings) > self._rows_per_task:
+            energy_wh, max_interpolation_error_w = self._integrate_threaded(
+                simulator, wind_readings, integrator, input_dto)
+        else:
+            energy_wh, max_interpolation_error_w = self._integrate_power(
+                simulator, wind_readings, integrator.weights(wind_readings.observed_at), input_dto)
+        annual_power_kwh = energy_wh / 1000.0
+        return SingleScenarioOutputDTO(
+            annual_power_kwh=annual_power_kwh,
+            max_interpolation_error_w=max_interpolation_error_w)
+
+    def _execute_streaming(self, input_dto: SingleScenarioInputDTO) -> SingleScenarioOutputDTO:
+        """
+        風況データを chunk_size 行ずつ読み込み、チャンクごとの発電量を積算する。
+        保持するのは最大2チャンク分のデータのみのため、メモリ使用量はデータ期間によらない。
+        """
+        try:
+            integrator = self._integrator(input_dto)
+            power_plant_model = self._power_plant_model_reader.read(
+                input_dto.config_file_path)
+            simulator = self._power_generation_simulator_factory(
+                power_plant_model)
+            energy_wh = 0.0
+            row_count = 0
+            max_interpolation_error_w = None
+            chunks = self._wind_data_reader.read_chunks(input_dto.wind_data_path, input_dto.chunk_size)
+            for chunk, weights in integrator.weighted_chunks(chunks):
+                chunk_energy, chunk_error = self._integrate_power(
+                    simulator, chunk, weights, input_dto)
+                energy_wh += chunk_energy
+                row_count += len(chunk)
+                if chunk_error is not None:
+                    max_interpolation_error_w = max(
+                        chunk_error, max_interpolation_error_w or 0.0)
+            if not row_count:
+                raise ValueError("No wind data found or file is empty.")
+        except Exception as e:
+            raise _to_application_error(e) from e
+        return SingleScenarioOutputDTO(
+            annual_power_kwh=energy_wh / 1000.0,
+            max_interpolation_error_w=max_interpolation_error_w)
+
+    @staticmethod
+    def _with_defaults(input_dto: SingleScenarioInputDTO) -> SingleScenarioInputDTO:
+        return replace(
+            input_dto,
+            efficiency=input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY,
+            voltage=input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE,
+            cut_in_rpm=input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM)
+
+    def _integrator(self, input_dto: SingleScenarioInputDTO) -> EnergyIntegrator:
+        return EnergyIntegrator(input_dto.integration_rule or DEFAULT_INTEGRATION_RULE, input_dto.max_gap_hours)
+
+    def _integrate_threaded(self, simulator: PowerGenerationSimulator, wind_readings: WindDataset, integrator: EnergyIntegrator, input_dto: SingleScenarioInputDTO) -> Tuple[float, Optional[float]]:
+        """
+        データ点を rows_per_task 行ずつのタスクに分け、スレッドプールで並行に積算する（numpy の配列演算は GIL を解放する）。
+        各タスクは前後のタスクとの境界のデータ点の時刻から自身の時間重みを求めるため、継ぎ目の区間も一括計算と同じ重みになる。
+        タスクごとの部分和はタスクの順にペアワイズ総和で足し合わせるため、結果はスレッド数や完了順によらない。
+        伝達関数表は全データの最大風速から1度だけ作り、全タスクで共有する。
+        """
+        try:
+            options = self._power_options(simulator, wind_readings.wind_speeds, input_dto)
+        except Exception:
+            count_swallowed_exception()
+            return self._integrate_power(
+                simulator, wind_readings, integrator.weights(wind_readings.observed_at), input_dto)
+        observed_at = wind_readings.observed_at
+        rows = len(wind_readings)
+
+        def integrate_task(start: int) -> Tuple[float, Optional[float]]:
+            end = min(start + self._rows_per_task, rows)
+            weights = integrator.weights(
+                observed_at[start:end],
+                observed_at[start - 1] if start > 0 else None,
+                observed_at[end] if end < rows else None)
+            return self._integrate_power(simulator, wind_readings[start:end], weights, input_dto, options)
+
+        starts = range(0, rows, self._rows_per_task)
+        with ThreadPoolExecutor(max_workers=min(input_dto.threads, len(starts))) as executor:
+            partials = list(executor.map(integrate_task, starts))
+        errors = [error for _, error in partials if error is not None]
+        return pairwise_sum([energy for energy, _ in partials]), (max(errors) if errors else None)
+
+    def _power_options(self, simulator: PowerGenerationSimulator, speeds: numpy.ndarray, input_dto: SingleScenarioInputDTO) -> dict:
+        # calculate_power_series に渡す追加の引数（table エンジンでは伝達関数表）
+        options = {}
+        if input_dto.engine == ENGINE_TABLE:
+            options["transfer_table"] = simulator.transfer_table(
+                input_dto.efficiency, input_dto.voltage, input_dto.cut_in_rpm,
+                max_wind_speed=float(numpy.max(speeds, initial=0.0, where=numpy.isfinite(speeds))))
+        return options
+
+    def _integrate_power(self, simulator: PowerGenerationSimulator, wind_readings: WindDataset, weights: numpy.ndarray, input_dto: SingleScenarioInputDTO, options: Optional[dict] = None) -> Tuple[float, Optional[float]]:
+        """
+        全データ点の瞬時電力(W)と時間重み(h)の積の合計(Wh)と、伝達関数表を使った場合はその最大補間誤差(W)を返す。
+        配列版APIで一括計算し、失敗した場合は1点ずつの計算に切り替える（失敗した点は0Wとする）。
+        全ての点で失敗した場合は設定の誤りとみなし、0Whを返さずに ApplicationError を送出する。
+        options を省略した場合は wind_readings から求める。
+        """
+        speeds = wind_readings.wind_speeds
+        directions = wind_readings.wind_directions
+        try:
+            if options is None:
+                options = self._power_options(simulator, speeds, input_dto)
+            power = numpy.asarray(simulator.calculate_power_series(
+                speeds,
+                directions,
+                turbine_angle_deg=input_dto.angle,
+                efficiency=input_dto.efficiency,
+                voltage=input_dto.voltage,
+                cut_in_rpm=input_dto.cut_in_rpm,
+                **options
+            ), dtype=float)
+            if power.shape == speeds.shape:
+                table = options.get("transfer_table")
+                return float(numpy.dot(power, weights)), (table.max_abs_error if table else None)
+        except Exception:
+            count_swallowed_exception()
+        energy_wh = 0.0
+        last_error = None
+        failures = 0
+        for reading, hours in zip(wind_readings, weights):
             try:
                 p = simulator.calculate_instantaneous_power(
                     wind_reading=reading,
@@ -51,11 +197,12 @@ class RunSingleSimulationScenarioUseCase:
                     voltage=input_dto.voltage,
                     cut_in_rpm=input_dto.cut_in_rpm
                 )
-                total_power += p.value
-            except Exception as ex:
+                energy_wh += p.value * hours
+            except Exception as e:
                 # 1点失敗しても他は継続
-                total_power += 0.0
-        # Δtはプロジェクト定義の固定値（10分=1/6h）
-        delta_t = DEFAULT_TIME_INTERVAL_HOURS
-        annual_power_kwh = (total_power * delta_t) / 1000.0
-        return SingleScenarioOutputDTO(annual_power_kwh=annual_power_kwh)
+                count_swallowed_exception()
+                last_error = e
+                failures += 1
+        if failures and failures == len(wind_readings):
+            raise ApplicationError(f"Power calculation failed for every reading: {last_error}") from last_error
+        return energy_wh, None
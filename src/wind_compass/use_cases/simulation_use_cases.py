@@ -1,8 +1,16 @@
-from typing import List, Optional, Callable
+from dataclasses import replace
+from typing import List, Optional, Callable, Tuple
 import logging
-from .dtos import MultipleScenariosInputDTO, ScenarioResult, SingleScenarioInputDTO, SingleScenarioOutputDTO
+import numpy
+from .dtos import MultipleScenariosInputDTO, ScenarioResult, SingleScenarioInputDTO, SingleScenarioOutputDTO, ENGINE_EXACT, ENGINE_TABLE, ENGINE_HISTOGRAM
 from wind_compass.domain.models import PowerPlantModel, Power, WindReading
-from wind_compass.use_cases.ports import WindDataReader
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM, DEFAULT_TIMESTAMP_INTEGRATION_RULE, INTEGRATION_LEFT
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.use_cases.ports import WindDataReader, ScenarioResultCache
+from wind_compass.use_cases.input_cache import InputCache
+from wind_compass.use_cases.result_cache import scenario_result_key
+from wind_compass.use_cases.profiling import count_swallowed_exception
 # Assuming ApplicationError might be raised by the chosen single_scenario_use_case
 # If the single_scenario_use_case is the one defined in this file, it doesn't raise ApplicationError directly in its execute method's happy path
 # but RunMultipleSimulationScenariosUseCase might be used with other implementations.
@@ -21,51 +29,190 @@ class RunSingleSimulationScenarioUseCase:
 
     def execute(self, input_dto: SingleScenarioInputDTO) -> SingleScenarioOutputDTO:
         """
-        年間発電量計算: 風況データN件→N-1区間のΔtを推定し、各区間の始点の瞬時電力×Δtで積算。
-        データ0件・1件は0kWh。瞬時発電量計算エラー時は0W、Δt<=0も0h扱い。
+        年間発電量計算: 各データ点の瞬時電力に積分方式の時間重み（observed_at の差分から一括計算）を掛けて積算。
+        積分方式の既定は left（風況データN件→N-1区間の始点の瞬時電力×Δt）。
+        データ0件・1件は0kWh（fixed を指定した場合はデータ1件でも積算する）。瞬時発電量計算エラー時は0W、Δt<=0も0h扱い。
+        chunk_size を指定した場合はデータをチャンクごとに読み込んで積算する（結果は一括計算と同じ）。
         """
+        if input_dto.chunk_size is not None:
+            return self._execute_streaming(input_dto)
         try:
+            integrator = self._integrator(input_dto)
             model = self.model_loader(input_dto.config_file_path)
-            wind_data = self.wind_data_reader.read(input_dto.wind_data_path)
-            if not wind_data:
+            wind_data = WindDataset.as_dataset(
+                self.wind_data_reader.read(input_dto.wind_data_path))
+            if not len(wind_data):
                 return SingleScenarioOutputDTO(annual_power_kwh=0.0)
-            if len(wind_data) == 1:
+            if len(wind_data) == 1 and integrator.uses_timestamps:
                 return SingleScenarioOutputDTO(annual_power_kwh=0.0)
             simulator = self.simulator_factory(model)
-            total_energy_wh = 0.0
-            for i in range(len(wind_data) - 1):
-                w = wind_data[i]
-                next_w = wind_data[i + 1]
-                try:
-                    p = simulator.calculate_instantaneous_power(
-                        w,
-                        input_dto.angle,
-                        input_dto.efficiency if input_dto.efficiency is not None else 1.0,
-                        input_dto.voltage if input_dto.voltage is not None else 100.0,
-                        input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else 0.0,
-                    )
-                except Exception as ex:
-                    logging.warning(
-                        f"Instantaneous power calculation failed: {ex}")
-                    p = Power(0.0)
-                interval_seconds = (next_w.observed_at -
-                                    w.observed_at).total_seconds()
-                delta_t_hours = max(interval_seconds / 3600.0, 0.0)
-                total_energy_wh += p.value * delta_t_hours
+            weights = integrator.weights(wind_data.observed_at)
+            if integrator.rule == INTEGRATION_LEFT:
+                # 左矩形では最終点の重みは0hのため、各区間の始点（最終点以外）のみ計算する
+                wind_data, weights = wind_data[:-1], weights[:-1]
+            power, max_interpolation_error_w = self._calculate_interval_power(
+                simulator, wind_data, input_dto)
+            total_energy_wh = float(numpy.dot(power, weights))
             annual_power_kwh = total_energy_wh / 1000.0
-            return SingleScenarioOutputDTO(annual_power_kwh=annual_power_kwh)
+            return SingleScenarioOutputDTO(
+                annual_power_kwh=annual_power_kwh,
+                max_interpolation_error_w=max_interpolation_error_w)
+        except Exception as e:
+            return SingleScenarioOutputDTO(annual_power_kwh=None, error_message=str(e))
+
+    def _execute_streaming(self, input_dto: SingleScenarioInputDTO) -> SingleScenarioOutputDTO:
+        """
+        チャンクの最終点は次のチャンクの先頭時刻が分かるまで区間が確定しないため、
+        積分方式の weighted_chunks で次のチャンクを読んでから時間重みを確定して積算する。
+        """
+        try:
+            integrator = self._integrator(input_dto)
+            model = self.model_loader(input_dto.config_file_path)
+            simulator = self.simulator_factory(model)
+            total_energy_wh = 0.0
+            max_interpolation_error_w = None
+            chunks = self.wind_data_reader.read_chunks(input_dto.wind_data_path, input_dto.chunk_size)
+            for chunk, weights in integrator.weighted_chunks(chunks):
+                power, chunk_error = self._calculate_interval_power(
+                    simulator, chunk, input_dto)
+                if chunk_error is not None:
+                    max_interpolation_error_w = max(
+                        chunk_error, max_interpolation_error_w or 0.0)
+                total_energy_wh += float(numpy.dot(power, weights))
+            return SingleScenarioOutputDTO(
+                annual_power_kwh=total_energy_wh / 1000.0,
+                max_interpolation_error_w=max_interpolation_error_w)
         except Exception as e:
             return SingleScenarioOutputDTO(annual_power_kwh=None, error_message=str(e))
 
+    def _integrator(self, input_dto: SingleScenarioInputDTO) -> EnergyIntegrator:
+        return EnergyIntegrator(input_dto.integration_rule or DEFAULT_TIMESTAMP_INTEGRATION_RULE, input_dto.max_gap_hours)
+
+    def _calculate_interval_power(self, simulator, wind_data: WindDataset, input_dto: SingleScenarioInputDTO) -> Tuple[List[float], Optional[float]]:
+        """
+        各データ点の瞬時電力(W)と、伝達関数表を使った場合はその最大補間誤差(W)を返す。
+        配列版APIで一括計算し、失敗した場合は1点ずつ計算してエラー点を0Wとする。
+        """
+        efficiency = input_dto.efficiency if input_dto.efficiency is not None else DEFAULT_EFFICIENCY
+        voltage = input_dto.voltage if input_dto.voltage is not None else DEFAULT_VOLTAGE
+        cut_in_rpm = input_dto.cut_in_rpm if input_dto.cut_in_rpm is not None else DEFAULT_CUT_IN_RPM
+        speeds = wind_data.wind_speeds
+        directions = wind_data.wind_directions
+        try:
+            options = {}
+            if input_dto.engine == ENGINE_TABLE:
+                options["transfer_table"] = simulator.transfer_table(
+                    efficiency, voltage, cut_in_rpm,
+                    max_wind_speed=float(numpy.max(speeds, initial=0.0, where=numpy.isfinite(speeds))))
+            power = numpy.asarray(simulator.calculate_power_series(
+                speeds, directions, input_dto.angle, efficiency, voltage, cut_in_rpm, **options), dtype=float)
+            if power.shape != speeds.shape:
+                raise ValueError(
+                    f"Expected {speeds.shape[0]} power values, got shape {power.shape}")
+            table = options.get("transfer_table")
+            return power.tolist(), (table.max_abs_error if table else None)
+        except Exception as ex:
+            count_swallowed_exception()
+            logging.warning(
+                f"Batch power calculation failed, falling back to per-reading: {ex}")
+        power = []
+        for w in wind_data:
+            try:
+                p = simulator.calculate_instantaneous_power(
+                    w, input_dto.angle, efficiency, voltage, cut_in_rpm)
+            except Exception as ex:
+                count_swallowed_exception()
+                logging.warning(
+                    f"Instantaneous power calculation failed: {ex}")
+                p = Power(0.0)
+            power.append(p.value)
+        return power, None
+
 
 class RunMultipleSimulationScenariosUseCase:
     # The type hint for single_scenario_use_case should ideally be the specific class
     # or an Abstract Base Class / Protocol if multiple implementations are possible.
     # For now, using the class defined above.
-    def __init__(self, single_scenario_use_case: RunSingleSimulationScenarioUseCase):
+    def __init__(self, single_scenario_use_case: RunSingleSimulationScenarioUseCase, histogram_use_case=None, angle_sweep_use_case=None, input_cache: Optional[InputCache] = None, incremental_use_case=None, result_cache: Optional[ScenarioResultCache] = None, parallel_use_case=None):
         self._single_scenario_use_case = single_scenario_use_case
+        # engine="histogram" の場合に全角度をまとめて評価するユースケース（任意）
+        self._histogram_use_case = histogram_use_case
+        # engine="exact" で複数角度の場合に1回の走査で全角度を計算するユースケース（任意）
+        self._angle_sweep_use_case = angle_sweep_use_case
+        # 各ユースケースのリーダが共有する入力キャッシュ（任意）。実行ごとのヒット/ミス数を結果に載せる
+        self._input_cache = input_cache
+        # incremental=True の場合に前回の積算状態から追記分だけを計算するユースケース（任意）
+        self._incremental_use_case = incremental_use_case
+        # 角度ごとの結果を入力ファイルの内容とパラメータで引くキャッシュ（任意）。ヒットしなかった角度だけを計算する
+        self._result_cache = result_cache
+        # workers > 1 の場合に角度スイープをプロセス並列で計算するユースケース（任意）
+        self._parallel_use_case = parallel_use_case
 
     def execute(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        if self._input_cache is None:
+            return self._execute_cached(input_dto)
+        before = self._input_cache.stats()
+        results = self._execute_cached(input_dto)
+        after = self._input_cache.stats()
+        return [
+            replace(r, input_cache_hits=after.hits - before.hits,
+                    input_cache_misses=after.misses - before.misses)
+            for r in results
+        ]
+
+    def _execute_cached(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        """
+        結果キャッシュを使う場合、ヒットした角度は保存済みの結果を返し、残りの角度だけをまとめて計算する。
+        エラーになった結果は保存しない。増分実行は状態を更新する必要があるため結果キャッシュを使わない。
+        """
+        if self._result_cache is None or not self._result_cache.enabled or input_dto.incremental:
+            return self._execute(input_dto)
+        try:
+            wind_data_digest = self._result_cache.file_digest(input_dto.wind_data_path)
+            config_digest = self._result_cache.file_digest(input_dto.config_file_path)
+            wind_parse_options = (
+                self._input_cache.wind_parse_options(input_dto.wind_data_path)
+                if self._input_cache is not None else {})
+        except Exception as e:
+            # 入力ファイルを読めない場合はキャッシュを使わずに実行し、エラーはシナリオの結果として返す
+            count_swallowed_exception()
+            logging.warning(f"Result cache disabled for this run: {e}")
+            return self._execute(input_dto)
+        keys = {
+            angle: scenario_result_key(input_dto, angle, wind_data_digest, config_digest, wind_parse_options)
+            for angle in input_dto.angles
+        }
+        cached = {angle: self._result_cache.get(key) for angle, key in keys.items()}
+        missing = [angle for angle in input_dto.angles if cached[angle] is None]
+        computed = {}
+        if missing:
+            for result in self._execute(replace(input_dto, angles=missing)):
+                computed[result.angle] = replace(result, result_cache_hit=False)
+                if result.error_message is None and result.angle in keys:
+                    self._result_cache.put(keys[result.angle], result)
+        return [
+            replace(cached[angle], angle=angle, result_cache_hit=True) if cached[angle] is not None
+            else computed.get(angle, ScenarioResult(angle=angle, error_message="No result", result_cache_hit=False))
+            for angle in input_dto.angles
+        ]
+
+    def _execute(self, input_dto: MultipleScenariosInputDTO) -> List[ScenarioResult]:
+        if input_dto.incremental and self._incremental_use_case is not None:
+            return self._incremental_use_case.execute(input_dto)
+        if input_dto.engine == ENGINE_HISTOGRAM and self._histogram_use_case is not None:
+            return self._histogram_use_case.execute(input_dto)
+        angle_sweep_use_case = self._angle_sweep_use_case
+        if (input_dto.workers or 1) > 1 and self._parallel_use_case is not None:
+            angle_sweep_use_case = self._parallel_use_case
+        if (input_dto.engine == ENGINE_EXACT and len(input_dto.angles) > 1
+                and angle_sweep_use_case is not None):
+            try:
+                return angle_sweep_use_case.execute(input_dto)
+            except Exception as e:
+                # 一括計算に失敗した場合は角度ごとに実行し、エラーを角度単位で記録する
+                count_swallowed_exception()
+                logging.warning(
+                    f"Angle sweep failed, falling back to per-angle execution: {e}")
         results = []
         for angle in input_dto.angles:
             # Assuming single_scenario_use_case has input_dto_class attribute
@@ -78,6 +225,11 @@ class RunMultipleSimulationScenariosUseCase:
                 efficiency=input_dto.efficiency,
                 voltage=input_dto.voltage,
                 cut_in_rpm=input_dto.cut_in_rpm,
+                engine=input_dto.engine,
+                chunk_size=input_dto.chunk_size,
+                integration_rule=input_dto.integration_rule,
+                max_gap_hours=input_dto.max_gap_hours,
+                threads=input_dto.threads,
             )
             try:
                 output = self._single_scenario_use_case.execute(single_input)
@@ -86,7 +238,9 @@ class RunMultipleSimulationScenariosUseCase:
                     angle=angle,
                     # Assuming output DTO always has these attributes, might be None
                     annual_power_kwh=output.annual_power_kwh,
-                    error_message=output.error_message
+                    error_message=output.error_message,
+                    max_interpolation_error_w=getattr(
+                        output, 'max_interpolation_error_w', None)
                 ))
             # Catching ApplicationError specifically if single_scenario_use_case can raise it
             # and it needs different handling than a generic Exception.
@@ -0,0 +1,53 @@
+from wind_compass.adapters.batch_manifest import BatchManifestReader
+from wind_compass.use_cases.dtos import BatchParameterSet
+import json
+import os
+import pytest
+
+
+def test_read_yaml_manifest_resolves_paths_relative_to_manifest(tmp_path):
+    path = tmp_path / "jobs" / "manifest.yaml"
+    path.parent.mkdir()
+    path.write_text(
+        "wind_data: [site_a.csv, ../data/site_b.parquet]\n"
+        "config_files: model.json\n"
+        "angles: [90, 0, 90]\n"
+        "parameter_sets:\n"
+        "  - {name: base, efficiency: 0.9, voltage: 100, cut_in_rpm: 10}\n"
+        "  - {name: gap, engine: histogram, integration_rule: trapezoid, max_gap_minutes: 30}\n"
+        "workers: 2\n")
+    dto = BatchManifestReader().read(str(path))
+    assert dto.wind_data_paths == [str(tmp_path / "jobs" / "site_a.csv"), str(tmp_path / "data" / "site_b.parquet")]
+    assert dto.config_file_paths == [str(tmp_path / "jobs" / "model.json")]
+    assert dto.angles == [0.0, 90.0]
+    assert dto.parameter_sets == [
+        BatchParameterSet("base", efficiency=0.9, voltage=100, cut_in_rpm=10),
+        BatchParameterSet("gap", engine="histogram", integration_rule="trapezoid", max_gap_hours=0.5)]
+    assert dto.workers == 2
+
+
+def test_read_json_manifest_with_default_parameter_set(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0]}))
+    dto = BatchManifestReader().read(str(path))
+    assert dto.parameter_sets == [BatchParameterSet("default")]
+    assert dto.workers is None
+
+
+@pytest.mark.parametrize("manifest", [
+    [],
+    {"wind_data": [], "config_files": ["m.json"], "angles": [0]},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": []},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0], "sites": []},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0], "workers": 0},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0], "parameter_sets": [{"engine": "fast"}]},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0], "parameter_sets": [{"voltage": "high"}]},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0], "parameter_sets": [{"max_gap_minutes": 30}]},
+    {"wind_data": ["a.csv"], "config_files": ["m.json"], "angles": [0],
+     "parameter_sets": [{"name": "x"}, {"name": "x"}]},
+])
+def test_invalid_manifest_raises_value_error(tmp_path, manifest):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    with pytest.raises(ValueError):
+        BatchManifestReader().read(str(path))
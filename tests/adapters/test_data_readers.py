@@ -1,11 +1,18 @@
 from wind_compass.adapters.data_readers import CsvWindDataReader, JsonConfigReader
 from wind_compass.domain.models import WindReading, PowerPlantModel
+from wind_compass.domain.wind_dataset import WindDataset
 import os
+import numpy
 import pytest
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '../fixtures')
 
 
+def write_wind_csv(path, lines):
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
 class TestCsvWindDataReader:
     def test_read_valid_csv_returns_wind_readings(self):
         reader = CsvWindDataReader()
@@ -36,6 +43,79 @@ class TestCsvWindDataReader:
         with pytest.raises(ValueError):
             list(reader.read(file_path))
 
+    def test_read_returns_columnar_dataset(self, tmp_path):
+        file_path = tmp_path / "wind.csv"
+        file_path.write_text(
+            "observed_at,max_wind_speed_mps,max_wind_direction_deg\n"
+            "2024-01-01 00:00:00,5.5,246.0\n"
+            "2024-01-01 00:10:00,7.9,299.0\n")
+        dataset = CsvWindDataReader().read(str(file_path))
+        assert isinstance(dataset, WindDataset)
+        assert dataset.wind_speeds.tolist() == [5.5, 7.9]
+        assert list(dataset)[1].wind_direction == 299.0
+        assert CsvWindDataReader(dtype=numpy.float32).read(str(file_path)).dtype == numpy.float32
+
+    def test_read_chunks_streams_fixed_size_chunks(self, tmp_path):
+        file_path = tmp_path / "wind.csv"
+        rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+        rows += [f"2024-01-01 00:{i:02d}:00,{i}.0,0.0" for i in range(7)]
+        file_path.write_text("\n".join(rows) + "\n")
+        chunks = list(CsvWindDataReader().read_chunks(str(file_path), 3))
+        assert [len(c) for c in chunks] == [3, 3, 1]
+        assert chunks[2].wind_speeds.tolist() == [6.0]
+        with pytest.raises(FileNotFoundError):
+            list(CsvWindDataReader().read_chunks(str(tmp_path / "missing.csv"), 3))
+
+    def test_fast_path_ignores_extra_columns_and_reports_stats(self, tmp_path):
+        file_path = write_wind_csv(tmp_path / "wind.csv", [
+            "station,observed_at,max_wind_speed_mps,max_wind_direction_deg,note",
+            "A,2024/01/01 00:00,5,246,x",
+            "A,2024/01/01 00:10,7.9,299,y",
+        ])
+        reader = CsvWindDataReader()
+        dataset = reader.read(file_path)
+        assert dataset.wind_speeds.tolist() == [5.0, 7.9]
+        assert str(dataset.observed_at[1]) == "2024-01-01T00:10:00.000000000"
+        assert reader.last_parse_stats.rows == 2
+        assert reader.last_parse_stats.rows_per_second > 0
+
+    @pytest.mark.parametrize("lines, message", [
+        (["observed_at,max_wind_speed_mps", "2024-01-01 00:00:00,5.0"], "CSV missing required columns"),
+        (["observed_at,max_wind_speed_mps,max_wind_direction_deg", "2024-01-01 00:00:00,fast,0.0"],
+         "Invalid data type in CSV columns"),
+        (["observed_at,max_wind_speed_mps,max_wind_direction_deg", "not a date,5.0,0.0"],
+         "Invalid data type in CSV columns"),
+    ])
+    def test_fast_path_keeps_validation_messages(self, tmp_path, lines, message):
+        file_path = write_wind_csv(tmp_path / "wind.csv", lines)
+        with pytest.raises(ValueError, match=message):
+            CsvWindDataReader().read(file_path)
+        with pytest.raises(ValueError, match=message):
+            list(CsvWindDataReader().read_chunks(file_path, 1))
+
+    def test_explicit_timestamp_format_and_fallback(self, tmp_path):
+        file_path = write_wind_csv(tmp_path / "wind.csv", [
+            "observed_at,max_wind_speed_mps,max_wind_direction_deg",
+            "01.02.2024 00:00,5.0,0.0",
+            "01.02.2024 00:10,6.0,0.0",
+        ])
+        dataset = CsvWindDataReader(timestamp_format="%d.%m.%Y %H:%M").read(file_path)
+        assert str(dataset.observed_at[0]) == "2024-02-01T00:00:00.000000000"
+        with pytest.raises(ValueError, match="Invalid data type in CSV columns"):
+            CsvWindDataReader(timestamp_format="%Y-%m-%d").read(file_path)
+
+    def test_pyarrow_engine_matches_c_engine(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        file_path = write_wind_csv(tmp_path / "wind.csv", [
+            "observed_at,max_wind_speed_mps,max_wind_direction_deg",
+            "2024-01-01 00:00:00,5.5,246",
+            "2024-01-01 00:10:00,7.9,299",
+        ])
+        fast = CsvWindDataReader(engine="pyarrow").read(file_path)
+        default = CsvWindDataReader().read(file_path)
+        assert fast.wind_speeds.tolist() == default.wind_speeds.tolist()
+        assert (fast.observed_at == default.observed_at).all()
+
 
 class TestJsonConfigReader:
     def test_read_valid_json_returns_power_plant_model(self):
@@ -47,6 +127,20 @@ class TestJsonConfigReader:
         assert model.torque_curve.coeffs == [0.1, 1.1, 2.1, 3.1]
         assert model.current_curve.coeffs == [0.2, 1.2, 2.2, 3.2]
 
+    def test_read_rotor_speed_curve_is_optional(self, tmp_path):
+        import json
+        reader = JsonConfigReader()
+        model = reader.read(os.path.join(FIXTURES_DIR, 'valid_config_gear.json'))
+        assert model.rotor_speed_curve.coeffs == [0.0, 0.0, 30.0, 0.0]
+        assert reader.read(os.path.join(FIXTURES_DIR, 'valid_config_B.json')).rotor_speed_curve is None
+        with open(os.path.join(FIXTURES_DIR, 'valid_config_gear.json')) as f:
+            data = json.load(f)
+        data["rotor_speed_curve"]["coeffs"] = [1.0, 2.0]
+        bad_path = tmp_path / "bad_rotor.json"
+        bad_path.write_text(json.dumps(data))
+        with pytest.raises(ValueError):
+            reader.read(str(bad_path))
+
     def test_read_non_existent_json_raises_file_not_found_error(self):
         reader = JsonConfigReader()
         file_path = os.path.join(FIXTURES_DIR, 'not_exist.json')
@@ -72,4 +166,4 @@ class TestJsonConfigReader:
         reader = JsonConfigReader()
         file_path = os.path.join(FIXTURES_DIR, 'invalid_config_bad_json.json')
         with pytest.raises(json.JSONDecodeError):
-            reader.read(file_path)
\ No newline at end of file
+            reader.read(file_path)
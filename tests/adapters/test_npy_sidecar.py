@@ -0,0 +1,99 @@
+from wind_compass.adapters.npy_sidecar import NpySidecarWindDataReader, sidecar_dir
+from wind_compass.adapters.data_readers import CsvWindDataReader
+from unittest.mock import MagicMock
+import mmap
+import os
+import pathlib
+import numpy
+import pytest
+
+
+def write_csv(path, rows):
+    lines = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    lines += [f"2024-01-01 00:{i * 10:02d}:00,{speed},{direction}" for i, (speed, direction) in enumerate(rows)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "wind.csv"
+    write_csv(path, [(5.5, 246.0), (7.9, 299.0), (3.0, 10.0)])
+    return str(path)
+
+
+def is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, (numpy.memmap, mmap.mmap)):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+
+def spy_reader():
+    reader = MagicMock(wraps=CsvWindDataReader())
+    return reader
+
+
+def test_sidecar_written_on_first_read_and_memory_mapped_afterwards(csv_path):
+    inner = spy_reader()
+    reader = NpySidecarWindDataReader(inner)
+    first = reader.read(csv_path)
+    assert os.path.isfile(os.path.join(sidecar_dir(csv_path), "meta.json"))
+    second = NpySidecarWindDataReader(inner).read(csv_path)
+    assert inner.read.call_count == 1
+    assert is_memory_mapped(second.wind_speeds)
+    assert second.wind_speeds.tolist() == first.wind_speeds.tolist()
+    assert (second.observed_at == first.observed_at).all()
+    assert list(second)[1] == list(first)[1]
+
+
+def test_sidecar_rebuilt_when_source_changes(csv_path):
+    inner = spy_reader()
+    NpySidecarWindDataReader(inner).read(csv_path)
+    write_csv(pathlib.Path(csv_path), [(1.0, 0.0), (2.0, 0.0), (3.0, 0.0), (4.0, 0.0)])
+    dataset = NpySidecarWindDataReader(inner).read(csv_path)
+    assert inner.read.call_count == 2
+    assert dataset.wind_speeds.tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_sidecar_rebuilt_when_parse_options_change(tmp_path):
+    path = tmp_path / "wind.csv"
+    path.write_text("observed_at,max_wind_speed_mps,max_wind_direction_deg\n01/02/2023,5.0,10.0\n")
+    csv_reader = CsvWindDataReader(timestamp_format="%m/%d/%Y")
+    reader = NpySidecarWindDataReader(csv_reader)
+    assert reader.read(str(path)).observed_at[0] == numpy.datetime64("2023-01-02")
+    csv_reader.timestamp_format = "%d/%m/%Y"
+    assert reader.read(str(path)).observed_at[0] == numpy.datetime64("2023-02-01")
+    float32 = NpySidecarWindDataReader(CsvWindDataReader(dtype=numpy.float32, timestamp_format="%d/%m/%Y"))
+    assert float32.read(str(path)).wind_speeds.dtype == numpy.float32
+
+
+def test_sidecar_disabled_and_refresh(csv_path):
+    inner = spy_reader()
+    NpySidecarWindDataReader(inner, enabled=False).read(csv_path)
+    assert not os.path.exists(sidecar_dir(csv_path))
+    NpySidecarWindDataReader(inner).read(csv_path)
+    refreshing = NpySidecarWindDataReader(inner, refresh=True)
+    refreshing.read(csv_path)
+    refreshing.read(csv_path)
+    # refresh は1プロセス内で1回だけ作り直す
+    assert inner.read.call_count == 3
+
+
+def test_sidecar_read_chunks_uses_memory_map_when_valid(csv_path):
+    inner = spy_reader()
+    reader = NpySidecarWindDataReader(inner)
+    assert [len(c) for c in reader.read_chunks(csv_path, 2)] == [2, 1]
+    assert inner.read_chunks.call_count == 1
+    reader.read(csv_path)
+    assert [len(c) for c in reader.read_chunks(csv_path, 2)] == [2, 1]
+    assert inner.read_chunks.call_count == 1
+
+
+def test_unwritable_sidecar_falls_back_to_parsed_data(csv_path, monkeypatch):
+    reader = NpySidecarWindDataReader(CsvWindDataReader())
+
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only")
+    monkeypatch.setattr(os, "makedirs", fail)
+    assert reader.read(csv_path).wind_speeds.tolist() == [5.5, 7.9, 3.0]
@@ -0,0 +1,81 @@
+from wind_compass.adapters.parquet_reader import ParquetWindDataReader
+from wind_compass.adapters.data_readers import FormatSelectingWindDataReader
+from unittest.mock import MagicMock
+import numpy
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def write_parquet(path, rows=100, row_group_size=25, **overrides):
+    frame = pd.DataFrame({
+        "observed_at": pd.date_range("2024-01-01", periods=rows, freq="10min"),
+        "max_wind_speed_mps": numpy.arange(rows, dtype=float) / 10.0,
+        "max_wind_direction_deg": numpy.arange(rows, dtype=float) % 360.0,
+        "station": ["A"] * rows,
+    })
+    for name, values in overrides.items():
+        frame[name] = values
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), str(path),
+                   row_group_size=row_group_size)
+    return str(path)
+
+
+def test_parquet_reader_projects_columns(tmp_path):
+    path = write_parquet(tmp_path / "wind.parquet")
+    dataset = ParquetWindDataReader().read(path)
+    assert len(dataset) == 100
+    assert dataset.observed_at.dtype == numpy.dtype("datetime64[ns]")
+    assert dataset.wind_speeds[:3].tolist() == [0.0, 0.1, 0.2]
+    assert list(dataset)[1].wind_direction == 1.0
+
+
+def test_parquet_reader_filters_row_groups_by_time_range(tmp_path, monkeypatch):
+    path = write_parquet(tmp_path / "wind.parquet")
+    reader = ParquetWindDataReader(start="2024-01-01T05:00", end="2024-01-01T06:00")
+    read_groups = []
+    original = pq.ParquetFile.read_row_groups
+
+    def spy(self, row_groups, *args, **kwargs):
+        read_groups.append(list(row_groups))
+        return original(self, row_groups, *args, **kwargs)
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+    dataset = reader.read(path)
+    # 05:00 は30行目（2つ目の行グループ）
+    assert read_groups == [[1]]
+    assert len(dataset) == 6
+    assert str(dataset.observed_at[0]) == "2024-01-01T05:00:00.000000000"
+
+
+def test_parquet_reader_chunks_and_string_timestamps(tmp_path):
+    times = [f"2024-01-01 00:{i % 6 * 10:02d}:00" for i in range(10)]
+    path = write_parquet(tmp_path / "wind.parquet", rows=10, row_group_size=4, observed_at=times)
+    chunks = list(ParquetWindDataReader().read_chunks(path, 3))
+    assert [len(c) for c in chunks] == [3, 3, 3, 1]
+    assert str(chunks[0].observed_at[1]) == "2024-01-01T00:10:00.000000000"
+
+
+def test_parquet_reader_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ParquetWindDataReader().read(str(tmp_path / "missing.parquet"))
+    bad = tmp_path / "bad.parquet"
+    bad.write_text("not parquet")
+    with pytest.raises(ValueError):
+        ParquetWindDataReader().read(str(bad))
+    pq.write_table(pa.table({"observed_at": [1, 2]}), str(tmp_path / "partial.parquet"))
+    with pytest.raises(ValueError, match="missing required columns"):
+        ParquetWindDataReader().read(str(tmp_path / "partial.parquet"))
+
+
+def test_format_selecting_reader_uses_extension_or_explicit_format():
+    csv_reader, parquet_reader = MagicMock(), MagicMock()
+    reader = FormatSelectingWindDataReader({"csv": csv_reader, "parquet": parquet_reader})
+    reader.read("data/wind.PARQUET")
+    reader.read("data/wind.txt")
+    assert parquet_reader.read.call_count == 1
+    assert csv_reader.read.call_count == 1
+    reader.wind_format = "parquet"
+    reader.read("data/wind.csv")
+    assert parquet_reader.read.call_count == 2
@@ -0,0 +1,55 @@
+from wind_compass.adapters.result_cache import SqliteScenarioResultCache, RESULT_CACHE_FILE
+from wind_compass.use_cases.dtos import ScenarioResult
+import itertools
+import os
+
+
+def make_cache(directory, **kwargs):
+    clock = itertools.count()
+    return SqliteScenarioResultCache(str(directory), clock=lambda: next(clock), **kwargs)
+
+
+def test_round_trip(tmp_path):
+    cache = make_cache(tmp_path)
+    result = ScenarioResult(angle=90.0, annual_power_kwh=12.5, max_interpolation_error_w=0.1)
+    assert cache.get("key") is None
+    cache.put("key", result)
+    assert os.path.isfile(tmp_path / RESULT_CACHE_FILE)
+    assert cache.get("key") == result
+    # 別のインスタンス（次の CLI 実行）からも読める
+    assert make_cache(tmp_path).get("key") == result
+
+
+def test_size_based_lru_eviction(tmp_path):
+    entry_size = len('{"angle": 0.0, "annual_power_kwh": 1.0, "error_message": null, '
+                     '"max_interpolation_error_w": null, "exact_energy_difference_kwh": null, '
+                     '"input_cache_hits": null, "input_cache_misses": null, "rows_simulated": null, '
+                     '"result_cache_hit": null}')
+    cache = make_cache(tmp_path, max_bytes=3 * entry_size)
+    for key in ("a", "b", "c"):
+        cache.put(key, ScenarioResult(angle=0.0, annual_power_kwh=1.0))
+    assert cache.total_bytes() == 3 * entry_size
+    # a を使ったので、次に追加したときは最も古い b が消える
+    assert cache.get("a") is not None
+    cache.put("d", ScenarioResult(angle=0.0, annual_power_kwh=1.0))
+    assert [key for key in "abcd" if cache.get(key) is not None] == ["a", "c", "d"]
+    assert cache.total_bytes() <= 3 * entry_size
+
+
+def test_file_digest_depends_on_content_not_path(tmp_path):
+    cache = make_cache(tmp_path / "cache")
+    first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+    first.write_text("a,b\n1,2\n")
+    second.write_text("a,b\n1,2\n")
+    assert cache.file_digest(str(first)) == cache.file_digest(str(second))
+    first.write_text("a,b\n1,3\n")
+    assert cache.file_digest(str(first)) != cache.file_digest(str(second))
+
+
+def test_unusable_directory_behaves_as_empty_cache(tmp_path, caplog):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = SqliteScenarioResultCache(str(blocker))
+    cache.put("key", ScenarioResult(angle=0.0, annual_power_kwh=1.0))
+    assert cache.get("key") is None
+    assert "Could not write result cache" in caplog.text
@@ -0,0 +1,32 @@
+from wind_compass.adapters.scenario_state_store import JsonScenarioStateStore, state_dir
+from wind_compass.use_cases.dtos import ScenarioState
+import os
+
+
+STATE = ScenarioState(rows=3, prefix_hash="abc", energy_wh=12.5,
+                      last_observed_at_ns=1704067200000000000, last_wind_speed=5.5, last_wind_direction=246.0)
+
+
+def test_round_trip_next_to_wind_data(tmp_path):
+    wind_path = str(tmp_path / "wind.csv")
+    store = JsonScenarioStateStore()
+    assert store.load(wind_path, "key") is None
+    store.save(wind_path, "key", STATE)
+    assert os.path.isfile(os.path.join(state_dir(wind_path), "key.json"))
+    assert store.load(wind_path, "key") == STATE
+    assert store.load(wind_path, "other") is None
+
+
+def test_directory_override_and_corrupt_state(tmp_path):
+    store = JsonScenarioStateStore(str(tmp_path / "states"))
+    store.save("wind.csv", "key", STATE)
+    assert store.load("elsewhere/wind.csv", "key") == STATE
+    (tmp_path / "states" / "key.json").write_text("{\"rows\": ")
+    assert store.load("wind.csv", "key") is None
+
+
+def test_unwritable_directory_warns(tmp_path, caplog):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    JsonScenarioStateStore(str(blocker)).save("wind.csv", "key", STATE)
+    assert "Could not write incremental state" in caplog.text
@@ -0,0 +1,34 @@
+from wind_compass.domain.angle_optimizer import find_optimal_angle
+import numpy
+import pytest
+
+
+def test_find_optimal_angle_reaches_tolerance_across_wraparound():
+    # 最大は 359.987 度（0度をまたぐ区間で絞り込む必要がある）
+    def energy(angles):
+        return 10.0 + numpy.cos(numpy.radians(angles - 359.987))
+
+    result = find_optimal_angle(energy, coarse_step_deg=5.0, tolerance_deg=0.01)
+    assert abs((result.angle - 359.987 + 180.0) % 360.0 - 180.0) <= 0.01
+    assert result.energy == pytest.approx(11.0, abs=1e-8)
+    assert result.coarse_angles.size == 72
+    assert result.coarse_energies.size == 72
+    # 粗いスイープ以外の評価は数十回に収まる
+    assert result.evaluations - 72 <= 40
+
+
+def test_find_optimal_angle_prefers_global_of_two_peaks():
+    def energy(angles):
+        return (numpy.exp(-((angles - 40.0) / 15.0) ** 2)
+                + 1.2 * numpy.exp(-((angles - 231.3) / 10.0) ** 2))
+
+    result = find_optimal_angle(energy, coarse_step_deg=10.0)
+    assert result.angle == pytest.approx(231.3, abs=0.01)
+
+
+def test_find_optimal_angle_flat_energy_and_invalid_step():
+    result = find_optimal_angle(lambda angles: numpy.zeros(len(angles)))
+    assert result.energy == 0.0
+    assert 0.0 <= result.angle < 360.0
+    with pytest.raises(ValueError):
+        find_optimal_angle(lambda angles: numpy.zeros(len(angles)), coarse_step_deg=0.0)
@@ -0,0 +1,40 @@
+from wind_compass.domain.compiled_model import CompiledPowerPlantModel
+from wind_compass.domain.models import PowerPlantModel, PolynomialCurve
+from wind_compass.domain.rpm_solver import shaft_power_coeffs
+from wind_compass.domain.constants import MAX_GENERATOR_RPM
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def test_compiled_model_holds_tuple_coeffs():
+    compiled = CompiledPowerPlantModel.from_model(make_model())
+    assert compiled.power_coeffs == (0.5, 2.0, 0.0, 0.0)
+    assert compiled.torque_coeffs == (0.0, 0.5, 1.0, 0.1)
+    assert compiled.current_coeffs == (0.0, 0.0, 2.0, 0.3)
+    assert compiled.shaft_power_coeffs == pytest.approx(
+        tuple(shaft_power_coeffs([0.0, 0.5, 1.0, 0.1])))
+    assert compiled.rpm_breakpoints[0] == 0.0
+    assert compiled.rpm_breakpoints[-1] == MAX_GENERATOR_RPM
+
+
+def test_compiled_model_evaluators_accept_scalars_and_arrays():
+    model = make_model()
+    compiled = CompiledPowerPlantModel.from_model(model)
+    xs = numpy.array([0.0, 3.0, 12.5])
+    assert compiled.turbine_power(3.0) == pytest.approx(
+        model.power_curve.calculate(3.0))
+    assert compiled.turbine_power(xs) == pytest.approx(
+        [model.power_curve.calculate(x) for x in xs])
+    assert compiled.current(1500.0) == pytest.approx(
+        model.current_curve.calculate(1.5))
+    rpm = numpy.array([500.0, 2000.0])
+    expected = [model.torque_curve.calculate(r / 1000) * r * 2 * numpy.pi / 60 for r in rpm]
+    assert compiled.shaft_power(rpm) == pytest.approx(expected)
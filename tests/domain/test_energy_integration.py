@@ -0,0 +1,77 @@
+from wind_compass.domain.energy_integration import EnergyIntegrator, pairwise_sum
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.domain.constants import INTEGRATION_FIXED, INTEGRATION_LEFT, INTEGRATION_TRAPEZOID
+from datetime import datetime, timedelta
+import numpy
+import pytest
+
+# 10分, 逆行(-5分), 30分, 4時間（欠測）
+TIMESTAMPS = [datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 0, 10), datetime(2024, 1, 1, 0, 5),
+              datetime(2024, 1, 1, 0, 35), datetime(2024, 1, 1, 4, 35)]
+
+
+def test_interval_hours_clips_negative_and_caps_gaps():
+    assert EnergyIntegrator().interval_hours(TIMESTAMPS) == pytest.approx([1/6, 0.0, 0.5, 4.0])
+    capped = EnergyIntegrator(max_gap_hours=1.0).interval_hours(TIMESTAMPS)
+    assert capped == pytest.approx([1/6, 0.0, 0.5, 1.0])
+
+
+@pytest.mark.parametrize("rule, expected", [
+    (INTEGRATION_FIXED, [1/6] * 5),
+    (INTEGRATION_LEFT, [1/6, 0.0, 0.5, 1.0, 0.0]),
+    (INTEGRATION_TRAPEZOID, [1/12, 1/12, 0.25, 0.75, 0.5]),
+])
+def test_weights_per_rule(rule, expected):
+    weights = EnergyIntegrator(rule, max_gap_hours=1.0).weights(TIMESTAMPS)
+    assert weights == pytest.approx(expected)
+
+
+def test_integrate_matches_rule_definitions():
+    timestamps = [datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 0, 30), datetime(2024, 1, 1, 1, 30)]
+    power = [100.0, 200.0, 400.0]
+    assert EnergyIntegrator(INTEGRATION_LEFT).integrate(timestamps, power) == pytest.approx(
+        100.0 * 0.5 + 200.0 * 1.0)
+    assert EnergyIntegrator(INTEGRATION_TRAPEZOID).integrate(timestamps, power) == pytest.approx(
+        (100.0 + 200.0) / 2 * 0.5 + (200.0 + 400.0) / 2 * 1.0)
+    assert EnergyIntegrator(INTEGRATION_FIXED, fixed_interval_hours=0.25).integrate(timestamps, power) == \
+        pytest.approx(700.0 * 0.25)
+
+
+def test_empty_and_single_reading():
+    for rule in (INTEGRATION_LEFT, INTEGRATION_TRAPEZOID):
+        assert EnergyIntegrator(rule).weights([]).size == 0
+        assert EnergyIntegrator(rule).weights([datetime(2024, 1, 1)]).tolist() == [0.0]
+    assert EnergyIntegrator(INTEGRATION_FIXED).weights([datetime(2024, 1, 1)]).tolist() == [1/6]
+
+
+@pytest.mark.parametrize("rule", [INTEGRATION_FIXED, INTEGRATION_LEFT, INTEGRATION_TRAPEZOID])
+def test_weighted_chunks_match_whole_series(rule):
+    observed_at = [datetime(2024, 1, 1) + timedelta(minutes=10 * i + i * i) for i in range(7)]
+    dataset = WindDataset(observed_at, numpy.arange(7.0), numpy.zeros(7))
+    integrator = EnergyIntegrator(rule, max_gap_hours=0.5)
+    chunks = [dataset[0:3], dataset[3:3], dataset[3:4], dataset[4:7]]
+    weighted = list(integrator.weighted_chunks(chunks))
+    # 空のチャンクは読み飛ばす
+    assert [len(chunk) for chunk, _ in weighted] == [3, 1, 3]
+    streamed = numpy.concatenate([weights for _, weights in weighted])
+    assert streamed == pytest.approx(integrator.weights(observed_at), rel=1e-12)
+
+
+def test_weighted_chunks_of_nothing():
+    assert list(EnergyIntegrator().weighted_chunks([])) == []
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"rule": "simpson"}, {"max_gap_hours": 0.0}, {"max_gap_hours": -1.0}, {"fixed_interval_hours": 0.0}])
+def test_invalid_options_raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        EnergyIntegrator(**kwargs)
+
+
+def test_pairwise_sum():
+    assert pairwise_sum([]) == 0.0
+    assert pairwise_sum([2.5]) == 2.5
+    assert pairwise_sum([1.0, 2.0, 3.0, 4.0, 5.0]) == 15.0
+    # 足し合わせる順序は要素数だけで決まる（前半・後半に分けて再帰的に足す）
+    a, b, c, d, e = 0.1, 0.2, 0.3, 0.4, 0.5
+    assert pairwise_sum([a, b, c, d, e]) == (a + b) + (c + (d + e))
@@ -78,3 +78,9 @@ def test_wind_reading_immutable():
     w = WindReading(datetime(2024, 1, 1, 0, 0, 0), 10.0, 270.0)
     with pytest.raises(Exception):
         w.wind_speed = 5.0
+
+
+def test_polynomial_curve_calculate_accepts_arrays():
+    import numpy
+    curve = PolynomialCurve([0, 2, 3, 4])
+    assert curve.calculate(numpy.array([0.0, 1.0, 2.0])).tolist() == [4.0, 9.0, 18.0]
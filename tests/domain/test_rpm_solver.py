@@ -0,0 +1,63 @@
+from wind_compass.domain.rpm_solver import solve_rpm_batch, shaft_power_coeffs
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.models import PolynomialCurve
+from wind_compass.domain.constants import RPM_TO_RAD_PER_SEC, MAX_GENERATOR_RPM
+import math
+import numpy
+import pytest
+
+
+def test_shaft_power_coeffs_scales_krpm_to_rpm():
+    # T(krpm) = 2*krpm -> P(rpm) = 0.002*rpm^2 * 2pi/60
+    coeffs = shaft_power_coeffs([0, 0, 2, 0])
+    assert coeffs == pytest.approx(
+        [0.0, 0.0, 0.002 * RPM_TO_RAD_PER_SEC, 0.0, 0.0])
+
+
+@pytest.mark.parametrize("coeffs, shaft_power, expected", [
+    ([0, 0, 2, 0], 100, math.sqrt(100*60/(0.004*math.pi))),
+    ([0, 1, 0, 0], 0, 0.0),
+    ([0, 0, 1, 0], -100, 0.0),
+    ([0, 0, 1, 0], 1e10, 0.0),
+    ([0, 1, 0, 1], 0, 0.0),
+    ([0, 0, 0, 0], 0, 0.0),
+])
+def test_solve_rpm_batch_follows_scalar_rules(coeffs, shaft_power, expected):
+    rpm = solve_rpm_batch(numpy.array([shaft_power], dtype=float), coeffs)
+    assert rpm[0] == pytest.approx(expected)
+
+
+def roots_reference_rpm(coeffs, shaft_power):
+    # 最小の正の実数解（上限を超える場合・解が無い場合は0）を numpy.roots で求める
+    power_coeffs = shaft_power_coeffs(coeffs)
+    power_coeffs[-1] -= shaft_power
+    roots = [r.real for r in numpy.roots(power_coeffs) if numpy.isreal(r) and r.real > 0]
+    return min(roots) if roots and min(roots) <= MAX_GENERATOR_RPM else 0.0
+
+
+def test_solve_rpm_batch_matches_numpy_roots_on_random_curves():
+    rng = numpy.random.default_rng(42)
+    sim = PowerGenerationSimulator(None)
+    for _ in range(30):
+        coeffs = [float(c) for c in rng.normal(0.0, 2.0, 4)]
+        shaft_powers = numpy.concatenate(
+            [rng.normal(0.0, 500.0, 50), [0.0, 1e9]])
+        rpms = solve_rpm_batch(shaft_powers, coeffs)
+        expected = [roots_reference_rpm(coeffs, p) for p in shaft_powers]
+        assert rpms == pytest.approx(expected, rel=1e-9, abs=1e-9)
+        # 1点ずつ解く経路も同じ解法を使う
+        scalar = [sim._solve_for_rpm(p, PolynomialCurve(coeffs)) for p in shaft_powers]
+        assert scalar == pytest.approx(rpms.tolist(), rel=1e-12, abs=1e-12)
+
+
+def test_solve_for_rpm_raises_for_non_finite_shaft_power():
+    sim = PowerGenerationSimulator(None)
+    with pytest.raises(ValueError):
+        sim._solve_for_rpm(float("nan"), PolynomialCurve([0, 0, 2, 0]))
+
+
+def test_solve_rpm_batch_returns_nan_for_non_finite_input():
+    rpms = solve_rpm_batch(numpy.array(
+        [numpy.nan, numpy.inf, 100.0]), [0, 0, 2, 0])
+    assert numpy.isnan(rpms[:2]).all()
+    assert rpms[2] == pytest.approx(math.sqrt(100*60/(0.004*math.pi)))
@@ -1,4 +1,5 @@
 from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_pairs import collapse_wind_pairs
 from wind_compass.domain.models import PowerPlantModel, PolynomialCurve, Power, Torque, EffectiveWindSpeed, WindReading
 from datetime import datetime
 import math
@@ -134,4 +135,189 @@ def test_calculate_instantaneous_power_backwind():
     sim = PowerGenerationSimulator(model)
     wind = WindReading(datetime(2024, 1, 1, 0, 0, 0), 10, 180) # backwind
     p = sim.calculate_instantaneous_power(wind, 0, 1.0, 10.0, 0)
-    assert p.value == 0.0
\ No newline at end of file
+    assert p.value == 0.0
+
+def make_realistic_model():
+    # P_turbine(v) = 0.5v^3 + 2v^2, T_gen(krpm) = 0.5krpm^2 + krpm + 0.1, I_gen(krpm) = 2krpm + 0.3
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def test_calculate_power_series_matches_scalar_path():
+    import numpy
+    rng = numpy.random.default_rng(0)
+    speeds = rng.uniform(-2.0, 25.0, 500)
+    directions = rng.uniform(0.0, 360.0, 500)
+    sim = PowerGenerationSimulator(make_realistic_model())
+    series = sim.calculate_power_series(speeds, directions, 45.0, 0.9, 24.0, 300.0)
+    expected = [
+        sim.calculate_instantaneous_power(
+            WindReading(datetime(2024, 1, 1), float(s), float(d)), 45.0, 0.9, 24.0, 300.0).value
+        for s, d in zip(speeds, directions)
+    ]
+    assert isinstance(series, numpy.ndarray)
+    assert series == pytest.approx(expected, rel=1e-9, abs=1e-9)
+    assert numpy.count_nonzero(series) > 0
+
+
+def test_calculate_power_series_zeroes_backwind_and_invalid_rows():
+    import numpy
+    sim = PowerGenerationSimulator(make_model())
+    speeds = numpy.array([8.0, 10.0, numpy.nan, 0.0])
+    directions = numpy.array([0.0, 180.0, 0.0, 0.0])
+    series = sim.calculate_power_series(speeds, directions, 0.0, 1.0, 10.0, 0.0)
+    rpm_gen_calc = math.sqrt(512*60/(0.004*math.pi))
+    assert series[0] == pytest.approx(rpm_gen_calc / 1000 * 10.0)
+    assert series[1:].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_calculate_power_series_shape_mismatch_raises():
+    sim = PowerGenerationSimulator(make_model())
+    with pytest.raises(ValueError):
+        sim.calculate_power_series([1.0, 2.0], [0.0], 0.0, 1.0, 10.0, 0.0)
+
+
+@pytest.mark.parametrize("max_block_elements", [1 << 20, 7])
+def test_calculate_energy_by_angle_matches_per_angle_series(max_block_elements):
+    import numpy
+    rng = numpy.random.default_rng(1)
+    speeds = rng.uniform(0.0, 25.0, 300)
+    directions = rng.uniform(0.0, 360.0, 300)
+    hours = rng.uniform(0.0, 0.5, 300)
+    angles = [0.0, 45.0, 200.0]
+    sim = PowerGenerationSimulator(make_realistic_model())
+    energy = sim.calculate_energy_by_angle(
+        speeds, directions, hours, angles, 0.9, 24.0, 300.0, max_block_elements=max_block_elements)
+    expected = [
+        float(numpy.sum(sim.calculate_power_series(speeds, directions, a, 0.9, 24.0, 300.0) * hours))
+        for a in angles
+    ]
+    assert energy.shape == (3,)
+    assert energy == pytest.approx(expected, rel=1e-12)
+
+
+def _quantized_series(n=2000):
+    import numpy
+    rng = numpy.random.default_rng(2)
+    speeds = numpy.round(rng.uniform(0.0, 25.0, n))
+    directions = numpy.round(rng.uniform(0.0, 360.0, n) / 22.5) * 22.5
+    speeds[::97] = numpy.nan
+    directions[::89] = numpy.nan
+    speeds[::53] = -0.0
+    assert collapse_wind_pairs(speeds, directions) is not None
+    return speeds, directions
+
+
+def test_calculate_power_series_unique_pairs_bit_identical():
+    speeds, directions = _quantized_series()
+    sim = PowerGenerationSimulator(make_realistic_model())
+    series = sim.calculate_power_series(speeds, directions, 30.0, 0.9, 24.0, 300.0)
+    eff_ws = sim._calculate_effective_wind_speed_series(speeds, directions, 30.0)
+    row_wise = sim.calculate_power_from_effective_wind_speed(eff_ws, 0.9, 24.0, 300.0)
+    assert series.tobytes() == row_wise.tobytes()
+
+
+@pytest.mark.parametrize("max_block_elements", [1 << 20, 1000])
+def test_calculate_energy_by_angle_unique_pairs_bit_identical(max_block_elements):
+    import numpy
+    speeds, directions = _quantized_series()
+    hours = numpy.random.default_rng(3).uniform(0.0, 0.5, speeds.size)
+    angles = [0.0, 45.0, 200.0, 300.0, 359.5]
+    sim = PowerGenerationSimulator(make_realistic_model())
+    energy = sim.calculate_energy_by_angle(
+        speeds, directions, hours, angles, 0.9, 24.0, 300.0, max_block_elements=max_block_elements)
+    # max_pair_elements=0 では重複除去を行わず、データ点ごとに計算する
+    row_wise = sim.calculate_energy_by_angle(
+        speeds, directions, hours, angles, 0.9, 24.0, 300.0,
+        max_block_elements=max_block_elements, max_pair_elements=0)
+    assert energy.tobytes() == row_wise.tobytes()
+
+
+@pytest.mark.parametrize("quantized", [False, True])
+def test_calculate_energy_grid_matches_per_combination_series(quantized):
+    import numpy
+    rng = numpy.random.default_rng(4)
+    if quantized:
+        speeds, directions = _quantized_series()
+    else:
+        speeds = rng.uniform(0.0, 25.0, 600)
+        directions = rng.uniform(0.0, 360.0, 600)
+    hours = rng.uniform(0.0, 0.5, speeds.size)
+    angles, efficiencies, voltages = [0.0, 135.0], [0.7, 0.95], [12.0, 24.0]
+    # 0rpm（カットイン0では解なしの行も電流を流す）と回転数の分布の途中・上限外の閾値
+    cut_in_rpms = [0.0, 300.0, 900.0, 1e9]
+    sim = PowerGenerationSimulator(make_realistic_model())
+    grid = sim.calculate_energy_grid(speeds, directions, hours, angles, efficiencies, voltages, cut_in_rpms)
+    assert grid.shape == (2, 2, 2, 4)
+    for i, a in enumerate(angles):
+        for j, e in enumerate(efficiencies):
+            for k, v in enumerate(voltages):
+                for m, c in enumerate(cut_in_rpms):
+                    expected = float(numpy.dot(sim.calculate_power_series(speeds, directions, a, e, v, c), hours))
+                    assert grid[i, j, k, m] == pytest.approx(expected, rel=1e-12, abs=1e-9)
+    assert grid[:, :, :, -1].tolist() == numpy.zeros((2, 2, 2)).tolist()
+    assert (grid[:, :, :, 1] > grid[:, :, :, 2]).all()
+
+
+def make_geared_model():
+    # make_realistic_model に風車回転数カーブ rotor_rpm(v) = 20v + 5 を加えたもの
+    base = make_realistic_model()
+    return PowerPlantModel(base.power_curve, base.torque_curve, base.current_curve,
+                           rotor_speed_curve=PolynomialCurve([0.0, 0.0, 20.0, 5.0]))
+
+
+def test_calculate_power_series_gear_ratio_limits_rpm():
+    import numpy
+    rng = numpy.random.default_rng(5)
+    speeds = rng.uniform(0.0, 25.0, 400)
+    directions = rng.uniform(0.0, 360.0, 400)
+    sim = PowerGenerationSimulator(make_geared_model())
+    free = sim.calculate_power_series(speeds, directions, 30.0, 0.9, 24.0, 0.0)
+    # 増速比を指定しない場合は rotor_speed_curve の有無によらず従来と同じ
+    plain = PowerGenerationSimulator(make_realistic_model()).calculate_power_series(
+        speeds, directions, 30.0, 0.9, 24.0, 0.0)
+    assert free.tobytes() == plain.tobytes()
+    low, high = (sim.calculate_power_series(speeds, directions, 30.0, 0.9, 24.0, 0.0, gear_ratio=g)
+                 for g in (1.0, 1e6))
+    assert (low <= free).all() and (low < free).any()
+    # 十分大きい増速比では軸動力の釣り合いの回転数で頭打ちになる
+    assert high == pytest.approx(free, rel=1e-12)
+    expected = [
+        sim.calculate_instantaneous_power(
+            WindReading(datetime(2024, 1, 1), float(s), float(d)), 30.0, 0.9, 24.0, 0.0, gear_ratio=1.0).value
+        for s, d in zip(speeds, directions)
+    ]
+    assert low == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_gear_ratio_requires_rotor_speed_curve_and_positive_ratio():
+    sim = PowerGenerationSimulator(make_realistic_model())
+    with pytest.raises(ValueError, match="rotor_speed_curve"):
+        sim.calculate_power_series([8.0, 9.0], [0.0, 0.0], 0.0, 0.9, 24.0, 0.0, gear_ratio=3.0)
+    geared = PowerGenerationSimulator(make_geared_model())
+    with pytest.raises(ValueError):
+        geared.calculate_power_series([8.0, 9.0], [0.0, 0.0], 0.0, 0.9, 24.0, 0.0, gear_ratio=0.0)
+    with pytest.raises(ValueError):
+        geared.calculate_energy_by_angle_and_gear([8.0], [0.0], [1.0], [0.0], [3.0, -1.0], 0.9, 24.0, 0.0)
+
+
+@pytest.mark.parametrize("max_block_elements", [1 << 20, 5])
+def test_calculate_energy_by_angle_and_gear_matches_per_gear_series(max_block_elements):
+    import numpy
+    rng = numpy.random.default_rng(6)
+    speeds = rng.uniform(0.0, 25.0, 300)
+    directions = rng.uniform(0.0, 360.0, 300)
+    hours = rng.uniform(0.0, 0.5, 300)
+    angles, gear_ratios = [0.0, 90.0, 250.0], [1.0, 3.0, 5.0, 50.0]
+    sim = PowerGenerationSimulator(make_geared_model())
+    matrix = sim.calculate_energy_by_angle_and_gear(
+        speeds, directions, hours, angles, gear_ratios, 0.9, 24.0, 300.0, max_block_elements=max_block_elements)
+    assert matrix.shape == (3, 4)
+    for i, a in enumerate(angles):
+        for j, g in enumerate(gear_ratios):
+            expected = float(numpy.dot(
+                sim.calculate_power_series(speeds, directions, a, 0.9, 24.0, 300.0, gear_ratio=g), hours))
+            assert matrix[i, j] == pytest.approx(expected, rel=1e-12, abs=1e-9)
@@ -0,0 +1,60 @@
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.models import PowerPlantModel, PolynomialCurve
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def test_transfer_table_matches_exact_path_within_reported_error():
+    sim = PowerGenerationSimulator(make_model())
+    table = sim.transfer_table(0.9, 24.0, 300.0, max_wind_speed=25.0)
+    v = numpy.linspace(0.0, 25.0, 20001)
+    exact = sim.calculate_power_from_effective_wind_speed(v, 0.9, 24.0, 300.0)
+    interpolated, covered = table.lookup(v)
+    assert covered.all()
+    assert table.max_abs_error < 1e-3
+    # 不連続点（カットイン）を挟む極小区間以外では報告された誤差以内
+    near_jump = numpy.zeros_like(v, dtype=bool)
+    for d in table.discontinuities:
+        near_jump |= numpy.abs(v - d) < 1e-9
+    assert numpy.max(numpy.abs(interpolated - exact)[~near_jump]) <= table.max_abs_error * 1.5
+
+
+def test_transfer_table_locates_cut_in_discontinuity():
+    sim = PowerGenerationSimulator(make_model())
+    table = sim.transfer_table(0.9, 24.0, 300.0, max_wind_speed=25.0)
+    jumps = [d for d in table.discontinuities if d > 0.1]
+    assert len(jumps) == 1
+    below = sim.calculate_power_from_effective_wind_speed(
+        [jumps[0] - 1e-6], 0.9, 24.0, 300.0)
+    above = sim.calculate_power_from_effective_wind_speed(
+        [jumps[0] + 1e-6], 0.9, 24.0, 300.0)
+    assert below[0] == 0.0
+    assert above[0] > 0.0
+
+
+def test_calculate_power_series_with_table_falls_back_outside_range():
+    sim = PowerGenerationSimulator(make_model())
+    table = sim.transfer_table(0.9, 24.0, 300.0, max_wind_speed=10.0)
+    speeds = numpy.array([5.0, 18.0, 0.0, 7.0])
+    directions = numpy.array([0.0, 10.0, 0.0, 180.0])
+    exact = sim.calculate_power_series(speeds, directions, 0.0, 0.9, 24.0, 300.0)
+    approx = sim.calculate_power_series(
+        speeds, directions, 0.0, 0.9, 24.0, 300.0, transfer_table=table)
+    assert approx[1] == exact[1]
+    assert approx == pytest.approx(exact, abs=table.max_abs_error + 1e-12)
+
+
+def test_transfer_table_is_cached_per_model_and_parameters():
+    table_a = PowerGenerationSimulator(make_model()).transfer_table(0.9, 24.0, 300.0, 24.3)
+    table_b = PowerGenerationSimulator(make_model()).transfer_table(0.9, 24.0, 300.0, 24.9)
+    table_c = PowerGenerationSimulator(make_model()).transfer_table(0.8, 24.0, 300.0, 24.9)
+    assert table_a is table_b
+    assert table_a is not table_c
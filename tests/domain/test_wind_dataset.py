@@ -0,0 +1,51 @@
+from wind_compass.domain.wind_dataset import WindDataset
+from wind_compass.domain.models import WindReading
+from datetime import datetime
+import numpy
+import pytest
+
+
+def make_readings():
+    return [
+        WindReading(datetime(2024, 1, 1, 0, 0), 5.0, 10.0),
+        WindReading(datetime(2024, 1, 1, 0, 10), 6.5, 20.0),
+        WindReading(datetime(2024, 1, 1, 0, 20), 7.0, 30.0),
+    ]
+
+
+def test_dataset_round_trips_readings_lazily():
+    readings = make_readings()
+    dataset = WindDataset.from_readings(readings)
+    assert len(dataset) == 3
+    assert dataset.observed_at.dtype == numpy.dtype('datetime64[ns]')
+    assert dataset.wind_speeds.tolist() == [5.0, 6.5, 7.0]
+    assert list(dataset) == readings
+    assert dataset[1] == readings[1]
+    assert dataset[-1] == readings[-1]
+
+
+def test_dataset_slices_without_copy_and_is_read_only():
+    dataset = WindDataset.from_readings(make_readings())
+    tail = dataset[1:]
+    assert isinstance(tail, WindDataset)
+    assert len(tail) == 2
+    assert numpy.shares_memory(tail.wind_speeds, dataset.wind_speeds)
+    assert tail[0] == make_readings()[1]
+    with pytest.raises(ValueError):
+        dataset.wind_speeds[0] = 1.0
+
+
+def test_dataset_float32_and_validation():
+    dataset = WindDataset.from_readings(make_readings(), dtype=numpy.float32)
+    assert dataset.dtype == numpy.float32
+    assert dataset.nbytes == 3 * 8 + 2 * 3 * 4
+    with pytest.raises(ValueError):
+        WindDataset([], [], [], dtype=numpy.int32)
+    with pytest.raises(ValueError):
+        WindDataset(numpy.array(['2024-01-01'], dtype='datetime64[ns]'), [1.0, 2.0], [0.0, 0.0])
+
+
+def test_as_dataset_passes_through_datasets():
+    dataset = WindDataset.from_readings(make_readings())
+    assert WindDataset.as_dataset(dataset) is dataset
+    assert len(WindDataset.as_dataset([])) == 0
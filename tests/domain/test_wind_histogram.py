@@ -0,0 +1,36 @@
+from wind_compass.domain.wind_histogram import WindHistogram, interval_hours
+from datetime import datetime
+import numpy
+import pytest
+
+
+def test_interval_hours_uses_next_timestamp_and_clips_negative():
+    hours = interval_hours([
+        datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 0, 10),
+        datetime(2024, 1, 1, 0, 5), datetime(2024, 1, 1, 0, 35)])
+    assert hours == pytest.approx([1/6, 0.0, 0.5, 0.0])
+
+
+def test_interval_hours_empty_and_single():
+    assert interval_hours([]).size == 0
+    assert interval_hours([datetime(2024, 1, 1)]).tolist() == [0.0]
+
+
+def test_histogram_groups_quantized_readings():
+    speeds = [5.0, 5.0, 5.1, 0.3, 0.3]
+    directions = [10.0, 370.0, 10.0, 200.0, 200.0]
+    hours = [1.0, 2.0, 0.5, 0.25, 0.0]
+    histogram = WindHistogram.from_series(speeds, directions, hours)
+    assert histogram.bin_count == 3
+    assert histogram.hours.sum() == pytest.approx(3.75)
+    by_speed = dict(zip(numpy.round(histogram.speeds, 6), histogram.hours))
+    assert by_speed == pytest.approx({5.0: 3.0, 5.1: 0.5, 0.3: 0.25})
+    assert sorted(histogram.directions) == pytest.approx([10.0, 10.0, 200.0])
+
+
+def test_histogram_integrate_and_invalid_bin_width():
+    histogram = WindHistogram.from_series([1.0, 2.0], [0.0, 0.0], [1.0, 2.0])
+    power = numpy.where(histogram.speeds < 1.5, 100.0, 10.0)
+    assert histogram.integrate(power) == pytest.approx(120.0)
+    with pytest.raises(ValueError):
+        WindHistogram.from_series([1.0], [0.0], [1.0], speed_bin_width=0.0)
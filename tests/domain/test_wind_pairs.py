@@ -0,0 +1,37 @@
+from wind_compass.domain.wind_pairs import UniqueWindPairs, collapse_wind_pairs
+import numpy
+import pytest
+
+
+def test_unique_pairs_round_trip():
+    speeds = numpy.array([5.0, 5.0, 5.1, 5.0, 0.0, -0.0, 5.1])
+    directions = numpy.array([90.0, 90.0, 90.0, 180.0, 10.0, 10.0, 90.0])
+    pairs = UniqueWindPairs.from_series(speeds, directions)
+    # (0, 10), (5, 90), (5, 180), (5.1, 90)。±0 は同じ組
+    assert pairs.pair_count == 4
+    assert pairs.speeds[pairs.inverse].tolist() == speeds.tolist()
+    assert pairs.directions[pairs.inverse].tolist() == directions.tolist()
+    assert pairs.inverse.tolist() == [1, 1, 3, 2, 0, 0, 3]
+
+
+def test_unique_pairs_keep_nan_readings_apart():
+    speeds = numpy.array([numpy.nan, numpy.nan, 5.0, 5.0])
+    directions = numpy.array([90.0, 90.0, numpy.nan, numpy.nan])
+    pairs = UniqueWindPairs.from_series(speeds, directions)
+    assert pairs.pair_count == 4
+    assert numpy.array_equal(pairs.speeds[pairs.inverse], speeds, equal_nan=True)
+    assert numpy.array_equal(pairs.directions[pairs.inverse], directions, equal_nan=True)
+
+
+def test_collapse_only_when_pairs_repeat():
+    repeated = numpy.tile([1.0, 2.0], 5)
+    assert collapse_wind_pairs(repeated, numpy.zeros(10)).pair_count == 2
+    assert collapse_wind_pairs(numpy.arange(10.0), numpy.zeros(10)) is None
+    assert collapse_wind_pairs(numpy.arange(10.0), numpy.zeros(10), max_fraction=1.0).pair_count == 10
+    assert collapse_wind_pairs([1.0], [0.0]) is None
+    assert collapse_wind_pairs(numpy.ones((2, 2)), numpy.zeros((2, 2))) is None
+
+
+def test_unique_pairs_shape_mismatch_raises():
+    with pytest.raises(ValueError):
+        UniqueWindPairs.from_series([1.0, 2.0], [0.0])
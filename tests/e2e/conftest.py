@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path_factory, monkeypatch):
+    # CLI の結果キャッシュ（既定は $XDG_CACHE_HOME/wind_compass）をテストごとに分け、前回の実行結果を使わないようにする
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg_cache")))
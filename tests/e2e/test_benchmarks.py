@@ -0,0 +1,52 @@
+import sys
+import os
+import json
+import subprocess
+
+ROOT = os.path.dirname(__file__) + '/../../'
+
+
+def run_benchmarks(*args):
+    cmd = [sys.executable, "-m", "benchmarks", *args]
+    return subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT)
+
+
+def test_benchmarks_run_writes_json_results(tmp_path):
+    output = tmp_path / "results.json"
+    result = run_benchmarks("run", "--dataset", "1d-10min", "--angle-counts", "1,8",
+                            "--scalar-rows", "20", "--repeat", "1",
+                            "--data-dir", str(tmp_path / "data"), "--output", str(output))
+    assert result.returncode == 0, result.stderr
+    report = json.loads(output.read_text())
+    assert report["schema_version"] == 1
+    assert report["metadata"]["repeat"] == 1
+    names = {(r["name"], r["dataset"], json.dumps(r["parameters"])) for r in report["results"]}
+    assert ("JsonConfigReader.read", None, "{}") in names
+    assert ("CsvWindDataReader.read", "1d-10min", "{}") in names
+    assert ("PowerGenerationSimulator._solve_for_rpm", "1d-10min", "{}") in names
+    assert ("RunMultipleSimulationScenariosUseCase", "1d-10min", '{"angles": 8}') in names
+    for r in report["results"]:
+        assert len(r["seconds"]) == 1
+        assert r["best_seconds"] > 0
+    # 1行ずつ評価するAPIは --scalar-rows 行だけ計測する
+    solve = next(r for r in report["results"] if r["name"] == "PowerGenerationSimulator._solve_for_rpm")
+    assert solve["rows"] == 20
+
+
+def test_benchmarks_compare_reports_regressions(tmp_path):
+    base = {"schema_version": 1, "metadata": {}, "results": [
+        {"name": "CsvWindDataReader.read", "dataset": "1d-10min", "parameters": {}, "best_seconds": 1.0},
+        {"name": "JsonConfigReader.read", "dataset": None, "parameters": {}, "best_seconds": 1.0},
+    ]}
+    head = json.loads(json.dumps(base))
+    (tmp_path / "base.json").write_text(json.dumps(base))
+    (tmp_path / "head.json").write_text(json.dumps(head))
+    result = run_benchmarks("compare", str(tmp_path / "base.json"), str(tmp_path / "head.json"))
+    assert result.returncode == 0
+    assert "REGRESSION" not in result.stdout
+
+    head["results"][0]["best_seconds"] = 2.0
+    (tmp_path / "head.json").write_text(json.dumps(head))
+    result = run_benchmarks("compare", str(tmp_path / "base.json"), str(tmp_path / "head.json"))
+    assert result.returncode == 1
+    assert "CsvWindDataReader.read [1d-10min] 1.000000s -> 2.000000s x2.00 REGRESSION" in result.stdout
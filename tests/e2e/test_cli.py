@@ -1,10 +1,14 @@
 import sys
 import os
 import subprocess
+import json
 import tempfile
 import shutil
 import pytest
 
+# --help の表示では読み込まない重い依存（コマンドの実行時に読み込む）
+HEAVY_MODULES = ("numpy", "pandas", "tabulate", "pyarrow")
+
 
 def test_cli_matrix_output():
     wind_path = os.path.join(os.path.dirname(
@@ -31,3 +35,230 @@ def test_cli_help():
     assert result.returncode == 0
     assert "--wind-data" in result.stdout
     assert "--angles" in result.stdout
+
+
+def test_cli_help_does_not_import_heavy_modules():
+    # --help の表示では重い依存を読み込まない（時間の計測は環境によって揺れるため、読み込まれたモジュールで判定する）
+    script = (
+        "import runpy, sys\n"
+        "sys.argv = ['main.py', '--help']\n"
+        "try:\n"
+        "    runpy.run_path('main.py', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('HEAVY:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                            text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 0, result.stderr
+    assert "--wind-data" in result.stdout
+    assert result.stdout.splitlines()[-1] == "HEAVY:"
+
+
+def test_cli_optimize_angle(tmp_path):
+    wind_path = tmp_path / "wind.csv"
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(36):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    wind_path.write_text("\n".join(rows) + "\n")
+    config_path = os.path.join(os.path.dirname(
+        __file__), '../fixtures/valid_config.json')
+    cmd = [sys.executable, "main.py", "optimize-angle", "--wind-data", str(wind_path),
+           "--config-file", config_path]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 0, result.stderr
+    assert "Optimal angle:" in result.stdout
+    assert "Coarse sweep:" in result.stdout
+
+
+def test_cli_profile_reports_stages_and_writes_cprofile_stats(tmp_path):
+    wind_path = tmp_path / "wind.csv"
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(36):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    wind_path.write_text("\n".join(rows) + "\n")
+    config_path = os.path.join(os.path.dirname(
+        __file__), '../fixtures/valid_config.json')
+    stats_path = tmp_path / "run.pstats"
+    cmd = [sys.executable, "main.py", "--wind-data", str(wind_path), "--config-file", config_path,
+           "--angles", "0,200", "--efficiency", "0.9", "--voltage", "100", "--no-wind-cache",
+           "--profile", "--profile-stats", str(stats_path)]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 0, result.stderr
+    # 結果は stdout、計測結果は stderr に出す
+    assert "Annual Power" in result.stdout
+    assert "Profile:" not in result.stdout
+    for name in ("read wind", "read config", "simulate 2 angles (sweep)", "present",
+                 "rows read", "tailwind zeroed", "swallowed exceptions"):
+        assert name in result.stderr
+    import pstats
+    assert pstats.Stats(str(stats_path)).total_calls > 0
+
+
+def test_cli_result_cache_reuses_results_until_inputs_change(tmp_path):
+    wind_path = tmp_path / "wind.csv"
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(36):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    wind_path.write_text("\n".join(rows) + "\n")
+    config_path = os.path.join(os.path.dirname(
+        __file__), '../fixtures/valid_config.json')
+
+    def run(*args):
+        cmd = [sys.executable, "main.py", "--wind-data", str(wind_path), "--config-file", config_path,
+               "--efficiency", "0.9", "--voltage", "100", "--cache-dir", str(tmp_path / "cache"), *args]
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+    first = run("--angles", "0,200")
+    assert "Result cache: 0 hits, 2 misses" in first
+    assert "Integration rule: fixed" in first
+    # 追加した角度だけを計算する
+    second = run("--angles", "0,90,200")
+    assert "Result cache: 2 hits, 1 misses" in second
+    assert first.split("\n")[3] == second.split("\n")[3]
+    assert "Result cache" not in run("--angles", "0,200", "--no-cache")
+    # 読み込みオプションが変わると同じファイルでも別の結果として扱う
+    assert "Result cache: 0 hits, 2 misses" in run("--angles", "0,200", "--timestamp-format", "%Y-%m-%d %H:%M:%S")
+    wind_path.write_text("\n".join(rows[:-1]) + "\n")
+    assert "Result cache: 0 hits, 2 misses" in run("--angles", "0,200")
+
+
+def test_cli_batch_writes_consolidated_table(tmp_path):
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(36):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    (tmp_path / "site.csv").write_text("\n".join(rows) + "\n")
+    fixtures = os.path.join(os.path.dirname(__file__), '../fixtures')
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({
+        "wind_data": ["site.csv", "missing.csv"],
+        "config_files": [os.path.join(fixtures, "valid_config.json"), os.path.join(fixtures, "valid_config_B.json")],
+        "angles": [0, 200],
+        "parameter_sets": [{"name": "base", "efficiency": 0.9, "voltage": 100}],
+    }))
+    output_csv = tmp_path / "results.csv"
+    cmd = [sys.executable, "main.py", "batch", str(manifest), "--workers", "2", "--output-csv", str(output_csv)]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    # 失敗したタスクがあっても全タスクの結果を出力し、終了コードで知らせる
+    assert result.returncode == 1, result.stderr
+    assert "4 of 8 scenarios succeeded" in result.stdout
+    lines = output_csv.read_text().splitlines()
+    assert lines[0] == "wind_data,config_file,parameter_set,angle,annual_power_kwh,error"
+    assert len(lines) == 9
+    assert sum("missing.csv" in line and "No such file" in line for line in lines) == 4
+
+
+
+def test_cli_batch_result_cache_keys_include_reader_options(tmp_path):
+    from click.testing import CliRunner
+    from wind_compass.adapters.ui.cli import get_cli
+    from wind_compass.domain.wind_dataset import WindDataset
+    from wind_compass.use_cases.ports import WindDataReader
+    import numpy
+
+    class OptionWindDataReader(WindDataReader):
+        # 読み込みオプション（風速の倍率）によって同じファイルから異なる風況データを返すリーダ
+        scale = 1.0
+
+        def read(self, file_path):
+            observed_at = numpy.datetime64("2024-01-01T00:00") + numpy.arange(36) * numpy.timedelta64(10, "m")
+            return WindDataset(observed_at, numpy.full(36, 8.0 * self.scale), numpy.zeros(36))
+
+        def parse_options(self, file_path):
+            return {"scale": self.scale}
+
+    (tmp_path / "site.csv").write_text("placeholder\n")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({
+        "wind_data": ["site.csv"],
+        "config_files": [os.path.join(os.path.dirname(__file__), '../fixtures/valid_config.json')],
+        "angles": [0],
+        "parameter_sets": [{"name": "base", "efficiency": 0.9, "voltage": 100}],
+    }))
+    reader = OptionWindDataReader()
+    cli = get_cli(wind_reader=reader)
+    args = ["batch", str(manifest), "--cache-dir", str(tmp_path / "cache"), "--output-csv", str(tmp_path / "out.csv")]
+
+    def annual_power_kwh():
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0, result.output
+        return float((tmp_path / "out.csv").read_text().splitlines()[1].split(",")[4])
+
+    first = annual_power_kwh()
+    reader.scale = 1.5
+    # 読み込みオプションが変わると、同じファイルでもキャッシュ済みの結果を使わずに計算し直す
+    assert annual_power_kwh() != pytest.approx(first)
+
+
+def test_cli_gear_matrix_csv(tmp_path):
+    import csv
+    wind_path = tmp_path / "wind.csv"
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(36):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    wind_path.write_text("\n".join(rows) + "\n")
+    fixtures = os.path.join(os.path.dirname(__file__), '../fixtures')
+    csv_path = tmp_path / "matrix.csv"
+    cmd = [sys.executable, "main.py", "--wind-data", str(wind_path),
+           "--config-file", os.path.join(fixtures, 'valid_config_gear.json'),
+           "--angles", "0,200", "--gear-ratios", "3,5", "--output-csv", str(csv_path)]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 0, result.stderr
+    assert "Gear 3" in result.stdout and "Best:" in result.stdout
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        table = list(csv.reader(f))
+    assert table[0] == ['', 'Gear 3', 'Gear 5']
+    assert [row[0] for row in table[1:]] == ['Angle 0', 'Angle 200']
+    assert float(table[2][2]) > 0.0
+    # 風車回転数カーブの無いコンフィグはエラー
+    cmd[cmd.index("--config-file") + 1] = os.path.join(fixtures, 'valid_config.json')
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 1
+    assert "rotor_speed_curve" in result.stderr
+
+
+def test_cli_parameter_sweep(tmp_path):
+    wind_path = tmp_path / "wind.csv"
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(36):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    wind_path.write_text("\n".join(rows) + "\n")
+    config_path = os.path.join(os.path.dirname(
+        __file__), '../fixtures/valid_config.json')
+    cmd = [sys.executable, "main.py", "--wind-data", str(wind_path), "--config-file", config_path,
+           "--angles", "0,200", "--efficiencies", "0.8,0.9", "--voltages", "50,100", "--cut-in-rpm", "5"]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 0, result.stderr
+    assert "Cut-in (rpm)" in result.stdout
+    assert result.stdout.count(" kWh ") == 8 + 1  # 8組み合わせ + Best
+    assert "Best:" in result.stdout
+    result = subprocess.run(
+        cmd + ["--engine", "table"], capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 2
+
+
+def test_cli_rejects_max_gap_with_fixed_rule(tmp_path):
+    wind_path = tmp_path / "wind.csv"
+    rows = ["observed_at,max_wind_speed_mps,max_wind_direction_deg"]
+    for i in range(12):
+        rows.append(f"2024-01-01 {i // 6:02d}:{i % 6 * 10:02d}:00,{8.0 + i % 3},{200 + i % 7}")
+    wind_path.write_text("\n".join(rows) + "\n")
+    config_path = os.path.join(os.path.dirname(__file__), '../fixtures/valid_config.json')
+    cmd = [sys.executable, "main.py", "--wind-data", str(wind_path), "--config-file", config_path,
+           "--angles", "0", "--max-gap-minutes", "30", "--no-cache"]
+    # exact エンジンの既定は fixed で、欠測の打ち切りが効かないため指定を拒否する
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 2
+    assert "--max-gap-minutes" in result.stderr
+    result = subprocess.run(
+        cmd + ["--integration", "left"], capture_output=True, text=True, cwd=os.path.dirname(__file__) + '/../../')
+    assert result.returncode == 0, result.stderr
+    assert "Integration rule: left" in result.stdout
@@ -0,0 +1,113 @@
+from wind_compass.use_cases.angle_sweep import RunAngleSweepUseCase
+from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def make_readings(n=400):
+    rng = numpy.random.default_rng(5)
+    start = datetime(2024, 1, 1)
+    return [
+        WindReading(start + timedelta(minutes=10 * i),
+                    float(rng.uniform(0.0, 20.0)), float(rng.uniform(0.0, 360.0)))
+        for i in range(n)
+    ]
+
+
+def make_readers(readings):
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = readings
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    return wind_reader, config_reader
+
+
+def make_input_dto(**kwargs):
+    params = dict(
+        wind_data_path="wind.csv", config_file_path="config.json", angles=[0.0, 90.0, 225.0],
+        efficiency=0.9, voltage=24.0, cut_in_rpm=300.0)
+    params.update(kwargs)
+    return MultipleScenariosInputDTO(**params)
+
+
+def test_angle_sweep_matches_single_scenario_per_angle():
+    wind_reader, config_reader = make_readers(make_readings())
+    sweep = RunAngleSweepUseCase(
+        wind_reader, config_reader, PowerGenerationSimulator, max_block_elements=100)
+    single = RunSingleSimulationScenarioUseCase(
+        wind_reader, config_reader, PowerGenerationSimulator)
+    input_dto = make_input_dto()
+    results = sweep.execute(input_dto)
+    assert [r.angle for r in results] == input_dto.angles
+    for r in results:
+        expected = single.execute(single.input_dto_class(
+            wind_data_path="wind.csv", config_file_path="config.json", angle=r.angle,
+            efficiency=0.9, voltage=24.0, cut_in_rpm=300.0))
+        assert r.annual_power_kwh == pytest.approx(expected.annual_power_kwh, rel=1e-9)
+    # データは全角度で1回だけ読み込む
+    assert wind_reader.read.call_count == 1 + len(input_dto.angles)
+
+
+def test_multiple_scenarios_fall_back_to_per_angle_when_sweep_fails():
+    sweep = MagicMock()
+    sweep.execute.side_effect = ValueError("No wind data found or file is empty.")
+    single = MagicMock()
+    single.input_dto_class = MagicMock()
+    single.execute.return_value = MagicMock(
+        annual_power_kwh=1.0, error_message=None, max_interpolation_error_w=None)
+    use_case = RunMultipleSimulationScenariosUseCase(single, angle_sweep_use_case=sweep)
+    results = use_case.execute(make_input_dto())
+    assert sweep.execute.call_count == 1
+    assert single.execute.call_count == 3
+    assert [r.annual_power_kwh for r in results] == [1.0, 1.0, 1.0]
+
+
+def test_multiple_scenarios_skip_sweep_for_single_angle():
+    sweep = MagicMock()
+    single = MagicMock()
+    single.input_dto_class = MagicMock()
+    single.execute.return_value = MagicMock(
+        annual_power_kwh=2.0, error_message=None, max_interpolation_error_w=None)
+    use_case = RunMultipleSimulationScenariosUseCase(single, angle_sweep_use_case=sweep)
+    results = use_case.execute(make_input_dto(angles=[10.0]))
+    sweep.execute.assert_not_called()
+    assert results[0].annual_power_kwh == 2.0
+
+
+def test_angle_sweep_streaming_matches_whole_file():
+    from wind_compass.domain.wind_dataset import WindDataset
+    readings = make_readings()
+    wind_reader, config_reader = make_readers(readings)
+    wind_reader.read_chunks.return_value = iter([
+        WindDataset.from_readings(readings[:150]), WindDataset.from_readings(readings[150:])])
+    sweep = RunAngleSweepUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+    whole = sweep.execute(make_input_dto())
+    streamed = sweep.execute(make_input_dto(chunk_size=150))
+    wind_reader.read_chunks.assert_called_once_with("wind.csv", 150)
+    assert [r.annual_power_kwh for r in streamed] == pytest.approx(
+        [r.annual_power_kwh for r in whole], rel=1e-12)
+
+
+def test_angle_sweep_uses_defaults_when_parameters_omitted():
+    from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM
+    wind_reader, config_reader = make_readers(make_readings())
+    sweep = RunAngleSweepUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+    results = sweep.execute(make_input_dto(efficiency=None, voltage=None, cut_in_rpm=None))
+    expected = sweep.execute(make_input_dto(
+        efficiency=DEFAULT_EFFICIENCY, voltage=DEFAULT_VOLTAGE, cut_in_rpm=DEFAULT_CUT_IN_RPM))
+    assert [r.annual_power_kwh for r in results] == [r.annual_power_kwh for r in expected]
+    assert all(r.annual_power_kwh > 0.0 for r in results)
@@ -0,0 +1,100 @@
+from wind_compass.use_cases.batch import RunBatchUseCase
+from wind_compass.use_cases.input_cache import InputCache
+from wind_compass.use_cases.angle_sweep import RunAngleSweepUseCase
+from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+from wind_compass.use_cases.dtos import BatchInputDTO, BatchParameterSet, MultipleScenariosInputDTO
+from wind_compass.domain.models import PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model(scale=1.0):
+    return PowerPlantModel(
+        PolynomialCurve([0.5 * scale, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def make_dataset(seed):
+    rng = numpy.random.default_rng(seed)
+    observed_at = numpy.datetime64("2024-01-01T00:00") + numpy.arange(200) * numpy.timedelta64(10, "m")
+    return WindDataset(observed_at, numpy.round(rng.gamma(2.0, 3.0, 200), 1), rng.integers(0, 16, 200) * 22.5)
+
+
+DATASETS = {"a.csv": make_dataset(1), "b.csv": make_dataset(2)}
+MODELS = {"m1.json": make_model(), "m2.json": make_model(2.0)}
+
+
+def make_use_case():
+    wind_reader = MagicMock()
+    wind_reader.read.side_effect = lambda path: DATASETS[path]
+    config_reader = MagicMock()
+
+    def read_config(path):
+        if path not in MODELS:
+            raise FileNotFoundError(path)
+        return MODELS[path]
+    config_reader.read.side_effect = read_config
+    input_cache = InputCache(wind_reader, config_reader)
+    readers = dict(wind_data_reader=input_cache.wind_data_reader,
+                   power_plant_model_reader=input_cache.power_plant_model_reader,
+                   power_generation_simulator_factory=PowerGenerationSimulator)
+    multi = RunMultipleSimulationScenariosUseCase(
+        RunSingleSimulationScenarioUseCase(**readers), angle_sweep_use_case=RunAngleSweepUseCase(**readers))
+    return RunBatchUseCase(multi, input_cache), multi, wind_reader, config_reader
+
+
+@pytest.fixture(autouse=True)
+def stat_any_path(monkeypatch):
+    # 入力キャッシュは stat できるパスのみ保持するため、テスト用のパスも stat できるようにする
+    import os
+    from wind_compass.use_cases import input_cache
+    monkeypatch.setattr(input_cache, "_file_key", lambda path: (os.path.abspath(path), 0, 0))
+
+
+def test_batch_matches_individual_runs_and_loads_each_file_once():
+    use_case, multi, wind_reader, config_reader = make_use_case()
+    parameter_sets = [BatchParameterSet("base", efficiency=0.9, voltage=100.0, cut_in_rpm=10.0),
+                      BatchParameterSet("trap", efficiency=0.8, voltage=100.0, cut_in_rpm=10.0,
+                                        integration_rule="trapezoid")]
+    results = use_case.execute(BatchInputDTO(
+        wind_data_paths=["a.csv", "b.csv", "a.csv"], config_file_paths=["m1.json", "m2.json"],
+        angles=[0.0, 90.0], parameter_sets=parameter_sets, workers=4))
+    assert wind_reader.read.call_count == 2
+    assert config_reader.read.call_count == 2
+    assert len(results) == 3 * 2 * 2 * 2
+    # タスクの順（風況データ → コンフィグ → パラメータセット → 角度）に並ぶ
+    assert [(r.wind_data_path, r.config_file_path, r.parameter_set, r.angle) for r in results[:4]] == [
+        ("a.csv", "m1.json", "base", 0.0), ("a.csv", "m1.json", "base", 90.0),
+        ("a.csv", "m1.json", "trap", 0.0), ("a.csv", "m1.json", "trap", 90.0)]
+    for r in results:
+        p = next(p for p in parameter_sets if p.name == r.parameter_set)
+        expected = multi.execute(MultipleScenariosInputDTO(
+            r.wind_data_path, r.config_file_path, [r.angle], p.efficiency, p.voltage, p.cut_in_rpm,
+            integration_rule=p.integration_rule))[0]
+        assert r.error_message is None
+        assert r.annual_power_kwh == pytest.approx(expected.annual_power_kwh, rel=1e-12)
+
+
+def test_failures_are_reported_per_task():
+    use_case, multi, _, _ = make_use_case()
+    original = multi.execute
+
+    def flaky(input_dto):
+        if input_dto.wind_data_path == "b.csv":
+            raise RuntimeError("boom")
+        return original(input_dto)
+    multi.execute = flaky
+    results = use_case.execute(BatchInputDTO(
+        wind_data_paths=["a.csv", "b.csv"], config_file_paths=["m1.json", "missing.json"],
+        angles=[0.0, 90.0], workers=2))
+    errors = {(r.wind_data_path, r.config_file_path): r.error_message for r in results}
+    assert errors[("a.csv", "m1.json")] is None
+    assert "missing.json" in errors[("a.csv", "missing.json")]
+    assert errors[("b.csv", "m1.json")] == "boom"
+    assert len(results) == 8
@@ -0,0 +1,63 @@
+from wind_compass.use_cases.gear_matrix import RunGearMatrixUseCase
+from wind_compass.use_cases.dtos import GearMatrixInputDTO
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model(rotor_speed_curve=PolynomialCurve([0.0, 0.0, 20.0, 5.0])):
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3]),
+        rotor_speed_curve=rotor_speed_curve
+    )
+
+
+def make_readers(model, n=300):
+    rng = numpy.random.default_rng(7)
+    start = datetime(2024, 1, 1)
+    readings = [
+        WindReading(start + timedelta(minutes=10 * i),
+                    round(float(rng.uniform(0.0, 20.0)), 1), float(rng.integers(0, 16)) * 22.5)
+        for i in range(n)
+    ]
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = readings
+    config_reader = MagicMock()
+    config_reader.read.return_value = model
+    return wind_reader, config_reader
+
+
+@pytest.mark.parametrize("rule", [None, "trapezoid"])
+def test_gear_matrix_matches_per_gear_series(rule):
+    model = make_model()
+    wind_reader, config_reader = make_readers(model)
+    results = RunGearMatrixUseCase(wind_reader, config_reader, PowerGenerationSimulator).execute(
+        GearMatrixInputDTO(wind_data_path="wind.csv", config_file_path="config.json",
+                           angles=[0.0, 90.0, 180.0], gear_ratios=[1.0, 3.0], integration_rule=rule))
+    # 角度 → 増速比の順
+    assert [(r.angle, r.gear_ratio) for r in results] == [
+        (0.0, 1.0), (0.0, 3.0), (90.0, 1.0), (90.0, 3.0), (180.0, 1.0), (180.0, 3.0)]
+    dataset = WindDataset.as_dataset(wind_reader.read.return_value)
+    hours = EnergyIntegrator(rule or "fixed").weights(dataset.observed_at)
+    sim = PowerGenerationSimulator(model)
+    for r in results:
+        power = sim.calculate_power_series(
+            dataset.wind_speeds, dataset.wind_directions, r.angle,
+            DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM, gear_ratio=r.gear_ratio)
+        assert r.annual_power_kwh == pytest.approx(float(numpy.dot(power, hours)) / 1000.0, rel=1e-12)
+
+
+def test_gear_matrix_requires_rotor_speed_curve():
+    wind_reader, config_reader = make_readers(make_model(rotor_speed_curve=None))
+    with pytest.raises(ValueError, match="rotor_speed_curve"):
+        RunGearMatrixUseCase(wind_reader, config_reader, PowerGenerationSimulator).execute(
+            GearMatrixInputDTO(wind_data_path="wind.csv", config_file_path="config.json",
+                               angles=[0.0], gear_ratios=[3.0]))
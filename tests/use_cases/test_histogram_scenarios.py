@@ -0,0 +1,86 @@
+from wind_compass.use_cases.histogram_scenarios import RunHistogramScenariosUseCase
+from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def make_readings(n=500):
+    rng = numpy.random.default_rng(3)
+    start = datetime(2024, 1, 1)
+    return [
+        WindReading(start + timedelta(minutes=10 * i),
+                    float(numpy.round(rng.gamma(2.0, 3.0), 1)), float(rng.integers(0, 16) * 22.5))
+        for i in range(n)
+    ]
+
+
+def make_use_case(readings):
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = readings
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    return RunHistogramScenariosUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+
+
+def make_input_dto(**kwargs):
+    return MultipleScenariosInputDTO(
+        wind_data_path="wind.csv", config_file_path="config.json", angles=[0.0, 90.0],
+        efficiency=0.9, voltage=24.0, cut_in_rpm=300.0, engine="histogram", **kwargs)
+
+
+def test_histogram_matches_exact_for_quantized_data():
+    readings = make_readings()
+    results = make_use_case(readings).execute(make_input_dto(compare_exact=True))
+    assert [r.angle for r in results] == [0.0, 90.0]
+    for r in results:
+        assert r.error_message is None
+        assert r.annual_power_kwh > 0
+        assert r.exact_energy_difference_kwh == pytest.approx(0.0, abs=1e-9)
+
+
+def test_histogram_coarse_bins_report_difference():
+    results = make_use_case(make_readings()).execute(make_input_dto(
+        compare_exact=True, speed_bin_width=2.0, direction_bin_width=45.0))
+    assert any(abs(r.exact_energy_difference_kwh) > 1e-6 for r in results)
+
+
+def test_histogram_reader_error_is_reported_per_angle():
+    wind_reader = MagicMock()
+    wind_reader.read.side_effect = ValueError("bad wind data")
+    use_case = RunHistogramScenariosUseCase(wind_reader, MagicMock(), PowerGenerationSimulator)
+    results = use_case.execute(make_input_dto())
+    assert [r.error_message for r in results] == ["bad wind data", "bad wind data"]
+
+
+def test_multiple_scenarios_delegates_histogram_engine():
+    histogram_uc = MagicMock()
+    histogram_uc.execute.return_value = ["delegated"]
+    single_uc = MagicMock()
+    usecase = RunMultipleSimulationScenariosUseCase(single_uc, histogram_use_case=histogram_uc)
+    assert usecase.execute(make_input_dto()) == ["delegated"]
+    single_uc.execute.assert_not_called()
+
+
+def test_histogram_default_rule_weights_by_observed_at_gaps():
+    # 積分方式を省略した場合、ヒストグラムは observed_at の差分を時間重みとする（left）
+    readings = make_readings()
+    readings = readings[:100] + [
+        WindReading(r.observed_at + timedelta(hours=6), r.wind_speed, r.wind_direction) for r in readings[100:]]
+    default = make_use_case(readings).execute(make_input_dto())
+    left = make_use_case(readings).execute(make_input_dto(integration_rule="left"))
+    fixed = make_use_case(readings).execute(make_input_dto(integration_rule="fixed"))
+    assert [r.annual_power_kwh for r in default] == [r.annual_power_kwh for r in left]
+    assert [r.annual_power_kwh for r in default] != pytest.approx([r.annual_power_kwh for r in fixed])
@@ -0,0 +1,169 @@
+from wind_compass.use_cases.incremental import RunIncrementalScenariosUseCase, prefix_hash
+from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
+from wind_compass.use_cases.ports import ScenarioStateStore
+from wind_compass.domain.models import PowerPlantModel, PolynomialCurve
+from wind_compass.domain.energy_integration import EnergyIntegrator
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+class MemoryStateStore(ScenarioStateStore):
+    def __init__(self):
+        self.states = {}
+
+    def load(self, wind_data_path, key):
+        return self.states.get((wind_data_path, key))
+
+    def save(self, wind_data_path, key, state):
+        self.states[(wind_data_path, key)] = state
+
+
+def make_model(c0=0.0):
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, c0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def make_dataset(n=300):
+    rng = numpy.random.default_rng(5)
+    # 10分間隔に欠測（2時間）と時刻の重複を混ぜる
+    minutes = numpy.cumsum(rng.choice([10, 10, 10, 0, 120], size=n))
+    observed_at = numpy.datetime64("2024-01-01T00:00") + minutes.astype("timedelta64[m]")
+    return WindDataset(observed_at, numpy.round(rng.gamma(2.0, 3.0, n), 1), rng.integers(0, 16, n) * 22.5)
+
+
+def make_use_case(store, model=None):
+    wind_reader = MagicMock()
+    config_reader = MagicMock()
+    config_reader.read.return_value = model or make_model()
+    simulator = MagicMock(wraps=PowerGenerationSimulator(model or make_model()))
+    use_case = RunIncrementalScenariosUseCase(wind_reader, config_reader, lambda m: simulator, store)
+    return use_case, wind_reader, simulator
+
+
+def make_input_dto(**kwargs):
+    values = dict(wind_data_path="wind.csv", config_file_path="config.json", angles=[0.0, 90.0],
+                  efficiency=0.9, voltage=100.0, cut_in_rpm=10.0, incremental=True)
+    values.update(kwargs)
+    return MultipleScenariosInputDTO(**values)
+
+
+def full_energy_kwh(dataset, angle, rule="fixed", max_gap_hours=None):
+    power = PowerGenerationSimulator(make_model()).calculate_power_series(
+        dataset.wind_speeds, dataset.wind_directions, angle, 0.9, 100.0, 10.0)
+    return EnergyIntegrator(rule, max_gap_hours).integrate(dataset.observed_at, power) / 1000.0
+
+
+@pytest.mark.parametrize("rule", ["fixed", "left", "trapezoid"])
+def test_appended_rows_match_full_recompute(rule):
+    dataset = make_dataset()
+    store = MemoryStateStore()
+    use_case, wind_reader, simulator = make_use_case(store)
+    dto = make_input_dto(integration_rule=rule, max_gap_hours=1.0)
+    for rows in (100, 101, 250, 300):
+        wind_reader.read.return_value = dataset[:rows]
+        results = use_case.execute(dto)
+        for r in results:
+            assert r.error_message is None
+            assert r.annual_power_kwh == pytest.approx(
+                full_energy_kwh(dataset[:rows], r.angle, rule, 1.0), rel=1e-12)
+    # 前回からの追記分（継ぎ目の1行を含む）だけを計算する
+    assert [r.rows_simulated for r in results] == [50, 50]
+    assert simulator.calculate_power_series.call_args.args[0].shape == (51,)
+
+
+def test_no_new_rows_skips_simulation():
+    dataset = make_dataset()
+    store = MemoryStateStore()
+    use_case, wind_reader, simulator = make_use_case(store)
+    wind_reader.read.return_value = dataset
+    first = use_case.execute(make_input_dto())
+    simulator.calculate_power_series.reset_mock()
+    second = use_case.execute(make_input_dto())
+    simulator.calculate_power_series.assert_not_called()
+    assert [r.rows_simulated for r in second] == [0, 0]
+    assert [r.annual_power_kwh for r in second] == [r.annual_power_kwh for r in first]
+
+
+@pytest.mark.parametrize("change", ["edit_earlier_row", "truncate"])
+def test_changed_prefix_falls_back_to_full_recompute(change):
+    dataset = make_dataset()
+    store = MemoryStateStore()
+    use_case, wind_reader, _ = make_use_case(store)
+    wind_reader.read.return_value = dataset[:200]
+    use_case.execute(make_input_dto())
+    if change == "edit_earlier_row":
+        speeds = numpy.array(dataset.wind_speeds)
+        speeds[10] += 1.0
+        changed = WindDataset(dataset.observed_at, speeds, dataset.wind_directions)
+    else:
+        changed = dataset[:150]
+    wind_reader.read.return_value = changed
+    results = use_case.execute(make_input_dto())
+    assert [r.rows_simulated for r in results] == [len(changed)] * 2
+    for r in results:
+        assert r.annual_power_kwh == pytest.approx(full_energy_kwh(changed, r.angle), rel=1e-12)
+
+
+def test_states_are_kept_per_scenario_parameters():
+    dataset = make_dataset()
+    store = MemoryStateStore()
+    use_case, wind_reader, _ = make_use_case(store)
+    wind_reader.read.return_value = dataset
+    use_case.execute(make_input_dto())
+    results = use_case.execute(make_input_dto(angles=[0.0, 45.0], efficiency=0.8))
+    # 効率が変わると別のシナリオとして全件を計算する
+    assert [r.rows_simulated for r in results] == [len(dataset)] * 2
+    assert len(store.states) == 4
+    other_model, _, _ = make_use_case(store, make_model(c0=1.0))
+    other_model._wind_data_reader.read.return_value = dataset
+    assert [r.rows_simulated for r in other_model.execute(make_input_dto())] == [len(dataset)] * 2
+
+
+
+def test_changed_parse_options_fall_back_to_full_recompute():
+    dataset = make_dataset()
+    store = MemoryStateStore()
+    use_case, wind_reader, _ = make_use_case(store)
+    wind_reader.read.return_value = dataset
+    wind_reader.parse_options.return_value = {"timestamp_format": None}
+    use_case.execute(make_input_dto())
+    assert [r.rows_simulated for r in use_case.execute(make_input_dto())] == [0, 0]
+    # 読み込みオプションが変わると、同じファイルでも保存した状態を引き継がない
+    wind_reader.parse_options.return_value = {"timestamp_format": "%Y-%m-%d %H:%M"}
+    assert [r.rows_simulated for r in use_case.execute(make_input_dto())] == [len(dataset)] * 2
+
+def test_prefix_hash_ignores_value_dtype_and_depends_on_rows():
+    dataset = make_dataset(20)
+    as_float32 = WindDataset(dataset.observed_at, dataset.wind_speeds.astype(numpy.float32).astype(float),
+                             dataset.wind_directions)
+    assert prefix_hash(dataset, 10) == prefix_hash(dataset[:10], 10)
+    assert prefix_hash(dataset, 10) != prefix_hash(dataset, 11)
+    assert prefix_hash(as_float32, 20) == prefix_hash(
+        WindDataset(as_float32.observed_at, as_float32.wind_speeds, as_float32.wind_directions,
+                    dtype=numpy.float32), 20)
+
+
+def test_read_errors_are_reported_per_angle():
+    use_case, wind_reader, _ = make_use_case(MemoryStateStore())
+    wind_reader.read.return_value = []
+    results = use_case.execute(make_input_dto())
+    assert [r.error_message for r in results] == ["No wind data found or file is empty."] * 2
+
+
+def test_multiple_scenarios_routes_incremental_runs():
+    incremental = MagicMock()
+    single = MagicMock()
+    use_case = RunMultipleSimulationScenariosUseCase(single, incremental_use_case=incremental)
+    dto = make_input_dto()
+    assert use_case.execute(dto) is incremental.execute.return_value
+    use_case.execute(replace(dto, incremental=False, angles=[0.0]))
+    assert incremental.execute.call_count == 1
@@ -0,0 +1,111 @@
+from wind_compass.use_cases.input_cache import InputCache, InputCacheStats
+from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from datetime import datetime
+from unittest.mock import MagicMock
+import os
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+@pytest.fixture
+def files(tmp_path):
+    wind_path = tmp_path / "wind.csv"
+    wind_path.write_text("dummy")
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{}")
+    return str(wind_path), str(config_path)
+
+
+def make_cache():
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = iter([
+        WindReading(datetime(2024, 1, 1), 8.0, 0.0),
+        WindReading(datetime(2024, 1, 1, 0, 10), 9.0, 10.0)])
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    return InputCache(wind_reader, config_reader), wind_reader, config_reader
+
+
+def test_cache_hits_until_file_changes(files):
+    wind_path, config_path = files
+    cache, wind_reader, config_reader = make_cache()
+    first = cache.read_wind_data(wind_path)
+    assert cache.read_wind_data(wind_path) is first
+    assert len(first) == 2
+    cache.read_power_plant_model(config_path)
+    cache.read_power_plant_model(config_path)
+    assert cache.stats() == InputCacheStats(hits=2, misses=2)
+
+    # サイズ・更新時刻が変わると読み直す
+    with open(wind_path, "a") as f:
+        f.write("more")
+    cache.read_wind_data(wind_path)
+    assert wind_reader.read.call_count == 2
+    assert config_reader.read.call_count == 1
+
+
+def test_cache_invalidate_and_unstattable_paths(files):
+    wind_path, config_path = files
+    cache, wind_reader, config_reader = make_cache()
+    cache.read_power_plant_model(config_path)
+    cache.invalidate(config_path)
+    cache.read_power_plant_model(config_path)
+    assert config_reader.read.call_count == 2
+    cache.invalidate()
+    cache.read_power_plant_model(config_path)
+    assert config_reader.read.call_count == 3
+    # 存在しないパスはキャッシュせず毎回リーダへ委譲する
+    cache.read_power_plant_model("missing.json")
+    cache.read_power_plant_model("missing.json")
+    assert config_reader.read.call_count == 5
+    assert cache.stats().hits == 0
+
+
+def test_cache_does_not_store_failed_reads(files):
+    wind_path, _ = files
+    cache, wind_reader, _ = make_cache()
+    wind_reader.read.side_effect = [ValueError("broken"), []]
+    with pytest.raises(ValueError):
+        cache.read_wind_data(wind_path)
+    assert len(cache.read_wind_data(wind_path)) == 0
+
+
+def test_multiple_scenarios_share_cache_and_report_counts(files):
+    wind_path, config_path = files
+    cache, wind_reader, config_reader = make_cache()
+    single = RunSingleSimulationScenarioUseCase(
+        cache.wind_data_reader, cache.power_plant_model_reader, PowerGenerationSimulator)
+    use_case = RunMultipleSimulationScenariosUseCase(single, input_cache=cache)
+    input_dto = MultipleScenariosInputDTO(
+        wind_data_path=wind_path, config_file_path=config_path,
+        angles=[0.0, 45.0, 90.0], efficiency=1.0, voltage=10.0, cut_in_rpm=0.0)
+    results = use_case.execute(input_dto)
+    assert wind_reader.read.call_count == 1
+    assert config_reader.read.call_count == 1
+    assert all(r.error_message is None for r in results)
+    assert [(r.input_cache_hits, r.input_cache_misses) for r in results] == [(4, 2)] * 3
+    # 2回目の実行は全てキャッシュから読む
+    results = use_case.execute(input_dto)
+    assert (results[0].input_cache_hits, results[0].input_cache_misses) == (6, 0)
+
+
+def test_cache_rereads_when_parse_options_change(files):
+    wind_path, _ = files
+    cache, wind_reader, _ = make_cache()
+    wind_reader.parse_options.return_value = {"timestamp_format": "%m/%d/%Y"}
+    cache.read_wind_data(wind_path)
+    cache.read_wind_data(wind_path)
+    wind_reader.parse_options.return_value = {"timestamp_format": "%d/%m/%Y"}
+    cache.read_wind_data(wind_path)
+    assert cache.stats() == InputCacheStats(hits=1, misses=2)
@@ -0,0 +1,83 @@
+from wind_compass.use_cases.optimize_angle import OptimizeTurbineAngleUseCase
+from wind_compass.use_cases.dtos import OptimizeAngleInputDTO
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def make_readings(n=300):
+    # 主風向 250度付近の風
+    rng = numpy.random.default_rng(11)
+    start = datetime(2024, 1, 1)
+    return [
+        WindReading(start + timedelta(minutes=10 * i),
+                    float(rng.gamma(2.0, 3.0)), float(rng.normal(250.0, 30.0) % 360.0))
+        for i in range(n)
+    ]
+
+
+def make_use_case(readings):
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = readings
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    return OptimizeTurbineAngleUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+
+
+def test_optimize_angle_beats_fine_grid():
+    readings = make_readings()
+    use_case = make_use_case(readings)
+    output = use_case.execute(OptimizeAngleInputDTO(
+        wind_data_path="wind.csv", config_file_path="config.json",
+        efficiency=0.9, voltage=24.0, cut_in_rpm=300.0))
+    assert output.error_message is None
+    assert len(output.coarse_curve) == 72
+
+    sim = PowerGenerationSimulator(make_model())
+    speeds = numpy.array([r.wind_speed for r in readings])
+    directions = numpy.array([r.wind_direction for r in readings])
+    grid = numpy.arange(0.0, 360.0, 0.1)
+    energy = sim.calculate_energy_by_angle(
+        speeds, directions, numpy.full(speeds.shape, 1.0 / 6.0), grid, 0.9, 24.0, 300.0) / 1000.0
+    assert output.annual_power_kwh >= energy.max() - 1e-9
+    assert output.optimal_angle == pytest.approx(grid[numpy.argmax(energy)], abs=0.2)
+
+
+def test_optimize_angle_reports_load_errors():
+    use_case = make_use_case([])
+    output = use_case.execute(OptimizeAngleInputDTO(
+        wind_data_path="wind.csv", config_file_path="config.json"))
+    assert output.optimal_angle is None
+    assert "No wind data" in output.error_message
+
+
+def test_optimize_angle_uses_integration_rule():
+    # 観測間隔が一定でない系列では left の時間重み（observed_at の差分）で年間発電量を求める
+    readings = make_readings(60)
+    readings = [WindReading(r.observed_at + timedelta(minutes=5 * (i % 3)), r.wind_speed, r.wind_direction)
+                for i, r in enumerate(readings)]
+    use_case = make_use_case(readings)
+    output = use_case.execute(OptimizeAngleInputDTO(
+        wind_data_path="wind.csv", config_file_path="config.json",
+        efficiency=0.9, voltage=24.0, cut_in_rpm=300.0, integration_rule="left", max_gap_hours=0.2))
+    assert output.error_message is None
+
+    sim = PowerGenerationSimulator(make_model())
+    speeds = numpy.array([r.wind_speed for r in readings])
+    directions = numpy.array([r.wind_direction for r in readings])
+    gaps = numpy.diff([r.observed_at for r in readings]) / timedelta(hours=1)
+    hours = numpy.append(numpy.minimum(gaps, 0.2), 0.0)
+    energy = sim.calculate_energy_by_angle(
+        speeds, directions, hours, [output.optimal_angle], 0.9, 24.0, 300.0) / 1000.0
+    assert output.annual_power_kwh == pytest.approx(energy[0])
@@ -0,0 +1,123 @@
+from wind_compass.use_cases import parallel_scenarios
+from wind_compass.use_cases.parallel_scenarios import RunParallelScenariosUseCase, SharedWindColumns
+from wind_compass.use_cases.angle_sweep import RunAngleSweepUseCase
+from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationScenariosUseCase
+from wind_compass.use_cases.dtos import MultipleScenariosInputDTO
+from wind_compass.domain.models import PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from multiprocessing import shared_memory
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.5, 2.0, 0.3])
+    )
+
+
+def make_dataset(n=3000):
+    rng = numpy.random.default_rng(11)
+    observed_at = numpy.datetime64("2024-01-01T00:00") + numpy.arange(n) * numpy.timedelta64(10, "m")
+    return WindDataset(observed_at, rng.uniform(0.0, 20.0, n), rng.uniform(0.0, 360.0, n))
+
+
+def make_use_case(dataset, min_elements=0):
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = dataset
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    serial = RunAngleSweepUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+    return RunParallelScenariosUseCase(wind_reader, config_reader, serial, min_elements=min_elements), serial
+
+
+def make_input_dto(**kwargs):
+    params = dict(wind_data_path="wind.csv", config_file_path="config.json",
+                  angles=[float(a) for a in range(0, 360, 30)] + [90.0],
+                  efficiency=0.9, voltage=100.0, cut_in_rpm=10.0, workers=2)
+    params.update(kwargs)
+    return MultipleScenariosInputDTO(**params)
+
+
+def test_parallel_matches_serial_sweep_in_input_order(monkeypatch):
+    # 小さなデータでも複数のタスク（角度グループ × データ点の範囲）に分ける
+    monkeypatch.setattr(parallel_scenarios, "PARALLEL_ROWS_PER_TASK", 1000)
+    monkeypatch.setattr(parallel_scenarios, "PARALLEL_ANGLES_PER_TASK", 5)
+    dataset = make_dataset()
+    use_case, serial = make_use_case(dataset)
+    input_dto = make_input_dto(integration_rule="trapezoid")
+    results = use_case.execute(input_dto)
+    expected = serial.execute(input_dto)
+    assert [r.angle for r in results] == input_dto.angles
+    for r, e in zip(results, expected):
+        assert r.error_message is None
+        assert r.annual_power_kwh == pytest.approx(e.annual_power_kwh, rel=1e-12)
+    # 重複した角度も個別に計算する
+    assert results[3].annual_power_kwh == pytest.approx(results[-1].annual_power_kwh, rel=1e-12)
+    # 固定の分割のため、ワーカ数が変わっても結果は同じ
+    again = use_case.execute(make_input_dto(integration_rule="trapezoid", workers=3))
+    assert [r.annual_power_kwh for r in again] == [r.annual_power_kwh for r in results]
+
+
+def test_parallel_matches_serial_with_parameters_omitted():
+    dataset = make_dataset(500)
+    use_case, serial = make_use_case(dataset)
+    input_dto = make_input_dto(angles=[0.0, 90.0, 200.0], efficiency=None, voltage=None, cut_in_rpm=None)
+    results = use_case.execute(input_dto)
+    expected = serial.execute(input_dto)
+    for r, e in zip(results, expected):
+        assert r.error_message is None
+        assert r.annual_power_kwh > 0.0
+        assert r.annual_power_kwh == pytest.approx(e.annual_power_kwh, rel=1e-12)
+
+
+def test_small_inputs_and_single_worker_run_serially():
+    dataset = make_dataset(100)
+    use_case, serial = make_use_case(dataset, min_elements=10 ** 6)
+    serial.execute = MagicMock(wraps=serial.execute)
+    use_case.execute(make_input_dto())
+    use_case.execute(make_input_dto(workers=1))
+    assert serial.execute.call_count == 2
+
+
+def test_per_angle_errors_are_isolated_in_workers(monkeypatch):
+    # ワーカ内で1角度だけ失敗させる（グループでの計算 → 角度ごとの再計算で切り分ける）
+    monkeypatch.setattr(parallel_scenarios, "_worker_columns",
+                        numpy.array([[5.0, 8.0], [0.0, 90.0], [1.0, 1.0]]))
+
+    class FlakySimulator(PowerGenerationSimulator):
+        def calculate_energy_by_angle(self, speeds, directions, hours, angles, *args, **kwargs):
+            if 45.0 in list(angles):
+                raise ValueError("bad angle")
+            return super().calculate_energy_by_angle(speeds, directions, hours, angles, *args, **kwargs)
+    monkeypatch.setattr(parallel_scenarios, "_worker_simulator", FlakySimulator(make_model()))
+    results = parallel_scenarios._energy_task((0, 2), [0.0, 45.0, 90.0], 0.9, 100.0, 10.0, 1 << 20)
+    assert results[1] == (0.0, "bad angle")
+    assert results[0][1] is None and results[2][1] is None
+    assert results[0][0] > 0.0
+
+
+def test_shared_columns_are_released():
+    with SharedWindColumns([1.0, 2.0], [3.0, 4.0], [0.5, 0.5]) as shared:
+        attached = shared_memory.SharedMemory(name=shared.name)
+        columns = numpy.ndarray((3, 2), dtype=numpy.float64, buffer=attached.buf)
+        assert columns.tolist() == [[1.0, 2.0], [3.0, 4.0], [0.5, 0.5]]
+        del columns
+        attached.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shared.name)
+
+
+def test_multiple_scenarios_uses_parallel_use_case_only_with_workers():
+    sweep = MagicMock()
+    parallel = MagicMock()
+    use_case = RunMultipleSimulationScenariosUseCase(
+        MagicMock(), angle_sweep_use_case=sweep, parallel_use_case=parallel)
+    use_case.execute(make_input_dto(workers=4))
+    use_case.execute(make_input_dto(workers=None))
+    assert parallel.execute.call_count == 1
+    assert sweep.execute.call_count == 1
@@ -0,0 +1,71 @@
+from wind_compass.use_cases.parameter_sweep import RunParameterSweepUseCase
+from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+from wind_compass.use_cases.dtos import ParameterSweepInputDTO, SingleScenarioInputDTO
+from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve
+from wind_compass.domain.services import PowerGenerationSimulator
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model():
+    return PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+
+
+def make_readers(n=300):
+    rng = numpy.random.default_rng(6)
+    start = datetime(2024, 1, 1)
+    readings = [
+        WindReading(start + timedelta(minutes=10 * i),
+                    round(float(rng.uniform(0.0, 20.0)), 1), float(rng.integers(0, 16)) * 22.5)
+        for i in range(n)
+    ]
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = readings
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    return wind_reader, config_reader
+
+
+@pytest.mark.parametrize("rule", [None, "trapezoid"])
+def test_parameter_sweep_matches_single_scenarios(rule):
+    wind_reader, config_reader = make_readers()
+    use_case = RunParameterSweepUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+    single = RunSingleSimulationScenarioUseCase(wind_reader, config_reader, PowerGenerationSimulator)
+    results = use_case.execute(ParameterSweepInputDTO(
+        wind_data_path="wind.csv", config_file_path="config.json", angles=[0.0, 90.0],
+        efficiencies=[0.8, 0.9], voltages=[12.0, 24.0], cut_in_rpms=[0.0, 500.0],
+        integration_rule=rule))
+    assert len(results) == 16
+    # 角度 → 効率 → 電圧 → カットイン回転数の順
+    assert [(r.angle, r.efficiency, r.voltage, r.cut_in_rpm) for r in results[:3]] == [
+        (0.0, 0.8, 12.0, 0.0), (0.0, 0.8, 12.0, 500.0), (0.0, 0.8, 24.0, 0.0)]
+    for r in results:
+        expected = single.execute(SingleScenarioInputDTO(
+            wind_data_path="wind.csv", config_file_path="config.json", angle=r.angle,
+            efficiency=r.efficiency, voltage=r.voltage, cut_in_rpm=r.cut_in_rpm, integration_rule=rule))
+        assert r.annual_power_kwh == pytest.approx(expected.annual_power_kwh, rel=1e-12)
+
+
+def test_parameter_sweep_defaults_empty_axes():
+    wind_reader, config_reader = make_readers()
+    results = RunParameterSweepUseCase(wind_reader, config_reader, PowerGenerationSimulator).execute(
+        ParameterSweepInputDTO(wind_data_path="wind.csv", config_file_path="config.json",
+                               angles=[45.0], voltages=[10.0, 20.0]))
+    assert [(r.efficiency, r.voltage, r.cut_in_rpm) for r in results] == [
+        (DEFAULT_EFFICIENCY, 10.0, DEFAULT_CUT_IN_RPM), (DEFAULT_EFFICIENCY, 20.0, DEFAULT_CUT_IN_RPM)]
+    assert results[1].annual_power_kwh == pytest.approx(2.0 * results[0].annual_power_kwh)
+    assert DEFAULT_VOLTAGE not in [r.voltage for r in results]
+
+
+def test_parameter_sweep_empty_wind_data_raises():
+    wind_reader, config_reader = make_readers(0)
+    with pytest.raises(ValueError, match="No wind data"):
+        RunParameterSweepUseCase(wind_reader, config_reader, PowerGenerationSimulator).execute(
+            ParameterSweepInputDTO(wind_data_path="wind.csv", config_file_path="config.json", angles=[0.0]))
@@ -20,3 +20,54 @@ def test_present_multiple_scenarios_matrix():
     assert "Error: calc error" in output
     assert "Angle (deg)" in output
     assert "Annual Power" in output
+
+
+def test_present_profile():
+    from wind_compass.use_cases.profiling import ProfileReport, StageTiming
+    report = ProfileReport(
+        stages=[StageTiming("read wind", 0.75, 1), StageTiming("simulate angle=0", 0.25, 1)],
+        counters={"rows read": 144, "swallowed exceptions": 0})
+    output = ConsolePresenter().present_profile(report)
+    assert "read wind" in output
+    assert "75.0%" in output
+    assert "1.0000" in output
+    assert "rows read" in output and "144" in output
+
+
+def test_present_parameter_sweep():
+    from wind_compass.use_cases.dtos import ParameterSweepResult
+    results = [
+        ParameterSweepResult(angle=0.0, efficiency=0.8, voltage=100.0, cut_in_rpm=5.0, annual_power_kwh=10.0),
+        ParameterSweepResult(angle=90.0, efficiency=0.9, voltage=200.0, cut_in_rpm=5.0, annual_power_kwh=25.5),
+    ]
+    output = ConsolePresenter().present_parameter_sweep(results)
+    assert "Cut-in (rpm)" in output
+    assert "25.50 kWh" in output
+    assert "Best: 25.50 kWh at angle 90.00 deg, efficiency 0.9, voltage 200 V, cut-in 5 rpm" in output
+    assert ConsolePresenter().present_parameter_sweep([]) == "No parameter sweep results to present."
+
+
+def test_present_gear_matrix():
+    from wind_compass.adapters.ui.presenters import gear_matrix_table
+    from wind_compass.use_cases.dtos import GearMatrixResult
+    results = [
+        GearMatrixResult(angle=0.0, gear_ratio=3.0, annual_power_kwh=10.0),
+        GearMatrixResult(angle=0.0, gear_ratio=5.0, annual_power_kwh=12.0),
+        GearMatrixResult(angle=22.5, gear_ratio=3.0, annual_power_kwh=15.0),
+        GearMatrixResult(angle=22.5, gear_ratio=5.0, annual_power_kwh=25.5),
+    ]
+    matrix_data, row_labels, col_labels = gear_matrix_table(results)
+    assert row_labels == ['Angle 0', 'Angle 22.5']
+    assert col_labels == ['Gear 3', 'Gear 5']
+    assert matrix_data['Angle 22.5']['Gear 5'] == 25.5
+    output = ConsolePresenter().present_gear_matrix(results)
+    assert "Gear 5" in output and "25.50" in output
+    assert "Best: 25.50 kWh at angle 22.50 deg, gear ratio 5" in output
+    assert ConsolePresenter().present_gear_matrix([]) == "No gear matrix results to present."
+
+
+def test_present_multiple_scenarios_shows_integration_rule():
+    results = [ScenarioResult(angle=0, annual_power_kwh=1000.0)]
+    output = ConsolePresenter().present_multiple_scenarios(results, [0], "left")
+    assert output.endswith("\nIntegration rule: left")
+    assert "Integration rule" not in ConsolePresenter().present_multiple_scenarios(results, [0])
@@ -0,0 +1,216 @@
+from wind_compass.use_cases.profiling import (
+    RunProfile, ProfiledUseCase, ProfilingWindDataReader, ProfilingPowerPlantModelReader,
+    ProfilingPowerGenerationSimulator, count_swallowed_exception, profile_stage, STAGE_READ_WIND,
+    STAGE_READ_CONFIG, COUNTERS, COUNTER_ROWS_READ, COUNTER_ROWS_SIMULATED, COUNTER_TAILWIND_ZEROED,
+    COUNTER_CUT_IN_REJECTED, COUNTER_RPM_CUTOFF, COUNTER_NO_ROOT, COUNTER_SOLVER_FAILURES,
+    COUNTER_SWALLOWED_EXCEPTIONS)
+from wind_compass.use_cases.run_single_scenario import RunSingleSimulationScenarioUseCase
+from wind_compass.use_cases.dtos import SingleScenarioInputDTO
+from wind_compass.domain.models import WindReading, PowerPlantModel, PolynomialCurve, Power
+from wind_compass.domain.services import PowerGenerationSimulator
+from wind_compass.domain.wind_dataset import WindDataset
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import numpy
+import pytest
+
+
+def make_model():
+    # 風車出力 P=2v^3 [W], トルク T=5*krpm [Nm]（回転数は軸動力の平方根に比例）
+    return PowerPlantModel(
+        PolynomialCurve([2.0, 0.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.0, 5.0, 0.0]),
+        PolynomialCurve([0.0, 0.0, 10.0, 0.0])
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_nested_stages_exclude_inner_time():
+    clock = FakeClock()
+    profile = RunProfile(clock=clock)
+    with profile.stage("simulate"):
+        clock.now += 1.0
+        with profile.stage(STAGE_READ_WIND):
+            clock.now += 2.0
+        clock.now += 0.5
+    with profile.stage(STAGE_READ_WIND):
+        clock.now += 1.0
+    report = profile.report()
+    assert [(s.name, s.seconds, s.calls) for s in report.stages] == [
+        ("simulate", 1.5, 1), (STAGE_READ_WIND, 3.0, 2)]
+    assert report.total_seconds == 4.5
+    assert set(report.counters) == set(COUNTERS)
+
+
+def test_profile_stage_without_profile_is_noop():
+    with profile_stage(None, "present"):
+        pass
+
+
+def test_swallowed_exceptions_are_counted_only_while_active():
+    profile = RunProfile()
+    count_swallowed_exception()
+    with profile.activate():
+        count_swallowed_exception()
+        count_swallowed_exception()
+    count_swallowed_exception()
+    assert profile.report().counters[COUNTER_SWALLOWED_EXCEPTIONS] == 2
+
+
+def test_profiling_readers_time_reads_and_count_rows():
+    profile = RunProfile()
+    readings = [WindReading(datetime(2024, 1, 1) + timedelta(minutes=10 * i), 5.0, 0.0) for i in range(5)]
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = iter(readings)
+    wind_reader.read_chunks.return_value = iter(
+        [WindDataset.from_readings(readings[:3]), WindDataset.from_readings(readings[3:])])
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+
+    assert len(ProfilingWindDataReader(wind_reader, profile).read("wind.csv")) == 5
+    chunks = list(ProfilingWindDataReader(wind_reader, profile).read_chunks("wind.csv", 3))
+    assert [len(c) for c in chunks] == [3, 2]
+    assert ProfilingPowerPlantModelReader(config_reader, profile).read("config.json") == make_model()
+
+    report = profile.report()
+    calls = {s.name: s.calls for s in report.stages}
+    # チャンク読み込みは終端の確認を含めてチャンク数+1回
+    assert calls == {STAGE_READ_WIND: 1 + 3, STAGE_READ_CONFIG: 1}
+    assert report.counters[COUNTER_ROWS_READ] == 10
+
+
+def test_profiled_use_case_names_stage_from_input():
+    profile = RunProfile()
+    inner = MagicMock()
+    inner.input_dto_class = SingleScenarioInputDTO
+    inner.execute.return_value = "result"
+    use_case = ProfiledUseCase(inner, profile, lambda dto: f"simulate angle={dto.angle:g}")
+    assert use_case.input_dto_class is SingleScenarioInputDTO
+    assert use_case.execute(SingleScenarioInputDTO("w.csv", "c.json", angle=90.0)) == "result"
+    assert [s.name for s in profile.report().stages] == ["simulate angle=90"]
+
+
+def test_profiling_simulator_counts_without_changing_results():
+    model = make_model()
+    # 向かい風: 0度, 追い風: 180度。風速40m/sは回転数の上限を超える
+    speeds = numpy.array([5.0, 5.0, 1.0, 40.0, numpy.nan, 8.0])
+    directions = numpy.array([0.0, 180.0, 0.0, 0.0, 0.0, 10.0])
+    profile = RunProfile()
+    simulator = ProfilingPowerGenerationSimulator(model, profile)
+    power = simulator.calculate_power_series(speeds, directions, 0.0, 1.0, 100.0, 300.0)
+    expected = PowerGenerationSimulator(model).calculate_power_series(
+        speeds, directions, 0.0, 1.0, 100.0, 300.0)
+    numpy.testing.assert_array_equal(power, expected)
+
+    counters = profile.report().counters
+    assert counters[COUNTER_ROWS_SIMULATED] == 6
+    assert counters[COUNTER_TAILWIND_ZEROED] == 1
+    # 1m/s は回転数約60rpmでカットイン(300rpm)未満
+    assert counters[COUNTER_CUT_IN_REJECTED] == 1
+    assert counters[COUNTER_RPM_CUTOFF] == 1
+    # NaN の風速は回転数を解けない
+    assert counters[COUNTER_SOLVER_FAILURES] == 1
+
+
+
+def test_profiling_simulator_separates_no_root_from_solver_failures():
+    # トルク T=10*krpm-krpm^2 [Nm] では軸動力に上限（約15.5kW）があり、それを超える風車出力には解が無い
+    model = PowerPlantModel(
+        PolynomialCurve([2.0, 0.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, -1.0, 10.0, 0.0]),
+        PolynomialCurve([0.0, 0.0, 10.0, 0.0])
+    )
+    profile = RunProfile()
+    simulator = ProfilingPowerGenerationSimulator(model, profile)
+    power = simulator.calculate_power_series(
+        numpy.array([5.0, 30.0, 30.0]), numpy.zeros(3), 0.0, 1.0, 100.0, 0.0)
+    assert power[0] > 0 and power[1] == power[2] == 0.0
+    reading = WindReading(datetime(2024, 1, 1), 30.0, 0.0)
+    assert simulator.calculate_instantaneous_power(reading, 0.0, 1.0, 100.0, 0.0).value == 0.0
+    counters = profile.report().counters
+    assert counters[COUNTER_NO_ROOT] == 3
+    assert counters[COUNTER_RPM_CUTOFF] == 0
+    assert counters[COUNTER_SOLVER_FAILURES] == 0
+
+def test_profiling_simulator_counts_rows_when_pairs_are_collapsed(monkeypatch):
+    from wind_compass.domain import services
+    from wind_compass.domain.wind_pairs import collapse_wind_pairs
+    model = make_model()
+    rng = numpy.random.default_rng(8)
+    # 量子化された風速・風向（組の重複が多い）。40m/s は回転数の上限超え、NaN は解なし
+    speeds = rng.choice([1.0, 5.0, 8.0, 40.0, numpy.nan], 3000)
+    directions = rng.choice([0.0, 90.0, 180.0, 270.0], 3000)
+    hours = numpy.full(3000, 1.0 / 6)
+    assert collapse_wind_pairs(speeds, directions) is not None
+
+    def run():
+        profile = RunProfile()
+        simulator = ProfilingPowerGenerationSimulator(model, profile)
+        power = simulator.calculate_power_series(speeds, directions, 30.0, 1.0, 100.0, 300.0)
+        energy = simulator.calculate_energy_by_angle(speeds, directions, hours, [0.0, 30.0, 200.0], 1.0, 100.0, 300.0)
+        return power, energy, profile.report().counters
+
+    power, energy, counters = run()
+    plain = PowerGenerationSimulator(model)
+    assert power.tobytes() == plain.calculate_power_series(speeds, directions, 30.0, 1.0, 100.0, 300.0).tobytes()
+    assert energy.tobytes() == plain.calculate_energy_by_angle(
+        speeds, directions, hours, [0.0, 30.0, 200.0], 1.0, 100.0, 300.0).tobytes()
+    # 組の重複を除かずにデータ点ごとに計算した場合と同じ件数になる
+    monkeypatch.setattr(services, "collapse_wind_pairs", lambda *args, **kwargs: None)
+    _, _, row_counters = run()
+    assert counters[COUNTER_ROWS_SIMULATED] == 4 * 3000
+    for name in (COUNTER_ROWS_SIMULATED, COUNTER_TAILWIND_ZEROED, COUNTER_CUT_IN_REJECTED,
+                 COUNTER_RPM_CUTOFF, COUNTER_SOLVER_FAILURES):
+        assert counters[name] == row_counters[name] > 0
+
+
+def test_profiling_simulator_counts_scalar_path():
+    model = make_model()
+    profile = RunProfile()
+    simulator = ProfilingPowerGenerationSimulator(model, profile)
+    plain = PowerGenerationSimulator(model)
+    for speed, direction in [(5.0, 0.0), (5.0, 180.0), (1.0, 0.0), (40.0, 0.0)]:
+        reading = WindReading(datetime(2024, 1, 1), speed, direction)
+        assert simulator.calculate_instantaneous_power(reading, 0.0, 1.0, 100.0, 300.0) == \
+            plain.calculate_instantaneous_power(reading, 0.0, 1.0, 100.0, 300.0)
+    counters = profile.report().counters
+    assert counters[COUNTER_ROWS_SIMULATED] == 4
+    assert counters[COUNTER_TAILWIND_ZEROED] == 1
+    assert counters[COUNTER_CUT_IN_REJECTED] == 1
+    assert counters[COUNTER_RPM_CUTOFF] == 1
+    assert counters[COUNTER_NO_ROOT] == 0
+    assert counters[COUNTER_SOLVER_FAILURES] == 0
+
+
+def test_fallback_exceptions_in_use_case_are_counted():
+    readings = [WindReading(datetime(2024, 1, 1) + timedelta(minutes=10 * i), 5.0, 0.0) for i in range(3)]
+    wind_reader = MagicMock()
+    wind_reader.read.return_value = readings
+    config_reader = MagicMock()
+    config_reader.read.return_value = make_model()
+    simulator = MagicMock()
+    simulator.calculate_power_series.side_effect = RuntimeError("batch failed")
+    simulator.calculate_instantaneous_power.side_effect = [
+        RuntimeError("reading failed"), Power(600.0), RuntimeError("reading failed")]
+    use_case = RunSingleSimulationScenarioUseCase(wind_reader, config_reader, lambda model: simulator)
+    profile = RunProfile()
+    with profile.activate():
+        output = use_case.execute(SingleScenarioInputDTO(
+            "w.csv", "c.json", angle=0.0, efficiency=1.0, voltage=100.0, cut_in_rpm=0.0))
+    assert output.annual_power_kwh == pytest.approx(0.1)
+    # 一括計算の失敗1件 + 1点ずつの計算の失敗2件
+    assert profile.report().counters[COUNTER_SWALLOWED_EXCEPTIONS] == 3
+
+
+def test_profiling_reader_delegates_parse_options():
+    reader = MagicMock()
+    reader.parse_options.return_value = {"timestamp_format": "%Y-%m-%d"}
+    assert ProfilingWindDataReader(reader, RunProfile()).parse_options("w.csv") == {"timestamp_format": "%Y-%m-%d"}
+    reader.parse_options.assert_called_once_with("w.csv")
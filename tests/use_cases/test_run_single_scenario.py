@@ -188,3 +188,166 @@ def test_run_single_scenario_unexpected_exception():
     input_dto = make_input_dto()
     with pytest.raises(ApplicationError, match="Unexpected error: disk error"):
         use_case.execute(input_dto)
+
+
+def test_run_single_scenario_uses_power_series():
+    import numpy
+    wind_readings = [
+        WindReading(datetime(2023, 1, 1, 0, 0, 0), 10.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 0, 10, 0), 12.0, 0.0)
+    ]
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read.return_value = wind_readings
+    mock_config_reader = MagicMock()
+    mock_config_reader.read.return_value = MagicMock(spec=PowerPlantModel)
+    mock_simulator = MagicMock()
+    mock_simulator.calculate_power_series.return_value = numpy.array([500.0, 1500.0])
+    simulator_factory = MagicMock(return_value=mock_simulator)
+    use_case = RunSingleSimulationScenarioUseCase(
+        mock_wind_data_reader, mock_config_reader, simulator_factory
+    )
+    output = use_case.execute(make_input_dto())
+    mock_simulator.calculate_instantaneous_power.assert_not_called()
+    speeds, directions = mock_simulator.calculate_power_series.call_args.args
+    assert speeds.tolist() == [10.0, 12.0]
+    assert directions.tolist() == [0.0, 0.0]
+    expected_kwh = (2000.0 * DEFAULT_TIME_INTERVAL_HOURS) / 1000.0
+    assert output.annual_power_kwh == pytest.approx(expected_kwh)
+
+
+def test_run_single_scenario_streaming_matches_whole_file():
+    from dataclasses import replace
+    from wind_compass.domain.services import PowerGenerationSimulator
+    from wind_compass.domain.models import PolynomialCurve
+    from wind_compass.domain.wind_dataset import WindDataset
+    from wind_compass.use_cases.ports import WindDataReader
+    readings = [
+        WindReading(datetime(2023, 1, 1, 0, 10 * i, 0), 5.0 + i, 10.0 * i) for i in range(5)]
+
+    class ListWindDataReader(WindDataReader):
+        def read(self, file_path):
+            return WindDataset.from_readings(readings)
+
+    config_reader = MagicMock()
+    config_reader.read.return_value = PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+    use_case = RunSingleSimulationScenarioUseCase(
+        ListWindDataReader(), config_reader, PowerGenerationSimulator)
+    whole = use_case.execute(make_input_dto())
+    streamed = use_case.execute(replace(make_input_dto(), chunk_size=2))
+    assert streamed.annual_power_kwh == pytest.approx(whole.annual_power_kwh, rel=1e-12)
+
+
+def test_run_single_scenario_streaming_empty_file():
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read_chunks.return_value = iter([])
+    use_case = RunSingleSimulationScenarioUseCase(
+        mock_wind_data_reader, MagicMock(), MagicMock())
+    from dataclasses import replace
+    with pytest.raises(ApplicationError, match="No wind data found"):
+        use_case.execute(replace(make_input_dto(), chunk_size=10))
+
+
+def test_run_single_scenario_integration_rule_and_gap_cap():
+    from dataclasses import replace
+    import numpy
+    wind_readings = [
+        WindReading(datetime(2023, 1, 1, 0, 0, 0), 10.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 0, 30, 0), 12.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 3, 30, 0), 14.0, 0.0)
+    ]
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read.return_value = wind_readings
+    mock_model_reader = MagicMock()
+    mock_simulator = MagicMock()
+    mock_simulator.calculate_power_series.return_value = numpy.array([1000.0, 2000.0, 4000.0])
+    use_case = RunSingleSimulationScenarioUseCase(
+        mock_wind_data_reader, mock_model_reader, MagicMock(return_value=mock_simulator))
+    # 既定は固定Δt
+    fixed = use_case.execute(make_input_dto())
+    assert fixed.annual_power_kwh == pytest.approx(7000.0 * DEFAULT_TIME_INTERVAL_HOURS / 1000.0)
+    trapezoid = use_case.execute(replace(make_input_dto(), integration_rule="trapezoid"))
+    assert trapezoid.annual_power_kwh == pytest.approx((1500.0 * 0.5 + 3000.0 * 3.0) / 1000.0)
+    capped = use_case.execute(replace(make_input_dto(), integration_rule="trapezoid", max_gap_hours=1.0))
+    assert capped.annual_power_kwh == pytest.approx((1500.0 * 0.5 + 3000.0 * 1.0) / 1000.0)
+    with pytest.raises(ApplicationError):
+        use_case.execute(replace(make_input_dto(), integration_rule="simpson"))
+
+
+@pytest.mark.parametrize("rule", ["fixed", "left", "trapezoid"])
+def test_run_single_scenario_threads_match_single_thread(rule):
+    from dataclasses import replace
+    from datetime import timedelta
+    from wind_compass.domain.services import PowerGenerationSimulator
+    from wind_compass.domain.models import PolynomialCurve
+    from wind_compass.domain.wind_dataset import WindDataset
+    # 不等間隔（一部逆行・欠測）の時刻で、タスクの継ぎ目の区間も一括計算と同じ重みになることを確認する
+    minutes = [0]
+    for i in range(1, 23):
+        minutes.append(minutes[-1] + (-5 if i % 7 == 0 else 10 + 30 * (i % 5 == 0)))
+    dataset = WindDataset.from_readings([
+        WindReading(datetime(2023, 1, 1) + timedelta(minutes=m), 4.0 + (i % 9), 15.0 * i)
+        for i, m in enumerate(minutes)])
+    wind_data_reader = MagicMock()
+    wind_data_reader.read.return_value = dataset
+    config_reader = MagicMock()
+    config_reader.read.return_value = PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+    input_dto = replace(make_input_dto(), integration_rule=rule, max_gap_hours=0.5)
+    whole = RunSingleSimulationScenarioUseCase(
+        wind_data_reader, config_reader, PowerGenerationSimulator).execute(input_dto)
+    threaded_use_case = RunSingleSimulationScenarioUseCase(
+        wind_data_reader, config_reader, PowerGenerationSimulator, rows_per_task=4)
+    results = [threaded_use_case.execute(replace(input_dto, threads=threads)).annual_power_kwh
+               for threads in (2, 3, 8)]
+    assert whole.annual_power_kwh > 0
+    assert results[0] == pytest.approx(whole.annual_power_kwh, rel=1e-12)
+    # タスクの分割は固定のため、スレッド数によらず結果はビット単位で一致する
+    assert results[1] == results[0] and results[2] == results[0]
+
+
+def test_run_single_scenario_defaults_omitted_parameters():
+    import numpy
+    from wind_compass.domain.constants import DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM
+    wind_readings = [
+        WindReading(datetime(2023, 1, 1, 0, 0, 0), 10.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 0, 10, 0), 12.0, 0.0)
+    ]
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read.return_value = wind_readings
+    mock_config_reader = MagicMock()
+    mock_config_reader.read.return_value = MagicMock(spec=PowerPlantModel)
+    mock_simulator = MagicMock()
+    mock_simulator.calculate_power_series.return_value = numpy.array([500.0, 1500.0])
+    use_case = RunSingleSimulationScenarioUseCase(
+        mock_wind_data_reader, mock_config_reader, MagicMock(return_value=mock_simulator))
+    use_case.execute(SingleScenarioInputDTO(
+        wind_data_path="dummy_wind.csv", config_file_path="dummy_config.json", angle=0.0))
+    kwargs = mock_simulator.calculate_power_series.call_args.kwargs
+    assert (kwargs["efficiency"], kwargs["voltage"], kwargs["cut_in_rpm"]) == (
+        DEFAULT_EFFICIENCY, DEFAULT_VOLTAGE, DEFAULT_CUT_IN_RPM)
+
+
+def test_run_single_scenario_raises_when_every_reading_fails():
+    wind_readings = [
+        WindReading(datetime(2023, 1, 1, 0, 0, 0), 10.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 0, 10, 0), 12.0, 0.0)
+    ]
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read.return_value = wind_readings
+    mock_config_reader = MagicMock()
+    mock_config_reader.read.return_value = MagicMock(spec=PowerPlantModel)
+    mock_simulator = MagicMock()
+    mock_simulator.calculate_power_series.side_effect = TypeError("bad parameter")
+    mock_simulator.calculate_instantaneous_power.side_effect = TypeError("bad parameter")
+    use_case = RunSingleSimulationScenarioUseCase(
+        mock_wind_data_reader, mock_config_reader, MagicMock(return_value=mock_simulator))
+    # 全点の失敗を 0kWh として返さない（結果キャッシュに誤った値が残らないようにする）
+    with pytest.raises(ApplicationError, match="bad parameter"):
+        use_case.execute(make_input_dto())
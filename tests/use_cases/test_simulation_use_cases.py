@@ -2,7 +2,8 @@ from wind_compass.use_cases.simulation_use_cases import RunMultipleSimulationSce
 from wind_compass.use_cases.dtos import MultipleScenariosInputDTO, ScenarioResult
 import pytest
 from unittest.mock import Mock, MagicMock
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
 from wind_compass.use_cases.simulation_use_cases import RunSingleSimulationScenarioUseCase
 from wind_compass.use_cases.dtos import SingleScenarioInputDTO
 from wind_compass.domain.models import WindReading, PowerPlantModel, Power
@@ -159,4 +160,175 @@ def test_annual_power_kwh_zero_interval():
     input_dto = make_input_dto()
     output = use_case.execute(input_dto)
     # Δt=0区間は発電量0
-    assert output.annual_power_kwh == 0.0
\ No newline at end of file
+    assert output.annual_power_kwh == 0.0
+
+def test_annual_power_kwh_uses_power_series_for_interval_starts():
+    import numpy
+    wind_readings = [
+        WindReading(datetime(2023, 1, 1, 0, 0, 0), 10.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 0, 10, 0), 12.0, 0.0),
+        WindReading(datetime(2023, 1, 1, 0, 25, 0), 14.0, 0.0)
+    ]
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read.return_value = wind_readings
+    mock_model_loader = MagicMock()
+    mock_simulator = MagicMock()
+    mock_simulator.calculate_power_series.return_value = numpy.array([1000.0, 2000.0])
+    simulator_factory = MagicMock(return_value=mock_simulator)
+    use_case = RunSingleSimulationScenarioUseCase(
+        simulator_factory, mock_model_loader, mock_wind_data_reader)
+    output = use_case.execute(make_input_dto())
+    mock_simulator.calculate_instantaneous_power.assert_not_called()
+    speeds = mock_simulator.calculate_power_series.call_args.args[0]
+    assert speeds.tolist() == [10.0, 12.0]
+    expected_kwh = (1000.0 * (1/6) + 2000.0 * 0.25) / 1000.0
+    assert output.annual_power_kwh == pytest.approx(expected_kwh)
+
+
+def test_table_engine_reports_interpolation_error():
+    from wind_compass.domain.services import PowerGenerationSimulator
+    from wind_compass.domain.models import PolynomialCurve
+    wind_readings = [
+        WindReading(datetime(2023, 1, 1, 0, 10 * i, 0), 4.0 + i, 15.0 * i)
+        for i in range(6)
+    ]
+    model = PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+    mock_wind_data_reader = MagicMock()
+    mock_wind_data_reader.read.return_value = wind_readings
+    use_case = RunSingleSimulationScenarioUseCase(
+        PowerGenerationSimulator, MagicMock(return_value=model), mock_wind_data_reader)
+    exact = use_case.execute(make_input_dto())
+    table = use_case.execute(SingleScenarioInputDTO(
+        wind_data_path="dummy_wind.csv", config_file_path="dummy_config.json",
+        angle=0.0, efficiency=0.9, voltage=100.0, cut_in_rpm=10.0, engine="table"))
+    assert exact.max_interpolation_error_w is None
+    assert table.max_interpolation_error_w is not None
+    assert table.annual_power_kwh == pytest.approx(
+        exact.annual_power_kwh, abs=table.max_interpolation_error_w)
+    assert exact.annual_power_kwh > 0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 100])
+def test_streaming_matches_whole_file_integration(chunk_size):
+    from wind_compass.domain.services import PowerGenerationSimulator
+    from wind_compass.domain.models import PolynomialCurve
+    from wind_compass.domain.wind_dataset import WindDataset
+    from wind_compass.use_cases.ports import WindDataReader
+    minutes = [0, 10, 25, 25, 40, 30, 60, 70, 90]
+    readings = [
+        WindReading(datetime(2023, 1, 1) + timedelta(minutes=m), 6.0 + i, 20.0 * i)
+        for i, m in enumerate(minutes)
+    ]
+
+    class ListWindDataReader(WindDataReader):
+        def read(self, file_path):
+            return WindDataset.from_readings(readings)
+
+    model = PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+    use_case = RunSingleSimulationScenarioUseCase(
+        PowerGenerationSimulator, MagicMock(return_value=model), ListWindDataReader())
+    whole = use_case.execute(make_input_dto())
+    streamed = use_case.execute(replace(make_input_dto(), chunk_size=chunk_size))
+    assert streamed.error_message is None
+    assert whole.annual_power_kwh > 0
+    assert streamed.annual_power_kwh == pytest.approx(whole.annual_power_kwh, rel=1e-12)
+
+
+def test_integration_rule_and_gap_cap_with_streaming():
+    from wind_compass.domain.services import PowerGenerationSimulator
+    from wind_compass.domain.models import PolynomialCurve
+    from wind_compass.domain.wind_dataset import WindDataset
+    from wind_compass.use_cases.ports import WindDataReader
+    # 3時間の欠測を含む
+    readings = [
+        WindReading(datetime(2023, 1, 1, 0, 0) + timedelta(minutes=10 * i + (180 if i >= 3 else 0)),
+                    5.0 + i, 10.0 * i) for i in range(6)]
+
+    class ListWindDataReader(WindDataReader):
+        def read(self, file_path):
+            return WindDataset.from_readings(readings)
+
+    model = PowerPlantModel(
+        PolynomialCurve([0.5, 2.0, 0.0, 0.0]),
+        PolynomialCurve([0.0, 0.5, 1.0, 0.1]),
+        PolynomialCurve([0.0, 0.0, 2.0, 0.3])
+    )
+    use_case = RunSingleSimulationScenarioUseCase(
+        PowerGenerationSimulator, lambda path: model, ListWindDataReader())
+    simulator = PowerGenerationSimulator(model)
+    power = [simulator.calculate_instantaneous_power(r, 0.0, 0.9, 100.0, 10.0).value for r in readings]
+    dt = [1/6, 1/6, 1/6 + 3.0, 1/6, 1/6]
+    capped_dt = [min(h, 0.5) for h in dt]
+    trapezoid_kwh = sum((power[i] + power[i + 1]) / 2 * capped_dt[i] for i in range(5)) / 1000.0
+    left_kwh = sum(power[i] * capped_dt[i] for i in range(5)) / 1000.0
+    for rule, expected in [("trapezoid", trapezoid_kwh), ("left", left_kwh)]:
+        dto = replace(make_input_dto(), integration_rule=rule, max_gap_hours=0.5)
+        assert use_case.execute(dto).annual_power_kwh == pytest.approx(expected, rel=1e-9)
+        streamed = use_case.execute(replace(dto, chunk_size=2))
+        assert streamed.annual_power_kwh == pytest.approx(expected, rel=1e-9)
+
+
+def test_result_cache_computes_only_missing_angles():
+    from wind_compass.use_cases.ports import ScenarioResultCache
+
+    class MemoryResultCache(ScenarioResultCache):
+        def __init__(self):
+            self.results = {}
+
+        def get(self, key):
+            return self.results.get(key)
+
+        def put(self, key, result):
+            self.results[key] = result
+
+        def file_digest(self, file_path):
+            return f"digest of {file_path}"
+
+    executed = []
+
+    def fake_execute(single_input):
+        executed.append(single_input.angle)
+        if single_input.angle == 45:
+            return type('Result', (), {'annual_power_kwh': None, 'error_message': 'failed'})()
+        return type('Result', (), {'annual_power_kwh': single_input.angle * 10, 'error_message': None})()
+    mock_single = Mock()
+    mock_single.execute.side_effect = fake_execute
+    mock_single.input_dto_class = DummyInputDTO
+    cache = MemoryResultCache()
+    usecase = RunMultipleSimulationScenariosUseCase(mock_single, result_cache=cache)
+    input_dto = MultipleScenariosInputDTO(
+        wind_data_path='dummy.csv', config_file_path='dummy.json', angles=[0, 45, 90])
+    first = usecase.execute(input_dto)
+    assert [r.result_cache_hit for r in first] == [False, False, False]
+    # エラーになった角度は保存しない
+    assert len(cache.results) == 2
+    executed.clear()
+    second = usecase.execute(replace(input_dto, angles=[90, 45, 180]))
+    assert executed == [45, 180]
+    assert [(r.angle, r.annual_power_kwh, r.result_cache_hit) for r in second] == [
+        (90, 900, True), (45, None, False), (180, 1800, False)]
+    executed.clear()
+    usecase.execute(replace(input_dto, efficiency=0.5, angles=[90]))
+    assert executed == [90]
+    cache.enabled = False
+    executed.clear()
+    assert usecase.execute(replace(input_dto, angles=[90]))[0].result_cache_hit is None
+    assert executed == [90]
+
+
+def test_result_cache_key_depends_on_wind_parse_options():
+    from wind_compass.use_cases.result_cache import scenario_result_key
+    input_dto = MultipleScenariosInputDTO(
+        wind_data_path='dummy.csv', config_file_path='dummy.json', angles=[0])
+    default_key = scenario_result_key(input_dto, 0, "wind", "config")
+    assert scenario_result_key(input_dto, 0, "wind", "config", {}) == default_key
+    assert scenario_result_key(
+        input_dto, 0, "wind", "config", {"timestamp_format": "%Y-%m-%d %H:%M:%S"}) != default_key